@@ -0,0 +1,7 @@
+"""
+objectfactory benchmarks
+
+repeatable performance scenarios for object creation and serialization, run with
+
+    python -m benchmarks [--save FILE] [--compare FILE]
+"""
@@ -0,0 +1,60 @@
+"""
+command line interface for objectfactory benchmarks
+"""
+
+# lib
+import argparse
+import sys
+
+# src
+from .runner import run, compare, save, load, report
+from .scenarios import SCENARIOS
+
+
+def main(argv=None) -> int:
+    """
+    run benchmarks, print results, and optionally save or compare against a baseline
+
+    :param argv: (optional) command line arguments
+    :return: exit status, 1 if any scenario regressed against the baseline
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    parser.add_argument(
+        'scenarios',
+        nargs='*',
+        help='scenario names or prefixes to run, one of: {}'.format(', '.join(SCENARIOS))
+    )
+    parser.add_argument('--save', metavar='FILE', help='save results as baseline file')
+    parser.add_argument('--compare', metavar='FILE', help='compare results against baseline')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.1,
+        help='allowed relative slowdown against baseline (default: 0.1)'
+    )
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=0.2,
+        help='minimum duration of each round in seconds (default: 0.2)'
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='number of rounds (default: 5)')
+    args = parser.parse_args(argv)
+
+    results = run(args.scenarios or None, min_time=args.min_time, repeat=args.repeat)
+    changes = None
+    if args.compare:
+        changes = compare(results, load(args.compare), tolerance=args.tolerance)
+    print(report(results, changes))
+    if args.save:
+        save(args.save, results)
+
+    regressed = [name for name, _, slower in changes or () if slower]
+    if regressed:
+        print('regressed: {}'.format(', '.join(regressed)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+runner module
+
+implements measurement of benchmark scenarios and comparison against a baseline
+"""
+
+# lib
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from typing import Iterable
+
+# src
+from .scenarios import SCENARIOS
+
+
+def measure(operation, min_time: float = 0.2, repeat: int = 5) -> dict:
+    """
+    measure throughput and allocations of an operation
+
+    the number of calls per round is calibrated to take at least the minimum time,
+    and the best of several rounds is reported. allocations are traced for a
+    separate single call, counting blocks still held after the call, such as by its
+    result, and the peak memory allocated during the call
+
+    :param operation: callable to measure
+    :param min_time: (optional) minimum duration of each round in seconds
+    :param repeat: (optional) number of rounds
+    :return: dictionary with operations per second, number of allocated blocks,
+        and peak allocated bytes per operation
+    """
+    operation()  # warm up caches and generated code
+
+    number = 1
+    while True:
+        elapsed = _time(operation, number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    best = min([elapsed] + [_time(operation, number) for _ in range(repeat - 1)])
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        current = tracemalloc.get_traced_memory()[0]
+        # note: reset_peak requires Python 3.9, older versions include the snapshot in the peak
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        result = operation()
+        peak = tracemalloc.get_traced_memory()[1] - current
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    stats = after.compare_to(before, 'filename')
+    return {
+        'ops': number / best,
+        'blocks': sum(max(s.count_diff, 0) for s in stats),
+        'peak_bytes': peak,
+    }
+
+
+def run(names: Iterable[str] = None, min_time: float = 0.2, repeat: int = 5) -> dict:
+    """
+    run benchmark scenarios
+
+    :param names: (optional) scenario names or prefixes to run, defaults to all
+    :param min_time: (optional) minimum duration of each round in seconds
+    :param repeat: (optional) number of rounds
+    :raises ValueError: if no scenario matches
+    :return: dictionary of scenario name to measurement
+    """
+    selected = [
+        name for name in SCENARIOS
+        if names is None or any(name == n or name.startswith(n + '.') for n in names)
+    ]
+    if not selected:
+        raise ValueError('No benchmark scenario matches {}'.format(names))
+    return {
+        name: measure(SCENARIOS[name](), min_time=min_time, repeat=repeat)
+        for name in selected
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.1) -> list:
+    """
+    compare measurements against a baseline
+
+    :param results: dictionary of scenario name to measurement
+    :param baseline: dictionary of scenario name to baseline measurement
+    :param tolerance: (optional) allowed relative slowdown before a scenario is
+        reported as a regression
+    :return: list of (scenario name, relative change in throughput, regressed) tuples
+        for scenarios in both results and baseline
+    """
+    changes = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        change = result['ops'] / base['ops'] - 1
+        changes.append((name, change, change < -tolerance))
+    return changes
+
+
+def save(path, results: dict):
+    """
+    save measurements as baseline file
+
+    :param path: file path
+    :param results: dictionary of scenario name to measurement
+    """
+    with open(path, 'w') as fp:
+        json.dump({
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }, fp, indent=2, sort_keys=True)
+
+
+def load(path) -> dict:
+    """
+    load measurements from baseline file
+
+    :param path: file path
+    :return: dictionary of scenario name to measurement
+    """
+    with open(path) as fp:
+        return json.load(fp)['results']
+
+
+def report(results: dict, changes: list = None) -> str:
+    """
+    format measurements as text table
+
+    :param results: dictionary of scenario name to measurement
+    :param changes: (optional) comparison against baseline
+    :return: table
+    """
+    changed = {name: (change, regressed) for name, change, regressed in changes or ()}
+    lines = ['{:<36}{:>14}{:>10}{:>12}{:>12}'.format(
+        'scenario', 'ops/sec', 'blocks', 'peak bytes', 'baseline'
+    )]
+    for name, result in results.items():
+        change = ''
+        if name in changed:
+            change = '{:+.1%}{}'.format(changed[name][0], ' !' if changed[name][1] else '')
+        lines.append('{:<36}{:>14,.1f}{:>10,}{:>12,}{:>12}'.format(
+            name,
+            result['ops'],
+            result['blocks'],
+            result['peak_bytes'],
+            change
+        ))
+    return '\n'.join(lines)
+
+
+def _time(operation, number: int) -> float:
+    """
+    time repeated calls of an operation with garbage collection disabled
+
+    :param operation: callable to measure
+    :param number: number of calls
+    :return: elapsed time in seconds
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
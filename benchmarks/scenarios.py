@@ -0,0 +1,311 @@
+"""
+scenarios module
+
+implements benchmark scenarios for common class shapes and workloads
+"""
+
+# lib
+import os
+from concurrent.futures import ThreadPoolExecutor
+import marshmallow
+
+# src
+import objectfactory
+from objectfactory import Serializable, Factory, Field, Nested, List
+from objectfactory import Integer, Float, String, Boolean
+
+# depth of nested chain
+DEPTH = 20
+
+# number of items in wide lists
+WIDTH = 1000
+
+# number of classes in polymorphic registry
+CLASSES = 300
+
+# number of objects in large batches
+BATCH = 20000
+
+# number of threads serializing shared objects
+THREADS = 8
+
+
+@objectfactory.register
+class BenchFlat(Serializable):
+    """
+    flat class with primitive fields
+    """
+    int_prop = Integer()
+    float_prop = Float()
+    str_prop = String()
+    bool_prop = Boolean()
+    raw_prop = Field()
+
+
+@objectfactory.register
+class BenchNode(Serializable):
+    """
+    node of nested chain
+    """
+    value = Integer()
+    child = Nested()
+
+
+@objectfactory.register
+class BenchWide(Serializable):
+    """
+    class with wide list fields
+    """
+    items = List(field_type=BenchFlat)
+    values = List(field_type=Integer)
+
+
+class BenchSchema(marshmallow.Schema):
+    """
+    custom marshmallow schema
+    """
+    name = marshmallow.fields.String(required=True)
+    email = marshmallow.fields.Email()
+    age = marshmallow.fields.Integer(validate=marshmallow.validate.Range(min=0))
+
+
+@objectfactory.register
+class BenchCustom(Serializable, schema=BenchSchema):
+    """
+    class with custom schema
+    """
+    name = Field()
+    email = Field()
+    age = Field()
+
+
+def flat_body(i: int = 0) -> dict:
+    """
+    serialized flat object
+
+    :param i: value of integer field
+    :return: body
+    """
+    return {
+        '_type': 'BenchFlat',
+        'int_prop': i,
+        'float_prop': i / 2,
+        'str_prop': 'value {}'.format(i),
+        'bool_prop': i % 2 == 0,
+        'raw_prop': [i, 'raw'],
+    }
+
+
+def nested_body(depth: int = DEPTH) -> dict:
+    """
+    serialized chain of nested objects
+
+    :param depth: number of nodes
+    :return: body
+    """
+    body = None
+    for i in range(depth):
+        body = {'_type': 'BenchNode', 'value': i, 'child': body}
+    return body
+
+
+def wide_body(width: int = WIDTH) -> dict:
+    """
+    serialized object with wide lists
+
+    :param width: number of items in each list
+    :return: body
+    """
+    return {
+        '_type': 'BenchWide',
+        'items': [flat_body(i) for i in range(width)],
+        'values': list(range(width)),
+    }
+
+
+def custom_body() -> dict:
+    """
+    serialized object with custom schema
+
+    :return: body
+    """
+    return {'_type': 'BenchCustom', 'name': 'john', 'email': 'john@example.com', 'age': 42}
+
+
+def polymorphic_factory(count: int = CLASSES) -> Factory:
+    """
+    create factory with many registered classes
+
+    :param count: number of classes
+    :return: factory
+    """
+    factory = Factory('benchmark')
+    for i in range(count):
+        factory.register(type(
+            'BenchPoly{}'.format(i),
+            (Serializable,),
+            {'__module__': __name__, 'int_prop': Integer(), 'str_prop': String()}
+        ))
+    return factory
+
+
+def create_flat():
+    """
+    create flat object
+
+    :return: operation to measure
+    """
+    body = flat_body()
+    return lambda: objectfactory.create(body)
+
+
+def serialize_flat():
+    """
+    serialize flat object
+
+    :return: operation to measure
+    """
+    obj = objectfactory.create(flat_body())
+    return obj.serialize
+
+
+def create_many_flat():
+    """
+    create many flat objects at once
+
+    :return: operation to measure
+    """
+    bodies = [flat_body(i) for i in range(WIDTH)]
+    return lambda: objectfactory.create_many(bodies)
+
+
+def create_nested():
+    """
+    create chain of nested objects
+
+    :return: operation to measure
+    """
+    body = nested_body()
+    return lambda: objectfactory.create(body)
+
+
+def serialize_nested():
+    """
+    serialize chain of nested objects
+
+    :return: operation to measure
+    """
+    obj = objectfactory.create(nested_body())
+    return obj.serialize
+
+
+def serialize_nested_threaded():
+    """
+    serialize shared chain of nested objects from a thread pool, alternating
+    serialization options between calls
+
+    :return: operation to measure
+    """
+    obj = objectfactory.create(nested_body())
+    executor = ThreadPoolExecutor(max_workers=THREADS)
+    options = [(i % 2 == 0, i % 3 == 0) for i in range(THREADS * 16)]
+
+    def serialize(option):
+        return obj.serialize(*option)
+
+    return lambda: list(executor.map(serialize, options))
+
+
+def create_list():
+    """
+    create object with wide lists
+
+    :return: operation to measure
+    """
+    body = wide_body()
+    return lambda: objectfactory.create(body)
+
+
+def serialize_list():
+    """
+    serialize object with wide lists
+
+    :return: operation to measure
+    """
+    obj = objectfactory.create(wide_body())
+    return obj.serialize
+
+
+def create_polymorphic():
+    """
+    create one object of each class in a large registry
+
+    :return: operation to measure
+    """
+    factory = polymorphic_factory()
+    bodies = [
+        {'_type': '{}.BenchPoly{}'.format(__name__, i), 'int_prop': i, 'str_prop': 'a'}
+        for i in range(CLASSES)
+    ]
+    return lambda: factory.create_many(bodies)
+
+
+def create_custom():
+    """
+    create object with custom schema
+
+    :return: operation to measure
+    """
+    body = custom_body()
+    return lambda: objectfactory.create(body)
+
+
+def serialize_custom():
+    """
+    serialize object with custom schema
+
+    :return: operation to measure
+    """
+    obj = objectfactory.create(custom_body())
+    return obj.serialize
+
+
+def create_many_custom():
+    """
+    create large batch of objects with custom schema in this process
+
+    :return: operation to measure
+    """
+    bodies = [custom_body() for _ in range(BATCH)]
+    return lambda: objectfactory.create_many(bodies)
+
+
+def create_many_custom_parallel():
+    """
+    create large batch of objects with custom schema across worker processes
+
+    compare with custom_schema.create_many, speedup requires multiple CPUs
+
+    :return: operation to measure
+    """
+    bodies = [custom_body() for _ in range(BATCH)]
+    processes = max(2, os.cpu_count() or 1)
+    return lambda: objectfactory.create_many(bodies, processes=processes)
+
+
+# scenario name to setup function returning the operation to measure
+SCENARIOS = {
+    'flat.create': create_flat,
+    'flat.serialize': serialize_flat,
+    'flat.create_many': create_many_flat,
+    'nested.create': create_nested,
+    'nested.serialize': serialize_nested,
+    'nested.serialize_threaded': serialize_nested_threaded,
+    'list.create': create_list,
+    'list.serialize': serialize_list,
+    'polymorphic.create_many': create_polymorphic,
+    'custom_schema.create': create_custom,
+    'custom_schema.serialize': serialize_custom,
+    'custom_schema.create_many': create_many_custom,
+    'custom_schema.create_many_parallel': create_many_custom_parallel,
+}
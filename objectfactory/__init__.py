@@ -4,8 +4,13 @@ for object creation, serialization, and polymorphism
 """
 
 # do imports
-from .serializable import Serializable
-from .factory import Factory, register, create
+from .serializable import Serializable, serialize_many, dump_stream, adump_stream
+from .factory import Factory, register, create, create_from_json, create_many, iter_create
+from .factory import serialize_binary, create_binary, acreate
 from .field import Field, Nested, List, Integer, String, Boolean, Float
+from .nested import LazyList
+from .columns import to_columns
+from .collection import Collection
+from .records import RecordStore, write_records
 
 __version__ = '0.1.0'
@@ -0,0 +1,54 @@
+"""
+aio module
+
+implements helpers for asyncio streaming of serializable objects
+"""
+
+# lib
+import asyncio
+
+
+async def iter_chunks(source, chunk_size: int):
+    """
+    collect items of a synchronous or asynchronous iterable into bounded chunks
+
+    :param source: iterable or async iterable
+    :param chunk_size: maximum number of items per chunk
+    :raises ValueError: if the chunk size is not positive
+    :return: async generator of lists of items
+    """
+    if chunk_size < 1:
+        raise ValueError('Invalid chunk size: {}'.format(chunk_size))
+    chunk = []
+    if hasattr(source, '__aiter__'):
+        async for item in source:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in source:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def run_chunk(executor, func, *args):
+    """
+    run CPU bound work on a chunk, offloading it to an executor if specified
+
+    control is returned to the event loop after the work is done inline
+
+    :param executor: executor, or None to run in the event loop thread
+    :param func: function to call
+    :param args: arguments to function
+    :return: result of function
+    """
+    if executor is None:
+        result = func(*args)
+        await asyncio.sleep(0)
+        return result
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
@@ -5,6 +5,12 @@ implements abstract base classes for objectfactory
 """
 
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from functools import partial
+from typing import Iterable
+
+# immutable types that can be shared as default values without copying
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, frozenset)
 
 
 class FieldABC(ABC):
@@ -12,19 +18,34 @@ class FieldABC(ABC):
     abstract base class for serializable field
     """
 
-    def __init__(self, default=None, key=None, required=False, allow_none=True):
+    def __init__(
+            self,
+            default=None,
+            key=None,
+            required=False,
+            allow_none=True,
+            default_factory=None
+    ):
         """
         :param default: default value for field if unset
         :param key: dictionary key to use for field serialization
         :param required: whether this field is required to deserialize an object
         :param allow_none: whether null should be considered a valid value
+        :param default_factory: (optional) callable to create default value for field if unset
         """
+        if default is not None and default_factory is not None:
+            raise ValueError('Cannot specify both default and default_factory')
         self._key = key
         self._attr_key = None  # note: this will be set from parent metaclass __new__
         self._default = default
         self._required = required
         self._allow_none = allow_none
 
+        # resolve how to create default value, immutable defaults are shared as is
+        if default_factory is None and not is_immutable(default):
+            default_factory = partial(deepcopy, default)
+        self._default_factory = default_factory
+
     @abstractmethod
     def __get__(self, instance, owner):
         pass
@@ -47,6 +68,7 @@ class SerializableABC(ABC):
     """
     abstract base class for serializable object
     """
+    __slots__ = ()
 
     @abstractmethod
     def serialize(self, include_type: bool = True, use_full_type: bool = True) -> dict:
@@ -60,10 +82,39 @@ class SerializableABC(ABC):
         pass
 
     @abstractmethod
-    def deserialize(self, body: dict):
+    def deserialize(
+            self,
+            body: dict,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = True
+    ):
         """
         deserialize model from dictionary
 
+        overrides may accept only the body, in which case all fields are loaded with
+        validation regardless of the requested options
+
         :param body: serialized data to load into object
+        :param only: (optional) names of fields to load, dotted paths select fields
+            of nested objects
+        :param exclude: (optional) names of fields to skip, dotted paths skip fields
+            of nested objects
+        :param validate: (optional) if false, trust data and assign values without
+            coercion or checks for required and null data
         """
         pass
+
+
+def is_immutable(value) -> bool:
+    """
+    check whether value is immutable and can be safely shared
+
+    :param value: any value
+    :return: true if value is an immutable primitive or a tuple of immutable values
+    """
+    if type(value) in IMMUTABLE_TYPES:
+        return True
+    if type(value) is tuple:
+        return all(is_immutable(v) for v in value)
+    return False
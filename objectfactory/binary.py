@@ -0,0 +1,332 @@
+"""
+binary module
+
+implements compact binary codec for serializable objects
+
+values are encoded in the MessagePack format. serializable objects are encoded
+with the reserved 0xc1 marker, followed by the integer type id of the class in
+the factory manifest and an array of field values in declaration order
+"""
+
+# lib
+import struct
+
+# src
+from .serializable import Serializable, _ITEM_TYPE
+
+# marker for serializable object
+OBJECT = 0xc1
+
+_INT8 = struct.Struct('>b')
+_INT16 = struct.Struct('>h')
+_INT32 = struct.Struct('>i')
+_INT64 = struct.Struct('>q')
+_UINT8 = struct.Struct('>B')
+_UINT16 = struct.Struct('>H')
+_UINT32 = struct.Struct('>I')
+_UINT64 = struct.Struct('>Q')
+_DOUBLE = struct.Struct('>d')
+
+
+def encode(obj: Serializable, type_ids: dict) -> bytes:
+    """
+    encode serializable object to binary
+
+    :param obj: serializable object
+    :param type_ids: dictionary of registered class to integer type id
+    :raises ValueError: if a class is not registered or an integer is out of range
+    :raises TypeError: if a value cannot be encoded
+    :return: encoded object
+    """
+    out = bytearray()
+    _pack(obj, out, type_ids)
+    return bytes(out)
+
+
+def decode(data: bytes, types: list):
+    """
+    decode binary to serialized body
+
+    :param data: encoded object
+    :param types: list of registered classes indexed by type id
+    :raises ValueError: if data is invalid or refers to an unknown type id
+    :return: serialized data as dict, with type information of each object
+    """
+    try:
+        value, pos = _unpack(data, 0, types)
+    except (IndexError, struct.error) as e:
+        raise ValueError('Truncated binary data') from e
+    if pos != len(data):
+        raise ValueError('Unexpected trailing binary data')
+    return value
+
+
+def _pack(value, out: bytearray, type_ids: dict):
+    """
+    append encoded value to buffer
+
+    :param value: value to encode
+    :param out: output buffer
+    :param type_ids: dictionary of registered class to integer type id
+    """
+    kind = type(value)
+    if value is None:
+        out.append(0xc0)
+    elif value is True:
+        out.append(0xc3)
+    elif value is False:
+        out.append(0xc2)
+    elif kind is int:
+        _pack_int(value, out)
+    elif kind is float:
+        out.append(0xcb)
+        out += _DOUBLE.pack(value)
+    elif kind is str:
+        data = value.encode('utf-8')
+        _pack_header(len(data), out, 0xa0, 32, 0xd9, 0xda, 0xdb)
+        out += data
+    elif kind is bytes:
+        _pack_header(len(value), out, None, 0, 0xc4, 0xc5, 0xc6)
+        out += value
+    elif kind is list or kind is tuple:
+        _pack_header(len(value), out, 0x90, 16, None, 0xdc, 0xdd)
+        for item in value:
+            _pack(item, out, type_ids)
+    elif kind is dict:
+        _pack_header(len(value), out, 0x80, 16, None, 0xde, 0xdf)
+        for key, item in value.items():
+            _pack(key, out, type_ids)
+            _pack(item, out, type_ids)
+    elif isinstance(value, Serializable):
+        _pack_object(value, out, type_ids)
+    else:
+        raise TypeError('Cannot encode value of type {}'.format(kind.__name__))
+
+
+def _pack_object(obj: Serializable, out: bytearray, type_ids: dict):
+    """
+    append encoded serializable object to buffer
+
+    :param obj: serializable object
+    :param out: output buffer
+    :param type_ids: dictionary of registered class to integer type id
+    """
+    cls = type(obj)
+    dumper = cls._binary_dumper
+    if dumper is None:
+        dumper = cls._compile_binary_dumper()
+    values = dumper(obj)
+    if values is None:
+        # user defined serialization is encoded as is, with type information by name
+        _pack(obj.serialize(), out, type_ids)
+        return
+
+    type_id = type_ids.get(cls)
+    if type_id is None:
+        # note: views of externally stored data are encoded as their item class
+        type_id = type_ids.get(getattr(cls, _ITEM_TYPE, None))
+    if type_id is None:
+        raise ValueError('Object type {} not registered'.format(cls.__name__))
+    out.append(OBJECT)
+    _pack_int(type_id, out)
+    _pack(values, out, type_ids)
+
+
+def _pack_int(value: int, out: bytearray):
+    """
+    append encoded integer to buffer
+
+    :param value: integer
+    :param out: output buffer
+    """
+    if 0 <= value <= 0x7f:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xff)
+    elif -0x80 <= value <= 0xff:
+        if value < 0:
+            out.append(0xd0)
+            out += _INT8.pack(value)
+        else:
+            out.append(0xcc)
+            out += _UINT8.pack(value)
+    elif -0x8000 <= value <= 0xffff:
+        if value < 0:
+            out.append(0xd1)
+            out += _INT16.pack(value)
+        else:
+            out.append(0xcd)
+            out += _UINT16.pack(value)
+    elif -0x80000000 <= value <= 0xffffffff:
+        if value < 0:
+            out.append(0xd2)
+            out += _INT32.pack(value)
+        else:
+            out.append(0xce)
+            out += _UINT32.pack(value)
+    elif -0x8000000000000000 <= value < 0:
+        out.append(0xd3)
+        out += _INT64.pack(value)
+    elif 0 < value <= 0xffffffffffffffff:
+        out.append(0xcf)
+        out += _UINT64.pack(value)
+    else:
+        raise ValueError('Integer out of range for binary encoding: {}'.format(value))
+
+
+def _pack_header(size: int, out: bytearray, fix: int, fix_limit: int, h8, h16, h32):
+    """
+    append header for string, binary, array, or map of given size to buffer
+
+    :param size: number of bytes or items
+    :param out: output buffer
+    :param fix: marker for small sizes stored in the marker itself
+    :param fix_limit: exclusive size limit for fixed marker
+    :param h8: marker with 8 bit size, if supported
+    :param h16: marker with 16 bit size
+    :param h32: marker with 32 bit size
+    """
+    if size < fix_limit:
+        out.append(fix | size)
+    elif h8 is not None and size <= 0xff:
+        out.append(h8)
+        out.append(size)
+    elif size <= 0xffff:
+        out.append(h16)
+        out += _UINT16.pack(size)
+    else:
+        out.append(h32)
+        out += _UINT32.pack(size)
+
+
+def _unpack(data: bytes, pos: int, types: list):
+    """
+    decode value at position
+
+    :param data: encoded data
+    :param pos: position of value
+    :param types: list of registered classes indexed by type id
+    :return: tuple of decoded value and position after value
+    """
+    marker = data[pos]
+    pos += 1
+    if marker <= 0x7f:
+        return marker, pos
+    if marker >= 0xe0:
+        return marker - 0x100, pos
+    if 0xa0 <= marker <= 0xbf:
+        end = pos + (marker & 0x1f)
+        return data[pos:end].decode('utf-8'), end
+    if 0x90 <= marker <= 0x9f:
+        return _unpack_array(data, pos, marker & 0x0f, types)
+    if 0x80 <= marker <= 0x8f:
+        return _unpack_map(data, pos, marker & 0x0f, types)
+    if marker == 0xc0:
+        return None, pos
+    if marker == 0xc2:
+        return False, pos
+    if marker == 0xc3:
+        return True, pos
+    if marker == OBJECT:
+        return _unpack_object(data, pos, types)
+    if marker == 0xcb:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+    if marker in _FIXED:
+        unpacker = _FIXED[marker]
+        return unpacker.unpack_from(data, pos)[0], pos + unpacker.size
+    if marker in _SIZED:
+        unpacker, kind = _SIZED[marker]
+        size = unpacker.unpack_from(data, pos)[0]
+        pos += unpacker.size
+        if kind is list:
+            return _unpack_array(data, pos, size, types)
+        if kind is dict:
+            return _unpack_map(data, pos, size, types)
+        end = pos + size
+        if kind is str:
+            return data[pos:end].decode('utf-8'), end
+        return bytes(data[pos:end]), end
+    raise ValueError('Invalid binary marker: {:#x}'.format(marker))
+
+
+def _unpack_array(data: bytes, pos: int, size: int, types: list):
+    """
+    decode array items
+
+    :param data: encoded data
+    :param pos: position of first item
+    :param size: number of items
+    :param types: list of registered classes indexed by type id
+    :return: tuple of decoded list and position after array
+    """
+    items = []
+    for _ in range(size):
+        item, pos = _unpack(data, pos, types)
+        items.append(item)
+    return items, pos
+
+
+def _unpack_map(data: bytes, pos: int, size: int, types: list):
+    """
+    decode map entries
+
+    :param data: encoded data
+    :param pos: position of first key
+    :param size: number of entries
+    :param types: list of registered classes indexed by type id
+    :return: tuple of decoded dict and position after map
+    """
+    items = {}
+    for _ in range(size):
+        key, pos = _unpack(data, pos, types)
+        items[key], pos = _unpack(data, pos, types)
+    return items, pos
+
+
+def _unpack_object(data: bytes, pos: int, types: list):
+    """
+    decode serializable object to serialized body
+
+    :param data: encoded data
+    :param pos: position of type id
+    :param types: list of registered classes indexed by type id
+    :return: tuple of serialized body and position after object
+    """
+    type_id, pos = _unpack(data, pos, types)
+    if type(type_id) is not int or not 0 <= type_id < len(types):
+        raise ValueError('Unknown binary type id: {}'.format(type_id))
+    cls = types[type_id]
+    values, pos = _unpack(data, pos, types)
+    keys = cls._binary_keys()
+    if type(values) is not list or len(values) != len(keys):
+        raise ValueError('Invalid binary fields for type {}'.format(cls.__name__))
+    body = dict(zip(keys, values))
+    body['_type'] = cls.__module__ + '.' + cls.__name__
+    return body, pos
+
+
+# unpackers for fixed size numbers
+_FIXED = {
+    0xcc: _UINT8,
+    0xcd: _UINT16,
+    0xce: _UINT32,
+    0xcf: _UINT64,
+    0xd0: _INT8,
+    0xd1: _INT16,
+    0xd2: _INT32,
+    0xd3: _INT64,
+}
+
+# unpackers for size of variable length values
+_SIZED = {
+    0xd9: (_UINT8, str),
+    0xda: (_UINT16, str),
+    0xdb: (_UINT32, str),
+    0xc4: (_UINT8, bytes),
+    0xc5: (_UINT16, bytes),
+    0xc6: (_UINT32, bytes),
+    0xdc: (_UINT16, list),
+    0xdd: (_UINT32, list),
+    0xde: (_UINT16, dict),
+    0xdf: (_UINT32, dict),
+}
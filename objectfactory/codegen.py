@@ -0,0 +1,895 @@
+"""
+codegen module
+
+implements generation of specialized serialization functions for serializable classes
+"""
+
+# lib
+from json.encoder import encode_basestring
+from types import MemberDescriptorType
+import math
+import marshmallow
+from marshmallow.utils import ensure_text_type, is_collection, missing
+
+# src
+from .serializable import Serializable, serialize_options
+from .field import Field
+from .nested import NestedFactoryField, LazyList, LazyListField
+from .encoding import dumps
+
+# sentinel for unset field data
+MISSING = missing
+
+# default marshmallow field instances for delegation of unusual values
+BOOLEAN = marshmallow.fields.Boolean()
+
+# field types assigned as is from trusted input
+TRUSTED_TYPES = (
+    marshmallow.fields.Field,
+    marshmallow.fields.Raw,
+    marshmallow.fields.Integer,
+    marshmallow.fields.Float,
+    marshmallow.fields.String,
+    marshmallow.fields.Boolean,
+)
+
+
+def compile_serializer(cls):
+    """
+    generate specialized serialize function for a serializable class
+
+    the dump expression of each builtin marshmallow field type is inlined, while
+    any other field type is delegated to its bound marshmallow field
+
+    :param cls: serializable class with generated schema
+    :return: function(obj, include_type, use_full_type) -> dict
+    """
+    namespace = {
+        'MISSING': MISSING,
+        'Serializable': Serializable,
+        'LazyList': LazyList,
+        'OPTIONS': serialize_options,
+        'BOOLEAN': BOOLEAN,
+        'text': ensure_text_type,
+        'cls': cls,
+    }
+    lines = [
+        'def serialize(obj, include_type, use_full_type):',
+    ]
+    if any(_storage(cls, name, attr) == 'dict' for name, attr in cls._fields.items()):
+        lines.append('    get = obj.__dict__.get')
+    keys = []
+    bound = None
+    for i, (name, attr) in enumerate(cls._fields.items()):
+        mfield = cls._schema._declared_fields[name]
+        keys.append(mfield.data_key if mfield.data_key is not None else name)
+        namespace['F{}'.format(i)] = attr
+
+        lines.extend(_read_lines(cls, i, name, attr))
+
+        expr = _dump_expression(mfield, 'v', str(i))
+        if expr is None:
+            if bound is None:
+                bound = cls._get_schema()
+            namespace['M{}'.format(i)] = bound.fields[name]
+            lines.extend(_delegate_lines(i, name))
+        else:
+            lines.append('    v{} = {}'.format(i, expr))
+
+    lines.append('    body = {')
+    for i, key in enumerate(keys):
+        lines.append('        {!r}: v{},'.format(key, i))
+    lines.append('    }')
+    lines.append('    if include_type:')
+    lines.append('        if use_full_type:')
+    lines.append('            body[\'_type\'] = {!r}'.format(cls.__module__ + '.' + cls.__name__))
+    lines.append('        else:')
+    lines.append('            body[\'_type\'] = {!r}'.format(cls.__name__))
+    lines.append('    return body')
+
+    return _build(cls, 'serialize', lines, namespace)
+
+
+def compile_json_encoder(cls):
+    """
+    generate specialized JSON encode function for a serializable class
+
+    the output is joined from the escaped key fragments of the class and the
+    encoded value of each field, without building an intermediate dictionary.
+    the output is equivalent to encoding the result of serialize
+
+    :param cls: serializable class
+    :return: function(obj, include_type, use_full_type) -> str
+    """
+    namespace = {
+        'dumps': dumps,
+        'cls': cls,
+    }
+    if cls.serialize is not Serializable.serialize \
+            or cls._serializer is cls._marshmallow_serialize or cls._tracked:
+        # encode output of user defined or incremental serialization
+        lines = [
+            'def to_json(obj, include_type, use_full_type):',
+            '    return dumps(obj.serialize(include_type, use_full_type))',
+        ]
+        return _build(cls, 'to_json', lines, namespace)
+
+    namespace.update({
+        'MISSING': MISSING,
+        'OPTIONS': serialize_options,
+        'esc': encode_basestring,
+        'json_int': _json_int,
+        'json_float': _json_float,
+        'json_str': _json_str,
+        'json_bool': _json_bool,
+        'json_nested': _json_nested,
+    })
+    lines = [
+        'def to_json(obj, include_type, use_full_type):',
+    ]
+    if any(_storage(cls, name, attr) == 'dict' for name, attr in cls._fields.items()):
+        lines.append('    get = obj.__dict__.get')
+    parts = []
+    bound = None
+    for i, (name, attr) in enumerate(cls._fields.items()):
+        mfield = cls._schema._declared_fields[name]
+        key = mfield.data_key if mfield.data_key is not None else name
+        namespace['F{}'.format(i)] = attr
+        lines.extend(_read_lines(cls, i, name, attr))
+
+        expr = _json_expression(mfield, 'v', str(i))
+        if expr is None:
+            if bound is None:
+                bound = cls._get_schema()
+            namespace['M{}'.format(i)] = bound.fields[name]
+            lines.extend(_delegate_lines(i, name))
+            lines.append('    v{0} = dumps(v{0})'.format(i))
+        else:
+            lines.append('    v{} = {}'.format(i, expr))
+        parts.append(repr(('{' if i == 0 else ',') + dumps(key) + ':'))
+        parts.append('v{}'.format(i))
+
+    # precomputed type tags and closing fragment
+    prefix = ',' if cls._fields else '{'
+    full_type = cls.__module__ + '.' + cls.__name__
+    namespace['TYPE_FULL'] = prefix + '"_type":' + dumps(full_type) + '}'
+    namespace['TYPE_SHORT'] = prefix + '"_type":' + dumps(cls.__name__) + '}'
+    namespace['END'] = '}' if cls._fields else '{}'
+    parts.append('(TYPE_FULL if use_full_type else TYPE_SHORT) if include_type else END')
+
+    lines.append('    return \'\'.join([')
+    for part in parts:
+        lines.append('        {},'.format(part))
+    lines.append('    ])')
+
+    return _build(cls, 'to_json', lines, namespace)
+
+
+def compile_binary_dumper(cls):
+    """
+    generate function to dump field values of a serializable class for binary encoding
+
+    values are dumped as by serialize, except that nested objects are kept as is
+    so that they can be encoded with their own type id
+
+    :param cls: serializable class
+    :return: function(obj) -> list of field values in declaration order, or None
+        for classes with user defined serialization
+    """
+    namespace = {
+        'MISSING': MISSING,
+        'Serializable': Serializable,
+        'LazyList': LazyList,
+        'OPTIONS': serialize_options,
+        'BOOLEAN': BOOLEAN,
+        'text': ensure_text_type,
+        'cls': cls,
+    }
+    if cls.serialize is not Serializable.serialize \
+            or cls._serializer is cls._marshmallow_serialize:
+        lines = [
+            'def dump_values(obj):',
+            '    return None',
+        ]
+        return _build(cls, 'dump_values', lines, namespace)
+
+    lines = [
+        'def dump_values(obj, include_type=True, use_full_type=True):',
+    ]
+    if any(_storage(cls, name, attr) == 'dict' for name, attr in cls._fields.items()):
+        lines.append('    get = obj.__dict__.get')
+    bound = None
+    for i, (name, attr) in enumerate(cls._fields.items()):
+        mfield = cls._schema._declared_fields[name]
+        namespace['F{}'.format(i)] = attr
+        lines.extend(_read_lines(cls, i, name, attr))
+
+        expr = _value_expression(mfield, 'v', str(i))
+        if expr is None:
+            if bound is None:
+                bound = cls._get_schema()
+            namespace['M{}'.format(i)] = bound.fields[name]
+            lines.extend(_delegate_lines(i, name))
+        else:
+            lines.append('    v{} = {}'.format(i, expr))
+    values = ', '.join('v{}'.format(i) for i in range(len(cls._fields)))
+    lines.append('    return [{}]'.format(values))
+
+    return _build(cls, 'dump_values', lines, namespace)
+
+
+def compile_row_dumper(cls):
+    """
+    generate function to dump field data of a serializable class as a compact row
+
+    rows are tuples of a type index followed by the value of each field in
+    declaration order. nested objects are dumped as rows by the pack function, so
+    that an object tree can be sent between processes without pickling objects
+
+    :param cls: serializable class
+    :return: function(obj, index, pack) -> tuple
+    """
+    namespace = {
+        'MISSING': MISSING,
+        'Serializable': Serializable,
+        'cls': cls,
+    }
+    lines = [
+        'def dump_row(obj, index, pack):',
+    ]
+    if any(_storage(cls, name, attr) == 'dict' for name, attr in cls._fields.items()):
+        lines.append('    get = obj.__dict__.get')
+    for i, (name, attr) in enumerate(cls._fields.items()):
+        namespace['F{}'.format(i)] = attr
+        lines.extend(_read_lines(cls, i, name, attr))
+        kind = _row_kind(cls, name)
+        if kind == 'nested':
+            lines.append('    if isinstance(v, Serializable):')
+            lines.append('        v = pack(v)')
+        elif kind == 'list':
+            lines.append('    if type(v) is list:')
+            lines.append('        v = [pack(e) if isinstance(e, Serializable) else e for e in v]')
+        lines.append('    v{} = v'.format(i))
+    values = ''.join('v{}, '.format(i) for i in range(len(cls._fields)))
+    lines.append('    return (index, {})'.format(values.rstrip()))
+
+    return _build(cls, 'dump_row', lines, namespace)
+
+
+def compile_row_loader(cls):
+    """
+    generate function to create an object of a serializable class from a compact row
+
+    field values are written directly to instance storage, and nested rows are
+    created by the unpack function
+
+    :param cls: serializable class
+    :return: function(row, unpack) -> object
+    """
+    namespace = {
+        'cls': cls,
+    }
+    names = ''.join('v{}, '.format(i) for i in range(len(cls._fields)))
+    lines = [
+        'def load_row(row, unpack):',
+        '    _, {}= row'.format(names),
+        '    obj = cls()',
+    ]
+    if any(_storage(cls, name, attr) == 'dict' for name, attr in cls._fields.items()):
+        lines.append('    data = obj.__dict__')
+    for i, (name, attr) in enumerate(cls._fields.items()):
+        kind = _row_kind(cls, name)
+        if kind == 'nested':
+            lines.append('    if type(v{0}) is tuple:'.format(i))
+            lines.append('        v{0} = unpack(v{0})'.format(i))
+        elif kind == 'list':
+            lines.append('    if type(v{0}) is list:'.format(i))
+            lines.append(
+                '        v{0} = [unpack(e) if type(e) is tuple else e for e in v{0}]'.format(i)
+            )
+        storage = _storage(cls, name, attr)
+        if storage == 'dict':
+            lines.append('    data[{!r}] = v{}'.format(attr._attr_key, i))
+        elif storage == 'slot':
+            lines.append('    obj.{} = v{}'.format(attr._attr_key, i))
+        else:
+            lines.append('    setattr(obj, {!r}, v{})'.format(name, i))
+    lines.append('    return obj')
+
+    return _build(cls, 'load_row', lines, namespace)
+
+
+def compile_deserializer(cls, schema=None):
+    """
+    generate specialized deserialize function for a serializable class
+
+    the input body is traversed once, validating and coercing each field with
+    inlined checks for builtin marshmallow field types, and the results are then
+    written directly to instance storage. any input that is not accepted by the
+    fast path is reloaded with the marshmallow schema so that validation errors
+    are reported exactly as before
+
+    :param cls: serializable class with generated schema
+    :param schema: (optional) schema instance with a subset of the class fields to
+        load instead of all fields
+    :return: function(obj, body)
+    """
+    if schema is None:
+        fallback = cls._marshmallow_deserialize
+        fields = cls._fields
+        declared = cls._schema._declared_fields
+    else:
+        def fallback(obj, body):
+            obj._marshmallow_deserialize(body, schema=schema)
+        fields = {name: attr for name, attr in cls._fields.items() if name in schema.fields}
+        declared = schema.fields
+
+    namespace = {
+        'MISSING': MISSING,
+        'ValidationError': marshmallow.ValidationError,
+        'fallback': fallback,
+        'invalid': _invalid,
+        'load_int': _load_int,
+        'load_float': _load_float,
+        'load_str': _load_str,
+        'load_bool': _load_bool,
+        'collection': _collection,
+    }
+    lines = [
+        'def deserialize(obj, body):',
+        '    if type(body) is not dict:',
+        '        return fallback(obj, body)',
+        '    get = body.get',
+        '    try:',
+    ]
+    writes = []
+    bound = schema
+    for i, (name, attr) in enumerate(fields.items()):
+        mfield = declared[name]
+        key = mfield.data_key if mfield.data_key is not None else name
+        lines.append('        v = get({!r}, MISSING)'.format(key))
+
+        expr = _load_expression(mfield, 'v', str(i), namespace)
+        if expr is None:
+            # delegate unknown field types to marshmallow, including missing and null handling
+            if bound is None:
+                bound = cls._get_schema()
+            namespace['M{}'.format(i)] = bound.fields[name]
+            lines.append('        x{} = M{}.deserialize(v, {!r}, body)'.format(i, i, key))
+        else:
+            lines.append('        if v is MISSING:')
+            if mfield.required:
+                lines.append('            invalid()')
+            else:
+                lines.append('            x{} = MISSING'.format(i))
+            lines.append('        elif v is None:')
+            if mfield.allow_none:
+                lines.append('            x{} = None'.format(i))
+            else:
+                lines.append('            invalid()')
+            lines.append('        else:')
+            lines.append('            x{} = {}'.format(i, expr))
+
+        storage = _storage(cls, name, attr)
+        if storage == 'dict':
+            writes.append('        data[{!r}] = x{}'.format(attr._attr_key, i))
+        elif storage == 'slot':
+            writes.append('        obj.{} = x{}'.format(attr._attr_key, i))
+        else:
+            writes.append('        setattr(obj, {!r}, x{})'.format(name, i))
+
+    if not fields:
+        lines.append('        pass')
+    lines.append('    except ValidationError:')
+    lines.append('        return fallback(obj, body)')
+    if any(_storage(cls, name, attr) == 'dict' for name, attr in fields.items()):
+        lines.append('    data = obj.__dict__')
+    for i, write in enumerate(writes):
+        lines.append('    if x{} is not MISSING:'.format(i))
+        lines.append(write)
+
+    return _build(cls, 'deserialize', lines, namespace)
+
+
+def compile_trusted_deserializer(cls, schema=None):
+    """
+    generate deserialize function for a serializable class that trusts its input
+
+    values of builtin marshmallow field types are assigned straight from the body
+    without any coercion or checks for required and null data. nested objects are
+    still created by type, and any other field type is delegated to its bound
+    marshmallow field
+
+    :param cls: serializable class with generated schema
+    :param schema: (optional) schema instance with a subset of the class fields to
+        load instead of all fields
+    :return: function(obj, body)
+    """
+    if schema is None:
+        schema = cls._get_schema()
+    fields = {name: attr for name, attr in cls._fields.items() if name in schema.fields}
+
+    namespace = {
+        'MISSING': MISSING,
+    }
+    lines = [
+        'def deserialize(obj, body):',
+        '    get = body.get',
+    ]
+    if any(_storage(cls, name, attr) == 'dict' for name, attr in fields.items()):
+        lines.append('    data = obj.__dict__')
+    for i, (name, attr) in enumerate(fields.items()):
+        mfield = schema.fields[name]
+        key = mfield.data_key if mfield.data_key is not None else name
+        lines.append('    v = get({!r}, MISSING)'.format(key))
+
+        expr = _trusted_expression(mfield, 'v', str(i), namespace)
+        if expr is None:
+            # delegate unknown field types to marshmallow, including missing and null handling
+            namespace['M{}'.format(i)] = mfield
+            lines.append('    v = M{}.deserialize(v, {!r}, body)'.format(i, key))
+            expr = 'v'
+
+        lines.append('    if v is not MISSING:')
+        storage = _storage(cls, name, attr)
+        if storage == 'dict':
+            lines.append('        data[{!r}] = {}'.format(attr._attr_key, expr))
+        elif storage == 'slot':
+            lines.append('        obj.{} = {}'.format(attr._attr_key, expr))
+        else:
+            lines.append('        setattr(obj, {!r}, {})'.format(name, expr))
+    if not fields:
+        lines.append('    pass')
+
+    return _build(cls, 'deserialize', lines, namespace)
+
+
+def _storage(cls, name, attr) -> str:
+    """
+    determine how field data can be accessed on instances of a class
+
+    instance storage can only be accessed directly when attribute access on the
+    class resolves to the field descriptor without any overridden behavior, and
+    when writes do not need to be tracked
+
+    :param cls: serializable class
+    :param name: field attribute name
+    :param attr: field descriptor
+    :return: 'dict' or 'slot' for direct storage access, otherwise 'descriptor'
+    """
+    if cls._tracked:
+        # writes must go through the descriptor to be recorded
+        return 'descriptor'
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            if base.__dict__[name] is not attr:
+                return 'descriptor'
+            break
+    if type(attr).__get__ is not Field.__get__ or type(attr).__set__ is not Field.__set__:
+        return 'descriptor'
+    storage = getattr(cls, attr._attr_key, None)
+    if storage is None:
+        return 'dict'
+    if isinstance(storage, MemberDescriptorType):
+        return 'slot'
+    # note: storage is provided by another descriptor, such as for collection views
+    return 'descriptor'
+
+
+def _row_kind(cls, name) -> str:
+    """
+    determine whether a field may hold nested objects to be dumped as rows
+
+    :param cls: serializable class
+    :param name: field attribute name
+    :return: 'nested', 'list', or None
+    """
+    mfield = cls._schema._declared_fields.get(name)
+    if isinstance(mfield, NestedFactoryField):
+        return 'nested'
+    if type(mfield) is marshmallow.fields.List and isinstance(mfield.inner, NestedFactoryField):
+        return 'list'
+    return None
+
+
+def _read_lines(cls, i, name, attr) -> list:
+    """
+    build source lines to read field data from instance storage into variable v
+
+    :param cls: serializable class
+    :param i: field index
+    :param name: field attribute name
+    :param attr: field descriptor
+    :return: lines of generated source
+    """
+    storage = _storage(cls, name, attr)
+    if storage == 'dict':
+        return [
+            '    v = get({!r}, MISSING)'.format(attr._attr_key),
+            '    if v is MISSING:',
+            '        v = F{}.__get__(obj, cls)'.format(i),
+        ]
+    if storage == 'slot':
+        return [
+            '    try:',
+            '        v = obj.{}'.format(attr._attr_key),
+            '    except AttributeError:',
+            '        v = F{}.__get__(obj, cls)'.format(i),
+        ]
+    return ['    v = getattr(obj, {!r})'.format(name)]
+
+
+def _delegate_lines(i, name) -> list:
+    """
+    build source lines to dump variable v with bound marshmallow field
+
+    :param i: field index
+    :param name: field attribute name
+    :return: lines of generated source
+    """
+    # note: options are passed to any nested factory fields through call context
+    return [
+        '    token = OPTIONS.set({'
+        '\'include_type\': include_type, \'use_full_type\': use_full_type})',
+        '    try:',
+        '        v{} = M{}._serialize(v, {!r}, obj)'.format(i, i, name),
+        '    finally:',
+        '        OPTIONS.reset(token)',
+    ]
+
+
+def _dump_expression(mfield, value, suffix):
+    """
+    build inline dump expression for builtin marshmallow field type
+
+    :param mfield: marshmallow field
+    :param value: name of variable holding field value
+    :param suffix: unique suffix for temporary variables
+    :return: python expression as string, or None if field type is not supported
+    """
+    kind = type(mfield)
+    if kind is marshmallow.fields.Field or kind is marshmallow.fields.Raw:
+        return value
+    if kind is marshmallow.fields.Integer and not mfield.as_string:
+        return '{0} if type({0}) is int else (None if {0} is None else int({0}))'.format(value)
+    if kind is marshmallow.fields.Float and not mfield.as_string:
+        return '{0} if type({0}) is float else (None if {0} is None else float({0}))'.format(
+            value
+        )
+    if kind is marshmallow.fields.String:
+        return '{0} if type({0}) is str else (None if {0} is None else text({0}))'.format(value)
+    if kind is marshmallow.fields.Boolean \
+            and mfield.truthy is marshmallow.fields.Boolean.truthy \
+            and mfield.falsy is marshmallow.fields.Boolean.falsy:
+        # note: True and False are members of the default truthy and falsy sets
+        return '{0} if {0} is True or {0} is False or {0} is None ' \
+               'else BOOLEAN._serialize({0}, None, None)'.format(value)
+    if kind is NestedFactoryField:
+        return '{0}.serialize(include_type=include_type, use_full_type=use_full_type) ' \
+               'if isinstance({0}, Serializable) else {{}}'.format(value)
+    if kind is marshmallow.fields.List:
+        item = 'e' + suffix
+        inner = _dump_expression(mfield.inner, item, suffix + '_')
+        if inner is None:
+            return None
+        return 'None if {0} is None else [{1} for {2} in {0}]'.format(value, inner, item)
+    if kind is LazyListField:
+        item = 'e' + suffix
+        inner = _dump_expression(mfield.inner, item, suffix + '_')
+        return 'None if {0} is None else ({0}._serialize(include_type, use_full_type) ' \
+               'if type({0}) is LazyList else [{1} for {2} in {0}])'.format(value, inner, item)
+    return None
+
+
+def _value_expression(mfield, value, suffix):
+    """
+    build inline dump expression that keeps nested objects as is
+
+    :param mfield: marshmallow field
+    :param value: name of variable holding field value
+    :param suffix: unique suffix for temporary variables
+    :return: python expression as string, or None if field type is not supported
+    """
+    kind = type(mfield)
+    if kind is NestedFactoryField:
+        return '{0} if isinstance({0}, Serializable) else {{}}'.format(value)
+    if kind is marshmallow.fields.List:
+        item = 'e' + suffix
+        inner = _value_expression(mfield.inner, item, suffix + '_')
+        if inner is None:
+            return None
+        return 'None if {0} is None else [{1} for {2} in {0}]'.format(value, inner, item)
+    return _dump_expression(mfield, value, suffix)
+
+
+def _json_expression(mfield, value, suffix):
+    """
+    build inline JSON encode expression for builtin marshmallow field type
+
+    :param mfield: marshmallow field
+    :param value: name of variable holding field value
+    :param suffix: unique suffix for temporary variables
+    :return: python expression as string, or None if field type is not supported
+    """
+    kind = type(mfield)
+    if kind is marshmallow.fields.Field or kind is marshmallow.fields.Raw:
+        return 'dumps({})'.format(value)
+    if kind is marshmallow.fields.Integer and not mfield.as_string:
+        return 'int.__repr__({0}) if type({0}) is int else json_int({0})'.format(value)
+    if kind is marshmallow.fields.Float and not mfield.as_string:
+        return 'float.__repr__({0}) if type({0}) is float and {0} - {0} == 0.0 ' \
+               'else json_float({0})'.format(value)
+    if kind is marshmallow.fields.String:
+        return 'esc({0}) if type({0}) is str else json_str({0})'.format(value)
+    if kind is marshmallow.fields.Boolean \
+            and mfield.truthy is marshmallow.fields.Boolean.truthy \
+            and mfield.falsy is marshmallow.fields.Boolean.falsy:
+        return '\'true\' if {0} is True else \'false\' if {0} is False ' \
+               'else json_bool({0})'.format(value)
+    if kind is NestedFactoryField:
+        return 'json_nested({}, include_type, use_full_type)'.format(value)
+    if kind is marshmallow.fields.List:
+        item = 'e' + suffix
+        inner = _json_expression(mfield.inner, item, suffix + '_')
+        if inner is None:
+            return None
+        return '\'null\' if {0} is None else ' \
+               '\'[\' + \',\'.join([{1} for {2} in {0}]) + \']\''.format(value, inner, item)
+    return None
+
+
+def _load_expression(mfield, value, suffix, namespace):
+    """
+    build inline load expression for builtin marshmallow field type
+
+    the expression is only evaluated for values that are not null and must
+    raise a validation error for any value it does not accept
+
+    :param mfield: marshmallow field
+    :param value: name of variable holding raw value
+    :param suffix: unique suffix for temporary variables and constants
+    :param namespace: global constants referenced by generated source
+    :return: python expression as string, or None if field type is not supported
+    """
+    kind = type(mfield)
+    if mfield.validators:
+        return None
+    if kind is marshmallow.fields.Field or kind is marshmallow.fields.Raw:
+        return value
+    if kind is marshmallow.fields.Integer and not mfield.strict:
+        return '{0} if type({0}) is int else load_int({0})'.format(value)
+    if kind is marshmallow.fields.Float and mfield.allow_nan is False:
+        # note: difference is zero for finite values only
+        return '{0} if type({0}) is float and {0} - {0} == 0.0 else load_float({0})'.format(
+            value
+        )
+    if kind is marshmallow.fields.String:
+        return '{0} if type({0}) is str else load_str({0})'.format(value)
+    if kind is marshmallow.fields.Boolean \
+            and mfield.truthy is marshmallow.fields.Boolean.truthy \
+            and mfield.falsy is marshmallow.fields.Boolean.falsy:
+        return '{0} if {0} is True or {0} is False else load_bool({0})'.format(value)
+    if kind is NestedFactoryField:
+        namespace['N' + suffix] = mfield._deserialize
+        return 'N{0}({1}, None, None)'.format(suffix, value)
+    if kind is marshmallow.fields.List:
+        item = 'e' + suffix
+        inner = _load_expression(mfield.inner, item, suffix + '_', namespace)
+        if inner is None:
+            return None
+        if mfield.inner.allow_none:
+            inner = 'None if {0} is None else {1}'.format(item, inner)
+        else:
+            inner = 'invalid() if {0} is None else {1}'.format(item, inner)
+        return '[{0} for {1} in ({2} if type({2}) is list else collection({2}))]'.format(
+            inner, item, value
+        )
+    if kind is LazyListField:
+        namespace['N' + suffix] = mfield._deserialize
+        return 'N{0}({1}, None, None)'.format(suffix, value)
+    return None
+
+
+def _trusted_expression(mfield, value, suffix, namespace):
+    """
+    build load expression for builtin marshmallow field type without validation
+
+    :param mfield: bound marshmallow field
+    :param value: name of variable holding raw value
+    :param suffix: unique suffix for temporary variables and constants
+    :param namespace: global constants referenced by generated source
+    :return: python expression as string, or None if field type is not supported
+    """
+    kind = type(mfield)
+    if kind in TRUSTED_TYPES:
+        return value
+    if kind is NestedFactoryField:
+        namespace['N' + suffix] = mfield._load_trusted
+        return 'N{0}({1})'.format(suffix, value)
+    if kind is LazyListField:
+        namespace['N' + suffix] = mfield._load
+        return 'N{0}({1}, validate=False)'.format(suffix, value)
+    if kind is marshmallow.fields.List:
+        item = 'e' + suffix
+        inner = _trusted_expression(mfield.inner, item, suffix + '_', namespace)
+        if inner is None:
+            return None
+        if inner == item:
+            return 'None if {0} is None else list({0})'.format(value)
+        return 'None if {0} is None else [{1} for {2} in {0}]'.format(value, inner, item)
+    return None
+
+
+def _invalid():
+    """
+    reject value in generated loader
+
+    :raises ValidationError: always
+    """
+    raise marshmallow.ValidationError('Invalid value.')
+
+
+def _load_int(value) -> int:
+    """
+    coerce value to integer as done by marshmallow integer field
+
+    :param value: raw value
+    :raises ValidationError: if value is not a valid integer
+    :return: integer value
+    """
+    if value is True or value is False:
+        _invalid()
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        _invalid()
+
+
+def _load_float(value) -> float:
+    """
+    coerce value to finite float as done by marshmallow float field
+
+    :param value: raw value
+    :raises ValidationError: if value is not a valid finite float
+    :return: float value
+    """
+    if value is True or value is False:
+        _invalid()
+    try:
+        num = float(value)
+    except (TypeError, ValueError, OverflowError):
+        _invalid()
+    if not math.isfinite(num):
+        _invalid()
+    return num
+
+
+def _load_str(value) -> str:
+    """
+    coerce value to string as done by marshmallow string field
+
+    :param value: raw value
+    :raises ValidationError: if value is not a valid string
+    :return: string value
+    """
+    if not isinstance(value, (str, bytes)):
+        _invalid()
+    try:
+        return ensure_text_type(value)
+    except UnicodeDecodeError:
+        _invalid()
+
+
+def _load_bool(value) -> bool:
+    """
+    coerce value to boolean as done by marshmallow boolean field
+
+    :param value: raw value
+    :raises ValidationError: if value is not a valid boolean
+    :return: boolean value
+    """
+    try:
+        if value in BOOLEAN.truthy:
+            return True
+        if value in BOOLEAN.falsy:
+            return False
+    except TypeError:
+        pass
+    _invalid()
+
+
+def _json_int(value) -> str:
+    """
+    encode value as JSON integer as dumped by marshmallow integer field
+
+    :param value: field value
+    :return: JSON text
+    """
+    if value is None:
+        return 'null'
+    return int.__repr__(int(value))
+
+
+def _json_float(value) -> str:
+    """
+    encode value as JSON number as dumped by marshmallow float field
+
+    :param value: field value
+    :return: JSON text
+    """
+    if value is None:
+        return 'null'
+    return dumps(float(value))
+
+
+def _json_str(value) -> str:
+    """
+    encode value as JSON string as dumped by marshmallow string field
+
+    :param value: field value
+    :return: JSON text
+    """
+    if value is None:
+        return 'null'
+    return encode_basestring(ensure_text_type(value))
+
+
+def _json_bool(value) -> str:
+    """
+    encode value as JSON boolean as dumped by marshmallow boolean field
+
+    :param value: field value
+    :return: JSON text
+    """
+    if value is None:
+        return 'null'
+    return 'true' if BOOLEAN._serialize(value, None, None) else 'false'
+
+
+def _json_nested(value, include_type: bool, use_full_type: bool) -> str:
+    """
+    encode nested object as JSON as dumped by nested factory field
+
+    :param value: field value
+    :param include_type: if true, type information will be included in body
+    :param use_full_type: if true, the fully qualified path with be specified in body
+    :return: JSON text
+    """
+    if not isinstance(value, Serializable):
+        return '{}'
+    encoder = type(value)._json_encoder
+    if encoder is None:
+        encoder = type(value)._compile_json_encoder()
+    return encoder(value, include_type, use_full_type)
+
+
+def _collection(value):
+    """
+    check value is a valid collection for a marshmallow list field
+
+    :param value: raw value
+    :raises ValidationError: if value is not a collection
+    :return: value
+    """
+    if not is_collection(value):
+        _invalid()
+    return value
+
+
+def _build(cls, kind, lines, namespace):
+    """
+    compile generated source into a function
+
+    :param cls: serializable class
+    :param kind: function name
+    :param lines: lines of generated source
+    :param namespace: global constants referenced by generated source
+    :return: compiled function
+    """
+    source = '\n'.join(lines)
+    filename = '<objectfactory {} {}.{}>'.format(kind, cls.__module__, cls.__qualname__)
+    exec(compile(source, filename, 'exec'), namespace)
+    func = namespace[kind]
+    func.__qualname__ = '{}.{}'.format(cls.__qualname__, kind)
+    func.__source__ = source
+    return func
@@ -0,0 +1,299 @@
+"""
+collection module
+
+implements array backed collection of serializable objects with primitive fields
+"""
+
+# lib
+from array import array
+from typing import Iterable, Type
+
+# src
+from .serializable import Serializable, Meta, _ITEM_TYPE
+from .field import Integer, Float, Boolean
+from .columns import COLUMN_TYPES, typed_array, from_columns
+
+
+class Collection(object):
+    """
+    typed container that stores each field of a serializable class in an array
+
+    use Collection[cls] to define the container for a class whose fields are all
+    integer, float, or boolean fields. indexing returns a lightweight view, which is
+    an instance of the class that reads and writes the arrays through its field
+    descriptors. null floats are stored as nan and read back as null, while null
+    integers and booleans cannot be stored
+    """
+    __slots__ = ('columns',)
+    _item_type = None
+    _view_type = None
+    _kinds = None
+    _specialized = {}
+
+    def __class_getitem__(cls, item_type: Type[Serializable]):
+        """
+        define collection for a serializable class
+
+        :param item_type: serializable class with only primitive fields
+        :raises TypeError: if the class has any other field type
+        :return: collection class
+        """
+        specialized = Collection._specialized.get(item_type)
+        if specialized is not None:
+            return specialized
+
+        kinds = {}
+        for name, attr in item_type._fields.items():
+            kind = next((k for k in (Integer, Float, Boolean) if isinstance(attr, k)), None)
+            if kind is None:
+                raise TypeError(
+                    'Field {} of {} is not an integer, float, or boolean field'.format(
+                        name,
+                        item_type.__name__
+                    )
+                )
+            kinds[name] = kind
+
+        specialized = type(
+            'Collection[{}]'.format(item_type.__name__),
+            (Collection,),
+            {
+                '__slots__': (),
+                '_item_type': item_type,
+                '_view_type': define_view(
+                    item_type,
+                    {name: _storage_property(name, kind) for name, kind in kinds.items()}
+                ),
+                '_kinds': kinds,
+            }
+        )
+        Collection._specialized[item_type] = specialized
+        return specialized
+
+    def __init__(self, objs: Iterable[Serializable] = ()):
+        """
+        :param objs: (optional) initial objects to copy into the collection
+        """
+        if self._item_type is None:
+            raise TypeError('Collection must be specialized with Collection[cls]')
+        self.columns = {
+            name: array(COLUMN_TYPES[kind][0]) for name, kind in self._kinds.items()
+        }
+        self.extend(objs)
+
+    @classmethod
+    def from_columns(cls, columns: dict):
+        """
+        constructor to create collection from typed columns of field data
+
+        :param columns: dictionary of field name to NumPy array, array.array, or sequence
+        :return: new collection
+        """
+        collection = cls()
+        collection.extend(from_columns(cls._item_type, columns))
+        return collection
+
+    @classmethod
+    def create_many(
+            cls,
+            bodies: Iterable[dict],
+            chunk_size: int = 4096,
+            validate: bool = None
+    ):
+        """
+        create collection from serialized data with the global factory
+
+        bodies are loaded in chunks, so that only one chunk of objects is held
+        in memory before it is copied into the arrays
+
+        :param bodies: serialized data for each object
+        :param chunk_size: (optional) number of objects to load at once
+        :param validate: (optional) if false, trust data and skip validation
+        :raises TypeError: if any object is not an instance of the item type
+        :return: new collection
+        """
+        from .factory import create_many  # note: deferred to avoid circular import
+        collection = cls()
+        chunk = []
+        for body in bodies:
+            chunk.append(body)
+            if len(chunk) >= chunk_size:
+                collection.extend(create_many(chunk, cls._item_type, validate=validate))
+                chunk = []
+        if chunk:
+            collection.extend(create_many(chunk, cls._item_type, validate=validate))
+        return collection
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('Collection index out of range')
+        view = self._view_type.__new__(self._view_type)
+        view._collection = self
+        view._index = index
+        return view
+
+    def __setitem__(self, index: int, obj: Serializable):
+        view = self[index]
+        for name in self._kinds:
+            setattr(view, name, getattr(obj, name))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, obj: Serializable):
+        """
+        copy field data of object to the end of the collection
+
+        :param obj: instance of the item type
+        """
+        self.extend([obj])
+
+    def extend(self, objs: Iterable[Serializable]):
+        """
+        copy field data of objects to the end of the collection
+
+        :param objs: instances of the item type
+        :raises TypeError: if any object is not an instance of the item type
+        :raises ValueError: if a value cannot be stored in its array
+        """
+        objs = objs if isinstance(objs, list) else list(objs)
+        for cls in set(map(type, objs)):
+            if not issubclass(cls, self._item_type):
+                raise TypeError(
+                    'Object type {} is not a {}'.format(cls.__name__, self._item_type.__name__)
+                )
+        # note: build all arrays before extending so that a failure leaves no partial record
+        arrays = {name: typed_array(objs, name, kind) for name, kind in self._kinds.items()}
+        for name, values in arrays.items():
+            self.columns[name].extend(values)
+
+    def serialize(self, include_type: bool = True, use_full_type: bool = True) -> list:
+        """
+        serialize all objects to dictionaries directly from the arrays
+
+        :param include_type: if true, type information will be included in each body
+        :param use_full_type: if true, the fully qualified path with be specified in each body
+        :return: list of serialized objects as dict
+        """
+        item_type = self._item_type
+        if item_type.serialize is not Serializable.serialize \
+                or item_type._serializer is item_type._marshmallow_serialize:
+            return [obj.serialize(include_type, use_full_type) for obj in self]
+
+        keys = [item_type._fields[name]._key for name in self._kinds]
+        values = [
+            _column_values(column, self._kinds[name]) for name, column in self.columns.items()
+        ]
+        bodies = [dict(zip(keys, row)) for row in zip(*values)]
+        if include_type:
+            type_name = item_type.__name__
+            if use_full_type:
+                type_name = item_type.__module__ + '.' + type_name
+            for body in bodies:
+                body['_type'] = type_name
+        return bodies
+
+
+def define_view(item_type: Type[Serializable], properties: dict) -> type:
+    """
+    define view class of a serializable class with field data stored externally
+
+    views hold a reference to their container and their index in it. field
+    descriptors of the class access the data of a view through properties that
+    replace the storage attributes of the fields. views are encoded in binary and
+    pickled as instances of the serializable class
+
+    :param item_type: serializable class
+    :param properties: dictionary of field name to property for its storage attribute
+    :return: view class
+    """
+    attributes = {
+        '__slots__': ('_collection', '_index'),
+        '__module__': item_type.__module__,
+        '__qualname__': item_type.__qualname__,
+        '__reduce__': _reduce_view,
+        _ITEM_TYPE: item_type,
+    }
+    for name, storage in properties.items():
+        attributes[item_type._fields[name]._attr_key] = storage
+    return Meta(item_type.__name__, (item_type,), attributes)
+
+
+def _reduce_view(view: Serializable) -> tuple:
+    """
+    reduce view for pickling to a copy of its field data
+
+    :param view: view of externally stored data
+    :return: function to create instance of the serializable class, and its arguments
+    """
+    item_type = getattr(type(view), _ITEM_TYPE)
+    return _item_from_view, (item_type, {name: getattr(view, name) for name in item_type._fields})
+
+
+def _item_from_view(item_type: Type[Serializable], values: dict) -> Serializable:
+    """
+    create instance of serializable class from field data of a view
+
+    :param item_type: serializable class
+    :param values: dictionary of field name to value
+    :return: new object
+    """
+    obj = item_type()
+    for name, value in values.items():
+        setattr(obj, name, value)
+    return obj
+
+
+def _column_values(column: array, kind: type) -> list:
+    """
+    convert array of field data to list of field values
+
+    :param column: typed array
+    :param kind: primitive field type
+    :return: list of values, with null for nan floats
+    """
+    if kind is Boolean:
+        return list(map(bool, column))
+    if kind is Float:
+        return [None if v != v else v for v in column]
+    return column.tolist()
+
+
+def _storage_property(name: str, kind: type) -> property:
+    """
+    define property to access field data of a view in its collection array
+
+    :param name: field name
+    :param kind: primitive field type
+    :return: property
+    """
+    if kind is Boolean:
+        def get(view):
+            return view._collection.columns[name][view._index] != 0
+    elif kind is Float:
+        def get(view):
+            value = view._collection.columns[name][view._index]
+            return None if value != value else value
+    else:
+        def get(view):
+            return view._collection.columns[name][view._index]
+
+    if kind is Float:
+        def put(view, value):
+            if value is None:
+                value = float('nan')
+            view._collection.columns[name][view._index] = value
+    else:
+        def put(view, value):
+            view._collection.columns[name][view._index] = value
+
+    return property(get, put)
@@ -0,0 +1,226 @@
+"""
+columns module
+
+implements conversion between collections of serializable objects and typed columns
+"""
+
+# lib
+from array import array
+from collections import deque
+from operator import attrgetter
+from typing import Iterable, Type
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# src
+from .serializable import Serializable
+from .field import Integer, Float, Boolean, String
+
+# array typecode and numpy dtype of each primitive field type, strings are stored as objects
+COLUMN_TYPES = {
+    Integer: ('q', 'int64'),
+    Float: ('d', 'float64'),
+    Boolean: ('b', 'bool'),
+    String: (None, 'object'),
+}
+
+# accepted array typecodes, numpy dtype kinds, and python types of column values
+_INTEGER_CODES = 'bBhHiIlLqQ'
+_ACCEPTED = {
+    Integer: (_INTEGER_CODES, 'iu', (int,)),
+    Float: (_INTEGER_CODES + 'fd', 'iuf', (float, int)),
+    Boolean: ('bB', 'b', (bool,)),
+    String: ('', 'U', (str,)),
+}
+
+
+def to_columns(
+        objs: Iterable[Serializable],
+        fields: Iterable[str] = None,
+        object_type: Type[Serializable] = None
+) -> dict:
+    """
+    export field data of a homogeneous collection of objects as typed columns
+
+    each column is filled directly from the field descriptors of the objects, without
+    serializing each object. columns are NumPy arrays when NumPy is installed,
+    otherwise integer, float, and boolean columns are array.array with typecodes
+    'q', 'd', and 'b', and string columns are lists. null floats are exported as nan
+
+    :param objs: serializable objects of the same class or its subclasses
+    :param fields: (optional) names of fields to export, defaults to all integer,
+        float, boolean, and string fields
+    :param object_type: (optional) class of objects, defaults to class of first object
+    :raises ValueError: if a field is not a primitive field, or holds a value that
+        cannot be stored in its column
+    :raises TypeError: if any object is not an instance of the object type
+    :return: dictionary of field name to column
+    """
+    objs = objs if isinstance(objs, list) else list(objs)
+    if object_type is None:
+        if not objs:
+            raise ValueError('Cannot determine object type of empty collection')
+        object_type = type(objs[0])
+    for cls in set(map(type, objs)):
+        if not issubclass(cls, object_type):
+            raise TypeError(
+                'Object type {} is not a {}'.format(cls.__name__, object_type.__name__)
+            )
+
+    columns = {}
+    for name, kind in column_fields(object_type, fields).items():
+        columns[name] = _export(objs, name, kind)
+    return columns
+
+
+def from_columns(cls: Type[Serializable], columns: dict) -> list:
+    """
+    create objects of a serializable class from typed columns
+
+    the type of each column is validated once against its field, then field data
+    is assigned to all objects in a single loop per column. fields without a column
+    are left unset
+
+    :param cls: serializable class
+    :param columns: dictionary of field name to NumPy array, array.array, or sequence
+    :raises ValueError: if a field is not a primitive field, the column type does
+        not match its field, or columns differ in length
+    :return: list of new instances
+    """
+    kinds = column_fields(cls, columns)
+    loaded = {name: _import(cls, name, kinds[name], columns[name]) for name in kinds}
+    lengths = set(map(len, loaded.values()))
+    if len(lengths) > 1:
+        raise ValueError('Columns of {} differ in length'.format(cls.__name__))
+
+    objs = [cls() for _ in range(lengths.pop() if lengths else 0)]
+    for name, values in loaded.items():
+        deque(map(cls._fields[name].__set__, objs, values), maxlen=0)
+    return objs
+
+
+def column_fields(cls: Type[Serializable], fields: Iterable[str] = None) -> dict:
+    """
+    resolve primitive field types of a serializable class
+
+    :param cls: serializable class
+    :param fields: (optional) names of fields, defaults to all primitive fields
+    :raises ValueError: if a field is unknown or not a primitive field
+    :return: dictionary of field name to primitive field type
+    """
+    kinds = {}
+    for name, attr in cls._fields.items():
+        for kind in COLUMN_TYPES:
+            if isinstance(attr, kind):
+                kinds[name] = kind
+                break
+    if fields is None:
+        return kinds
+
+    selected = {}
+    for name in fields:
+        if name not in cls._fields:
+            raise ValueError('Unknown field {} of {}'.format(name, cls.__name__))
+        if name not in kinds:
+            raise ValueError(
+                'Field {} of {} is not an integer, float, boolean, or string field'.format(
+                    name,
+                    cls.__name__
+                )
+            )
+        selected[name] = kinds[name]
+    return selected
+
+
+def _export(objs: list, name: str, kind: type):
+    """
+    build typed column of field values
+
+    :param objs: serializable objects
+    :param name: field name
+    :param kind: primitive field type
+    :return: column
+    """
+    column = typed_array(objs, name, kind)
+    if numpy is None:
+        return column
+    if kind is String:
+        values = numpy.empty(len(column), dtype=object)
+        values[:] = column
+        return values
+    if kind is Boolean:
+        return numpy.frombuffer(column, dtype='int8') != 0
+    return numpy.frombuffer(column, dtype=COLUMN_TYPES[kind][1])
+
+
+def typed_array(objs: list, name: str, kind: type):
+    """
+    build array of field values with the typecode of the field type
+
+    :param objs: serializable objects
+    :param name: field name
+    :param kind: primitive field type
+    :raises ValueError: if a value cannot be stored in the array
+    :return: array.array, or list for string fields
+    """
+    typecode = COLUMN_TYPES[kind][0]
+    get = attrgetter(name)
+    if typecode is None:
+        return list(map(get, objs))
+    try:
+        return array(typecode, map(get, objs))
+    except (TypeError, OverflowError):
+        pass
+    if kind is Float:
+        # note: only retry for null floats after the fast path fails
+        nan = float('nan')
+        try:
+            return array(typecode, (nan if v is None else v for v in map(get, objs)))
+        except TypeError:
+            pass
+    raise ValueError('Invalid value in {} column {}'.format(kind.__name__, name))
+
+
+def _import(cls: Type[Serializable], name: str, kind: type, column) -> list:
+    """
+    validate type of column and convert to field values
+
+    :param cls: serializable class
+    :param name: field name
+    :param kind: primitive field type
+    :param column: NumPy array, array.array, or sequence
+    :raises ValueError: if the column type does not match its field
+    :return: list of field values
+    """
+    typecodes, kinds, types = _ACCEPTED[kind]
+    if isinstance(column, array):
+        valid = column.typecode in typecodes
+        converted = kind is not Integer and column.typecode in _INTEGER_CODES
+    elif numpy is not None and isinstance(column, numpy.ndarray) and column.dtype.kind != 'O':
+        valid = column.ndim == 1 and column.dtype.kind in kinds
+        converted = kind is Float and column.dtype.kind != 'f'
+    else:
+        valid = None
+        converted = False
+    if valid is False:
+        raise ValueError('Invalid column type for {} field {}'.format(kind.__name__, name))
+
+    values = column.tolist() if valid else list(column)
+    if valid is None:
+        # check values of untyped sequence by type
+        allowed = types + ((type(None),) if cls._fields[name]._allow_none else ())
+        for value_type in set(map(type, values)):
+            if value_type not in allowed:
+                raise ValueError(
+                    'Invalid value of type {} for {} field {}'.format(
+                        value_type.__name__,
+                        kind.__name__,
+                        name
+                    )
+                )
+    elif converted:
+        values = list(map(float if kind is Float else bool, values))
+    return values
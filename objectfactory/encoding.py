@@ -0,0 +1,125 @@
+"""
+encoding module
+
+implements JSON encoding and decoding with the fastest available backend
+"""
+
+# lib
+from datetime import date, time
+from enum import Enum
+from uuid import UUID
+import json
+import math
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# integer literals that may exceed 64 bits, which orjson decodes as floats
+_LONG_DIGITS = re.compile('[0-9]{20}')
+_LONG_DIGITS_BYTES = re.compile(b'[0-9]{20}')
+
+# orjson options to encode dates and dataclasses through the same default as the stdlib
+ORJSON_OPTIONS = 0 if orjson is None \
+    else orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def dumps(value) -> str:
+    """
+    encode value as JSON text
+
+    orjson is used when installed, with the standard library as fallback for
+    values it does not support. output is the same with either backend: compact,
+    not ASCII escaped, with non-finite floats as null, and dates, times, UUIDs,
+    and enums encoded as strings or their values
+
+    :param value: any JSON serializable value
+    :raises TypeError: if a value cannot be encoded
+    :return: JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_default, option=ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            pass
+    try:
+        return _stdlib_dumps(value)
+    except ValueError as e:
+        if 'float' not in str(e):
+            raise
+        # note: non-finite floats are rare, so they are only replaced after a failure
+        return _stdlib_dumps(_finite(value))
+
+
+def loads(data):
+    """
+    decode JSON text or bytes
+
+    orjson is used when installed, with the standard library as fallback for
+    text it rejects, such as NaN literals, and for text with integers that may
+    exceed 64 bits, so that decoded values are the same with either backend
+
+    :param data: JSON text or UTF-8 encoded bytes
+    :raises ValueError: if the data is not valid JSON
+    :return: decoded value
+    """
+    if orjson is not None:
+        pattern = _LONG_DIGITS if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if pattern.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def _stdlib_dumps(value) -> str:
+    """
+    encode value as JSON text with the standard library, formatted like orjson
+
+    :param value: any JSON serializable value
+    :raises ValueError: if a float is not finite
+    :return: JSON text
+    """
+    return json.dumps(
+        value,
+        default=_default,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        allow_nan=False
+    )
+
+
+def _default(value):
+    """
+    convert value not natively supported by both backends
+
+    :param value: value to convert
+    :raises TypeError: if the value is not supported
+    :return: JSON serializable value
+    """
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(value).__name__))
+
+
+def _finite(value):
+    """
+    replace non-finite floats with null in dictionaries, lists, and tuples
+
+    :param value: any JSON serializable value
+    :return: value with only finite floats
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
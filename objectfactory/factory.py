@@ -4,85 +4,728 @@ factory module
 implements serializable object factory
 """
 # lib
-from typing import Type, TypeVar
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Type, TypeVar, Iterable, Iterator, List, AsyncIterator
+import warnings
 
 # src
-from .serializable import Serializable
+from .serializable import Serializable, _LAZY_BODY
+from .encoding import loads
+from .aio import iter_chunks, run_chunk
+from . import binary
 
 # type var for hinting from generic function
 T = TypeVar('T', bound=Serializable)
 
+# maximum number of memoized fallback type names per factory
+ALIAS_CACHE_SIZE = 1024
+
 
 class Factory(object):
     """
     factory class for registering and creating serializable objects
     """
 
-    def __init__(self, name):
+    def __init__(self, name, validate: bool = True):
+        """
+        :param name: factory name
+        :param validate: (optional) if false, trust all input to this factory by default
+            and skip validation when creating objects
+        """
         self.name = name
+        self.validate = validate
         self.registry = {}
+        self._aliases = {}
+        self._types = []
+        self._type_ids = {}
 
     def register(self, serializable: Serializable):
         """
         decorator to register class with factory
 
+        the class is indexed by both its fully qualified path and its short name. if
+        the short name is already registered for a class in another module, a warning
+        is issued and the short name will resolve to the newly registered class.
+        each newly registered type name is assigned the next integer type id for
+        binary encoding
+
         :param serializable: serializable object class
         :return: registered class
         """
-        self.registry[serializable.__module__ + '.' + serializable.__name__] = serializable
+        full_name = serializable.__module__ + '.' + serializable.__name__
+        existing = self.registry.get(serializable.__name__)
+        if existing is not None and existing.__module__ + '.' + existing.__name__ != full_name:
+            warnings.warn(
+                'Ambiguous short type name {}, registered for both {}.{} and {}'.format(
+                    serializable.__name__,
+                    existing.__module__,
+                    existing.__name__,
+                    full_name
+                )
+            )
+        previous = self.registry.get(full_name)
+        type_id = self._type_ids.pop(previous, None)
+        if type_id is None:
+            type_id = len(self._types)
+            self._types.append(serializable)
+        else:
+            self._types[type_id] = serializable
+        self._type_ids[serializable] = type_id
+        self.registry[full_name] = serializable
         self.registry[serializable.__name__] = serializable
         return serializable
 
-    def create(self, body: dict, object_type: Type[T] = Serializable) -> T:
+    def manifest(self) -> List[str]:
+        """
+        get manifest of registered types for binary encoding
+
+        :return: list of fully qualified type names indexed by type id
+        """
+        return [cls.__module__ + '.' + cls.__name__ for cls in self._types]
+
+    def load_manifest(self, names: Iterable[str]):
+        """
+        assign binary type ids from a manifest
+
+        use this to align type ids with another factory before exchanging binary
+        data. types that are not in the manifest are assigned the following ids
+
+        :param names: list of fully qualified type names indexed by type id
+        :raises ValueError: if a type is not registered
+        """
+        types = [self._resolve(name) for name in names]
+        types.extend(cls for cls in self._types if cls not in types)
+        self._types = types
+        self._type_ids = {cls: i for i, cls in enumerate(types)}
+
+    def serialize_binary(self, obj: Serializable) -> bytes:
+        """
+        encode object to compact binary format
+
+        objects are tagged with the integer type id of their class in the factory
+        manifest and fields are stored by position, so the data can only be read by
+        a factory with the same manifest and class definitions
+
+        :param obj: serializable object
+        :raises ValueError: if the type of any object is not registered
+        :return: encoded object
+        """
+        return binary.encode(obj, self._type_ids)
+
+    def create_binary(
+            self,
+            data: bytes,
+            object_type: Type[T] = Serializable,
+            validate: bool = None
+    ) -> T:
+        """
+        create object from compact binary format
+
+        :param data: data encoded with serialize_binary
+        :param object_type: (optional) specified object type
+        :param validate: (optional) if false, trust data and skip validation,
+            defaults to factory setting
+        :raises TypeError: if the object is not an instance of the specified type
+        :raises ValueError: if data is invalid or refers to an unknown type id
+        :return: deserialized object of specified type
+        """
+        body = binary.decode(data, self._types)
+        if type(body) is not dict:
+            raise ValueError('Binary data does not contain an object')
+        return self.create(body, object_type=object_type, validate=validate)
+
+    def create(
+            self,
+            body: dict,
+            object_type: Type[T] = Serializable,
+            lazy: bool = False,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = None
+    ) -> T:
         """
         create object from dictionary
 
         :param body: serialized object data
         :param object_type: (optional) specified object type
+        :param lazy: (optional) if true, keep raw body and only load each field on first access,
+            use materialize() to load and validate all remaining fields
+        :param only: (optional) names of fields to load, dotted paths select fields
+            of nested objects, classes overriding deserialize without options load
+            all fields
+        :param exclude: (optional) names of fields to skip, dotted paths skip fields
+            of nested objects
+        :param validate: (optional) if false, trust data and assign field values without
+            coercion or checks for required and null data, defaults to factory setting
         :raises TypeError: if the object is not an instance of the specified type
+        :raises ValueError: if projection is combined with lazy creation
         :return: deserialized object of specified type
         """
-        obj = None
-        try:
-            obj = self.registry[body['_type']]()
-        except KeyError:
-            pass
-        if obj is None:
-            try:
-                obj = self.registry[body['_type'].split('.')[-1]]()
-            except KeyError:
-                pass
-        if obj is None:
-            raise ValueError(
-                'Object type {} not found in factory registry'.format(body['_type'])
-            )
-
-        if not isinstance(obj, object_type):
+        if lazy and (only is not None or exclude is not None):
+            raise ValueError('Field projection is not supported for lazy creation')
+        serializable = self._resolve(body['_type'])
+        if not issubclass(serializable, object_type):
             raise TypeError(
                 'Object type {} is not a {}'.format(
-                    type(obj).__name__,
+                    serializable.__name__,
                     object_type.__name__
                 )
             )
 
-        obj.deserialize(body)
+        if validate is None:
+            validate = self.validate
+        obj = serializable()
+        if lazy:
+            setattr(obj, _LAZY_BODY, body)
+        elif only is None and exclude is None and validate:
+            obj.deserialize(body)
+        else:
+            obj._deserialize(body, only=only, exclude=exclude, validate=validate)
         return obj
 
+    def create_from_json(
+            self,
+            data,
+            object_type: Type[T] = Serializable,
+            validate: bool = None
+    ) -> T:
+        """
+        create object from JSON
+
+        data is decoded with the fastest available JSON backend and loaded with
+        the specialized deserializer of the object type
+
+        :param data: JSON text or UTF-8 encoded bytes
+        :param object_type: (optional) specified object type
+        :param validate: (optional) if false, trust data and skip validation,
+            defaults to factory setting
+        :raises TypeError: if the object is not an instance of the specified type
+        :return: deserialized object of specified type
+        """
+        return self.create(loads(data), object_type=object_type, validate=validate)
+
+    def create_many(
+            self,
+            bodies: Iterable[dict],
+            object_type: Type[T] = Serializable,
+            processes: int = None,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = None
+    ) -> List[T]:
+        """
+        create objects from a sequence of dictionaries
+
+        each distinct type is resolved and checked once, then all bodies of that
+        type are loaded together
+
+        :param bodies: serialized data for each object
+        :param object_type: (optional) specified object type
+        :param processes: (optional) number of worker processes to shard creation across,
+            registered classes must be importable from their modules by the workers
+        :param only: (optional) names of fields to load, dotted paths select fields
+            of nested objects
+        :param exclude: (optional) names of fields to skip, dotted paths skip fields
+            of nested objects
+        :param validate: (optional) if false, trust data and skip validation,
+            defaults to factory setting
+        :raises TypeError: if any object is not an instance of the specified type
+        :return: list of deserialized objects in input order
+        """
+        if validate is None:
+            validate = self.validate
+        bodies = list(bodies)
+        if processes is not None and processes > 1 and len(bodies) > 1:
+            return self._create_parallel(
+                bodies,
+                object_type,
+                processes,
+                only,
+                exclude,
+                validate
+            )
+
+        # group bodies by resolved class
+        groups = {}
+        resolved = {}
+        for i, body in enumerate(bodies):
+            type_name = body['_type']
+            serializable = resolved.get(type_name)
+            if serializable is None:
+                serializable = self._resolve(type_name)
+                if not issubclass(serializable, object_type):
+                    raise TypeError(
+                        'Object type {} is not a {}'.format(
+                            serializable.__name__,
+                            object_type.__name__
+                        )
+                    )
+                resolved[type_name] = serializable
+            groups.setdefault(serializable, []).append(i)
+
+        # load each group
+        objs = [None] * len(bodies)
+        for serializable, indices in groups.items():
+            group = serializable._load_many(
+                [bodies[i] for i in indices],
+                only=only,
+                exclude=exclude,
+                validate=validate
+            )
+            for i, obj in zip(indices, group):
+                objs[i] = obj
+        return objs
+
+    def _create_parallel(
+            self,
+            bodies: list,
+            object_type: type,
+            processes: int,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = True
+    ) -> list:
+        """
+        create objects across a pool of worker processes
+
+        the registry is sent to each worker once when it starts, which imports the
+        modules of all registered classes. bodies are split into several shards per
+        worker to balance load. created objects are sent back as compact rows of
+        field values, which are written directly to the storage of new instances
+
+        :param bodies: serialized data for each object
+        :param object_type: specified object type
+        :param processes: number of worker processes
+        :param only: (optional) names of fields to load
+        :param exclude: (optional) names of fields to skip
+        :param validate: (optional) if false, trust data and skip validation
+        :return: list of deserialized objects in input order
+        """
+        size = -(-len(bodies) // (processes * 4))
+        shards = [bodies[i:i + size] for i in range(0, len(bodies), size)]
+
+        objs = []
+        with ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_init_worker,
+                initargs=(self,)
+        ) as executor:
+            for shard in executor.map(
+                    _create_shard,
+                    shards,
+                    [object_type] * len(shards),
+                    [only] * len(shards),
+                    [exclude] * len(shards),
+                    [validate] * len(shards)
+            ):
+                objs.extend(_unpack_rows(*shard))
+        return objs
+
+    def iter_create(
+            self,
+            fp,
+            object_type: Type[T] = Serializable,
+            chunk_size: int = 65536,
+            line_numbers: bool = False
+    ) -> Iterator[T]:
+        """
+        lazily create objects from a JSON lines stream
+
+        the stream is read in chunks and each object is yielded as soon as its
+        line is complete, so memory use is bounded by the chunk size and the
+        longest line. blank lines are skipped
+
+        :param fp: readable text or binary file object
+        :param object_type: (optional) specified object type
+        :param chunk_size: (optional) number of characters or bytes to read at once
+        :param line_numbers: (optional) if true, the message of any error is prefixed
+            with the line number of the failing object, which is also stored as the
+            line_number attribute of the error
+        :raises TypeError: if an object is not an instance of the specified type
+        :return: generator of deserialized objects of specified type
+        """
+        for line_number, line in _iter_lines(fp, chunk_size):
+            if not line.strip():
+                continue
+            try:
+                obj = self.create(loads(line), object_type=object_type)
+            except Exception as e:
+                if line_numbers:
+                    # note: keep exception type, prefix message and record line number
+                    e.args = ('Error on line {}: {}'.format(line_number, e),) + e.args[1:]
+                    e.line_number = line_number
+                raise
+            yield obj
+
+    async def acreate(
+            self,
+            source,
+            object_type: Type[T] = Serializable,
+            chunk_size: int = 1000,
+            executor: Executor = None,
+            validate: bool = None
+    ) -> AsyncIterator[T]:
+        """
+        asynchronously create objects from a stream of bodies
+
+        items are collected into chunks that are created together, and control is
+        returned to the event loop after each chunk so that other tasks are not
+        blocked during bulk loads
+
+        :param source: iterable or async iterable of dictionaries, or of JSON text or
+            bytes for each object
+        :param object_type: (optional) specified object type
+        :param chunk_size: (optional) maximum number of objects to create at once
+        :param executor: (optional) executor to create chunks in, process pool workers
+            must be able to import all registered classes
+        :param validate: (optional) if false, trust data and skip validation,
+            defaults to factory setting
+        :raises TypeError: if an object is not an instance of the specified type
+        :return: async generator of deserialized objects of specified type
+        """
+        async for chunk in iter_chunks(source, chunk_size):
+            objs = await run_chunk(
+                executor,
+                self._create_chunk,
+                chunk,
+                object_type,
+                validate
+            )
+            for obj in objs:
+                yield obj
+
+    def _create_chunk(self, items: list, object_type: type, validate: bool = None) -> list:
+        """
+        create chunk of objects from dictionaries or JSON
+
+        :param items: dictionaries, or JSON text or bytes
+        :param object_type: specified object type
+        :param validate: (optional) if false, trust data and skip validation
+        :return: list of deserialized objects
+        """
+        bodies = [
+            loads(item) if isinstance(item, (str, bytes, bytearray)) else item
+            for item in items
+        ]
+        return self.create_many(bodies, object_type=object_type, validate=validate)
+
+    def _resolve(self, type_name: str) -> Type[Serializable]:
+        """
+        find registered class for type string
+
+        type names with an unregistered module path fall back to the short name,
+        and are memoized for subsequent lookups
+
+        :param type_name: fully qualified or short type name
+        :raises ValueError: if the type is not registered
+        :return: registered serializable class
+        """
+        serializable = self.registry.get(type_name)
+        if serializable is not None:
+            return serializable
+
+        # check memoized fallback is still registered under its short name
+        serializable = self._aliases.get(type_name)
+        if serializable is not None and self.registry.get(serializable.__name__) is serializable:
+            return serializable
+
+        serializable = self.registry.get(type_name.rpartition('.')[2])
+        if serializable is None:
+            raise ValueError(
+                'Object type {} not found in factory registry'.format(type_name)
+            )
+        if len(self._aliases) >= ALIAS_CACHE_SIZE:
+            self._aliases.clear()
+        self._aliases[type_name] = serializable
+        return serializable
+
+
+# factory used by worker process for parallel creation
+_worker_factory = None
+
+
+def _init_worker(factory: Factory):
+    """
+    initialize worker process for parallel creation
+
+    :param factory: factory with registry of importable classes
+    """
+    global _worker_factory
+    _worker_factory = factory
+
+
+def _create_shard(
+        bodies: list,
+        object_type: type,
+        only=None,
+        exclude=None,
+        validate=True
+) -> list:
+    """
+    create shard of objects within worker process
+
+    :param bodies: serialized data for each object
+    :param object_type: specified object type
+    :param only: (optional) names of fields to load
+    :param exclude: (optional) names of fields to skip
+    :param validate: (optional) if false, trust data and skip validation
+    :return: tuple of classes and rows of deserialized objects
+    """
+    return _pack_rows(_worker_factory.create_many(
+        bodies,
+        object_type=object_type,
+        only=only,
+        exclude=exclude,
+        validate=validate
+    ))
+
+
+def _pack_rows(objs: list) -> tuple:
+    """
+    dump objects as compact rows for transfer between processes
+
+    each row is a tuple of the index of the object class followed by its field
+    values, with nested objects also dumped as rows. objects of classes with user
+    defined deserialization are kept as is
+
+    :param objs: serializable objects
+    :return: tuple of list of classes by index, and list of rows
+    """
+    types = {}
+
+    def pack(obj):
+        cls = type(obj)
+        if cls.deserialize is not Serializable.deserialize:
+            return obj
+        index = types.get(cls)
+        if index is None:
+            index = types[cls] = len(types)
+        dumper = cls._row_dumper
+        if dumper is None:
+            dumper = cls._compile_row_dumper()
+        return dumper(obj, index, pack)
+
+    rows = [pack(obj) for obj in objs]
+    return list(types), rows
+
+
+def _unpack_rows(types: list, rows: list) -> list:
+    """
+    create objects from compact rows
+
+    :param types: list of classes by index
+    :param rows: rows, or objects kept as is
+    :return: list of objects
+    """
+    loaders = [
+        cls._row_loader if cls._row_loader is not None else cls._compile_row_loader()
+        for cls in types
+    ]
+
+    def unpack(row):
+        return loaders[row[0]](row, unpack)
+
+    return [unpack(row) if type(row) is tuple else row for row in rows]
+
+
+def _iter_lines(fp, chunk_size: int):
+    """
+    read stream in chunks and split into lines
+
+    :param fp: readable text or binary file object
+    :param chunk_size: number of characters or bytes to read at once
+    :return: generator of (line number, line) tuples
+    """
+    pending = []  # note: pieces of an incomplete line are only joined once it ends
+    line_number = 0
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b'\n' if isinstance(chunk, bytes) else '\n')
+        if len(lines) == 1:
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(lines[0])
+            lines[0] = chunk[:0].join(pending)
+            pending = []
+        remainder = lines.pop()
+        if remainder:
+            pending.append(remainder)
+        for line in lines:
+            line_number += 1
+            yield line_number, line
+    if pending:
+        yield line_number + 1, pending[0][:0].join(pending)
+
 
 # global registry
 _global_factory = Factory('global')
 
 
-def create(body: dict, object_type: Type[T] = Serializable) -> T:
+def create(
+        body: dict,
+        object_type: Type[T] = Serializable,
+        lazy: bool = False,
+        only: Iterable[str] = None,
+        exclude: Iterable[str] = None,
+        validate: bool = None
+) -> T:
     """
     create object from dictionary with the global factory
 
     :param body: serialized object data
     :param object_type: (optional) specified object type
+    :param lazy: (optional) if true, keep raw body and only load each field on first access
+    :param only: (optional) names of fields to load, dotted paths select fields
+        of nested objects
+    :param exclude: (optional) names of fields to skip, dotted paths skip fields
+        of nested objects
+    :param validate: (optional) if false, trust data and assign field values without
+        coercion or checks for required and null data
     :raises TypeError: if the object is not an instance of the specified type
     :return: deserialized object of specified type
     """
-    return _global_factory.create(body, object_type=object_type)
+    return _global_factory.create(
+        body,
+        object_type=object_type,
+        lazy=lazy,
+        only=only,
+        exclude=exclude,
+        validate=validate
+    )
+
+
+def create_from_json(
+        data,
+        object_type: Type[T] = Serializable,
+        validate: bool = None
+) -> T:
+    """
+    create object from JSON with the global factory
+
+    :param data: JSON text or UTF-8 encoded bytes
+    :param object_type: (optional) specified object type
+    :param validate: (optional) if false, trust data and skip validation
+    :raises TypeError: if the object is not an instance of the specified type
+    :return: deserialized object of specified type
+    """
+    return _global_factory.create_from_json(data, object_type=object_type, validate=validate)
+
+
+def serialize_binary(obj: Serializable) -> bytes:
+    """
+    encode object to compact binary format with the global factory
+
+    :param obj: serializable object
+    :raises ValueError: if the type of any object is not registered
+    :return: encoded object
+    """
+    return _global_factory.serialize_binary(obj)
+
+
+def create_binary(
+        data: bytes,
+        object_type: Type[T] = Serializable,
+        validate: bool = None
+) -> T:
+    """
+    create object from compact binary format with the global factory
+
+    :param data: data encoded with serialize_binary
+    :param object_type: (optional) specified object type
+    :param validate: (optional) if false, trust data and skip validation
+    :raises TypeError: if the object is not an instance of the specified type
+    :raises ValueError: if data is invalid or refers to an unknown type id
+    :return: deserialized object of specified type
+    """
+    return _global_factory.create_binary(data, object_type=object_type, validate=validate)
+
+
+def acreate(
+        source,
+        object_type: Type[T] = Serializable,
+        chunk_size: int = 1000,
+        executor: Executor = None,
+        validate: bool = None
+) -> AsyncIterator[T]:
+    """
+    asynchronously create objects from a stream of bodies with the global factory
+
+    :param source: iterable or async iterable of dictionaries, or of JSON text or
+        bytes for each object
+    :param object_type: (optional) specified object type
+    :param chunk_size: (optional) maximum number of objects to create at once
+    :param executor: (optional) executor to create chunks in
+    :param validate: (optional) if false, trust data and skip validation
+    :raises TypeError: if an object is not an instance of the specified type
+    :return: async generator of deserialized objects of specified type
+    """
+    return _global_factory.acreate(
+        source,
+        object_type=object_type,
+        chunk_size=chunk_size,
+        executor=executor,
+        validate=validate
+    )
+
+
+def create_many(
+        bodies: Iterable[dict],
+        object_type: Type[T] = Serializable,
+        processes: int = None,
+        only: Iterable[str] = None,
+        exclude: Iterable[str] = None,
+        validate: bool = None
+) -> List[T]:
+    """
+    create objects from a sequence of dictionaries with the global factory
+
+    :param bodies: serialized data for each object
+    :param object_type: (optional) specified object type
+    :param processes: (optional) number of worker processes to shard creation across
+    :param only: (optional) names of fields to load, dotted paths select fields
+        of nested objects
+    :param exclude: (optional) names of fields to skip, dotted paths skip fields
+        of nested objects
+    :param validate: (optional) if false, trust data and skip validation
+    :raises TypeError: if any object is not an instance of the specified type
+    :return: list of deserialized objects in input order
+    """
+    return _global_factory.create_many(
+        bodies,
+        object_type=object_type,
+        processes=processes,
+        only=only,
+        exclude=exclude,
+        validate=validate
+    )
+
+
+def iter_create(
+        fp,
+        object_type: Type[T] = Serializable,
+        chunk_size: int = 65536,
+        line_numbers: bool = False
+) -> Iterator[T]:
+    """
+    lazily create objects from a JSON lines stream with the global factory
+
+    :param fp: readable text or binary file object
+    :param object_type: (optional) specified object type
+    :param chunk_size: (optional) number of characters or bytes to read at once
+    :param line_numbers: (optional) if true, the message of any error is prefixed
+        with the line number of the failing object
+    :raises TypeError: if an object is not an instance of the specified type
+    :return: generator of deserialized objects of specified type
+    """
+    return _global_factory.iter_create(
+        fp,
+        object_type=object_type,
+        chunk_size=chunk_size,
+        line_numbers=line_numbers
+    )
 
 
 def register(serializable: Serializable):
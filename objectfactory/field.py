@@ -5,13 +5,13 @@ implements serializable fields
 """
 
 # lib
-from copy import deepcopy
 import marshmallow
 
 # src
 from .base import FieldABC, SerializableABC
 from .factory import create
-from .nested import NestedFactoryField
+from .serializable import _LAZY_BODY
+from .nested import NestedFactoryField, LazyListField
 
 
 class Field(FieldABC):
@@ -26,12 +26,27 @@ class Field(FieldABC):
         try:
             return getattr(instance, self._attr_key)
         except AttributeError:
-            # lazily create copy of default
-            setattr(instance, self._attr_key, deepcopy(self._default))
-            return getattr(instance, self._attr_key)
+            pass
+
+        # load from raw body of lazily created object
+        value = marshmallow.missing
+        body = getattr(instance, _LAZY_BODY, None)
+        if body is not None:
+            value = instance._load_field(self, body)
+
+        # lazily create default, copying only when it is mutable
+        if value is marshmallow.missing:
+            if self._default_factory is None:
+                value = self._default
+            else:
+                value = self._default_factory()
+        setattr(instance, self._attr_key, value)
+        return value
 
     def __set__(self, instance, value):
         setattr(instance, self._attr_key, value)
+        if instance._tracked:
+            instance._mark_dirty(self._attr_key[1:])
 
     def marshmallow(self):
         return marshmallow.fields.Field(
@@ -104,7 +119,8 @@ class Nested(Field):
             key=None,
             field_type=None,
             required=False,
-            allow_none=True
+            allow_none=True,
+            default_factory=None
     ):
         """
         :param default: default value for field if unset
@@ -112,8 +128,15 @@ class Nested(Field):
         :param field_type: specified type for nested object
         :param required: whether this field is required to deserialize an object
         :param allow_none: whether null should be considered a valid value
+        :param default_factory: (optional) callable to create default value for field if unset
         """
-        super().__init__(default=default, key=key, required=required, allow_none=allow_none)
+        super().__init__(
+            default=default,
+            key=key,
+            required=required,
+            allow_none=allow_none,
+            default_factory=default_factory
+        )
         self._field_type = field_type
 
     def marshmallow(self):
@@ -136,7 +159,10 @@ class List(Field):
             key=None,
             field_type=None,
             required=False,
-            allow_none=True
+            allow_none=True,
+            default_factory=None,
+            lazy=False,
+            lazy_cache=True
     ):
         """
         :param default: default value for field if unset
@@ -144,15 +170,37 @@ class List(Field):
         :param field_type: specified type for list of nested objects
         :param required: whether this field is required to deserialize an object
         :param allow_none: whether null should be considered a valid value
+        :param default_factory: (optional) callable to create default value for field if unset
+        :param lazy: (optional) if true, load nested objects as a LazyList that only
+            creates each object on first access
+        :param lazy_cache: (optional) whether objects created by a LazyList should be kept
         """
-        if default is None:
-            default = []
-        super().__init__(default=default, key=key, required=required, allow_none=allow_none)
+        if default is None and default_factory is None:
+            default_factory = list
+        super().__init__(
+            default=default,
+            key=key,
+            required=required,
+            allow_none=allow_none,
+            default_factory=default_factory
+        )
         self._field_type = field_type
+        self._lazy = lazy
+        self._lazy_cache = lazy_cache
 
     def marshmallow(self):
         if self._field_type is None or issubclass(self._field_type, SerializableABC):
             cls = NestedFactoryField(field_type=self._field_type)
+            if self._lazy:
+                return LazyListField(
+                    cls,
+                    cache=self._lazy_cache,
+                    data_key=self._key,
+                    required=self._required,
+                    allow_none=self._allow_none
+                )
+        elif self._lazy:
+            raise ValueError('Lazy List requires a serializable field type')
         elif issubclass(self._field_type, FieldABC):
             cls = self._field_type().marshmallow()
         elif issubclass(self._field_type, marshmallow.fields.FieldABC):
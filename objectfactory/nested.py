@@ -5,18 +5,42 @@ implements marshmallow field for objectfactory nested objects
 """
 
 # lib
+from collections.abc import MutableSequence, Sequence
 import marshmallow
 
 # src
-from .serializable import Serializable
+from .serializable import Serializable, serialize_options
 from .factory import create
 
 
+class _Unloaded(object):
+    """
+    sentinel type for list element not yet loaded from raw data
+
+    the sentinel is pickled by reference, so that its identity is kept when lazy
+    lists are pickled or copied
+    """
+    __slots__ = ()
+
+    def __reduce__(self):
+        return 'UNLOADED'
+
+    def __repr__(self):
+        return 'UNLOADED'
+
+
+# sentinel for list element not yet loaded from raw data
+UNLOADED = _Unloaded()
+
+
 class NestedFactoryField(marshmallow.fields.Field):
 
-    def __init__(self, field_type=None, **kwargs):
+    def __init__(self, field_type=None, only=None, exclude=None, **kwargs):
         super().__init__(**kwargs)
         self._field_type = field_type
+        self._only = only
+        self._exclude = exclude
+        self._trusted = None
 
     def _serialize(self, value, attr, obj, **kwargs):
         """
@@ -30,7 +54,7 @@ class NestedFactoryField(marshmallow.fields.Field):
         """
         if not isinstance(value, Serializable):
             return {}
-        return value.serialize(**obj._serialize_kwargs)
+        return value.serialize(**serialize_options.get())
 
     def _deserialize(self, value, attr, data, **kwargs):
         """
@@ -42,11 +66,21 @@ class NestedFactoryField(marshmallow.fields.Field):
         :param kwargs:
         :return:
         """
+        return self._load(value)
+
+    def _load(self, value, validate: bool = True):
+        """
+        create serializable object with factory
+
+        :param value: serialized object data
+        :param validate: (optional) if false, trust data and skip validation
+        :return: deserialized object
+        """
         if value is None:
             return
 
         if '_type' in value:
-            obj = create(value)
+            obj = create(value, only=self._only, exclude=self._exclude, validate=validate)
             if self._field_type and not isinstance(obj, self._field_type):
                 raise ValueError(
                     '{} is not an instance of type: {}'.format(
@@ -54,8 +88,193 @@ class NestedFactoryField(marshmallow.fields.Field):
                 )
         elif self._field_type:
             obj = self._field_type()
-            obj.deserialize(value)
+            obj._deserialize(value, only=self._only, exclude=self._exclude, validate=validate)
         else:
             raise ValueError('Cannot infer type information')
 
         return obj
+
+    def _load_trusted(self, value):
+        """
+        create serializable object from trusted data without validation
+
+        :param value: serialized object data
+        :return: deserialized object
+        """
+        if value is None:
+            return
+        if self._field_type is None or '_type' in value \
+                or self._field_type.deserialize is not Serializable.deserialize:
+            return self._load(value, validate=False)
+
+        # resolve deserializer of specified type on first use
+        deserializer = self._trusted
+        if deserializer is None:
+            deserializer = self._trusted = self._field_type._get_deserializer(
+                self._only,
+                self._exclude,
+                validate=False
+            )
+        obj = self._field_type()
+        deserializer(obj, value)
+        return obj
+
+
+class LazyList(MutableSequence):
+    """
+    list of nested serializable objects that are created from raw data on first access
+
+    this behaves as a standard mutable list. elements that have never been accessed
+    are created when serialized, but are not kept, so that output is identical to an
+    eagerly loaded list
+    """
+
+    def __init__(self, raw: list, loader, cache: bool = True):
+        """
+        :param raw: raw serialized data for each element
+        :param loader: function to create element from raw data
+        :param cache: whether created elements should be kept
+        """
+        self._raw = list(raw)
+        self._items = [UNLOADED] * len(self._raw)
+        self._loader = loader
+        self._cache = cache
+
+    def _load(self, index: int):
+        """
+        get element, creating it from raw data if needed
+
+        :param index: element index
+        :return: element
+        """
+        item = self._items[index]
+        if item is UNLOADED:
+            item = self._loader(self._raw[index])
+            if self._cache:
+                self._items[index] = item
+                self._raw[index] = None
+        return item
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self._items)))]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError('list index out of range')
+        return self._load(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self._items[index] = value
+            self._raw[index] = [None] * len(value)
+        else:
+            self._items[index] = value
+            self._raw[index] = None
+
+    def __delitem__(self, index):
+        del self._items[index]
+        del self._raw[index]
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self._load(i)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return 'LazyList({} items, {} loaded)'.format(
+            len(self._items),
+            sum(item is not UNLOADED for item in self._items)
+        )
+
+    def insert(self, index, value):
+        self._items.insert(index, value)
+        self._raw.insert(index, None)
+
+    def _serialize(self, include_type: bool, use_full_type: bool) -> list:
+        """
+        serialize elements, creating elements never loaded without keeping them
+
+        :param include_type: if true, type information will be included in body
+        :param use_full_type: if true, the fully qualified path with be specified in body
+        :raises ValidationError: if raw data of an element is invalid
+        :return: list of serialized elements
+        """
+        bodies = []
+        for item, raw in zip(self._items, self._raw):
+            if item is UNLOADED:
+                item = self._loader(raw)
+            if isinstance(item, Serializable):
+                bodies.append(
+                    item.serialize(include_type=include_type, use_full_type=use_full_type)
+                )
+            else:
+                bodies.append({})
+        return bodies
+
+
+class LazyListField(marshmallow.fields.List):
+    """
+    marshmallow list field that loads nested serializable objects lazily
+    """
+
+    def __init__(self, cls_or_instance, cache: bool = True, **kwargs):
+        """
+        :param cls_or_instance: marshmallow field for each element
+        :param cache: whether created elements should be kept
+        :param kwargs: additional marshmallow field arguments
+        """
+        super().__init__(cls_or_instance, **kwargs)
+        self._cache = cache
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        """
+        dump lazy list of serializable objects within the interface of marshmallow field
+
+        :param value:
+        :param attr:
+        :param obj:
+        :param kwargs:
+        :return:
+        """
+        if isinstance(value, LazyList):
+            return value._serialize(**serialize_options.get())
+        return super()._serialize(value, attr, obj, **kwargs)
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        """
+        wrap raw list data in lazy list through interface of marshmallow field
+
+        :param value:
+        :param attr:
+        :param data:
+        :param kwargs:
+        :return:
+        """
+        if not marshmallow.utils.is_collection(value):
+            raise self.make_error('invalid')
+        return self._load(value)
+
+    def _load(self, value, validate: bool = True):
+        """
+        wrap raw list data in lazy list
+
+        :param value: raw serialized data for each element
+        :param validate: (optional) if false, trust data and skip validation of elements
+        :return: lazy list
+        """
+        if value is None:
+            return
+        return LazyList(
+            value,
+            self.inner.deserialize if validate else self.inner._load_trusted,
+            cache=self._cache
+        )
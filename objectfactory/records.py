@@ -0,0 +1,314 @@
+"""
+records module
+
+implements memory mapped store of fixed width records for serializable objects
+"""
+
+# lib
+import json
+import mmap
+import struct
+from functools import partial
+from operator import attrgetter
+from typing import Iterable, Type
+
+# src
+from .serializable import Serializable
+from .field import Integer, Float, Boolean, String
+from .collection import define_view
+from .factory import Factory, _global_factory
+
+# file signature and header length prefix
+MAGIC = b'OFREC1\n\0'
+_HEADER_SIZE = struct.Struct('<I')
+
+# struct format of each fixed width field type
+RECORD_CODES = {
+    Integer: 'q',
+    Float: 'd',
+    Boolean: '?',
+}
+
+# view classes by serializable class and record layout
+_views = {}
+
+
+def record_layout(cls: Type[Serializable], string_sizes: dict = None) -> list:
+    """
+    derive fixed width record layout of a serializable class
+
+    :param cls: serializable class with integer, float, boolean, and string fields
+    :param string_sizes: (optional) dictionary of string field name to size in bytes
+    :raises ValueError: if a field has no fixed width, or a string field has no size
+    :return: list of (field name, struct format) tuples in field order
+    """
+    string_sizes = string_sizes or {}
+    layout = []
+    for name, attr in cls._fields.items():
+        code = next((c for k, c in RECORD_CODES.items() if isinstance(attr, k)), None)
+        if code is None and isinstance(attr, String):
+            size = string_sizes.get(name)
+            if size is None:
+                raise ValueError(
+                    'String field {} of {} requires a size in bytes'.format(name, cls.__name__)
+                )
+            code = '{}s'.format(size)
+        if code is None:
+            raise ValueError(
+                'Field {} of {} is not a fixed width field'.format(name, cls.__name__)
+            )
+        layout.append((name, code))
+    return layout
+
+
+def write_records(
+        path,
+        objs: Iterable[Serializable],
+        object_type: Type[Serializable],
+        string_sizes: dict = None
+) -> int:
+    """
+    write objects to a file of fixed width records
+
+    the file starts with a header naming the registered type and the record layout,
+    followed by the struct packed field data of each object. strings are stored
+    UTF-8 encoded and null padded. null floats are stored as nan and read back as
+    null, null strings are stored as empty strings, while null integers and booleans
+    cannot be stored
+
+    :param path: file path
+    :param objs: instances of the object type
+    :param object_type: serializable class
+    :param string_sizes: (optional) dictionary of string field name to size in bytes
+    :raises TypeError: if any object is not an instance of the object type
+    :raises ValueError: if a value cannot be stored in its field
+    :return: number of records written
+    """
+    layout = record_layout(object_type, string_sizes)
+    record = struct.Struct('<' + ''.join(code for _, code in layout))
+    names = [name for name, _ in layout]
+    get = attrgetter(*names) if len(names) > 1 else lambda obj: (getattr(obj, names[0]),)
+    convert = [_converter(code) for _, code in layout]
+    if not any(convert):
+        convert = None
+
+    count = 0
+    with open(path, 'wb') as fp:
+        header = json.dumps({
+            'type': object_type.__module__ + '.' + object_type.__name__,
+            'layout': layout,
+        }).encode('utf-8')
+        fp.write(MAGIC + _HEADER_SIZE.pack(len(header)) + header)
+        fp.write(b'\0' * _padding(len(MAGIC) + _HEADER_SIZE.size + len(header)))
+
+        buffer = bytearray()
+        for obj in objs:
+            if not isinstance(obj, object_type):
+                raise TypeError(
+                    'Object type {} is not a {}'.format(type(obj).__name__, object_type.__name__)
+                )
+            values = get(obj)
+            if convert is not None:
+                values = [v if c is None else c(v) for c, v in zip(convert, values)]
+            try:
+                buffer += record.pack(*values)
+            except struct.error as e:
+                raise ValueError('Invalid value in record {}: {}'.format(count, e)) from e
+            count += 1
+            if len(buffer) >= 65536:
+                fp.write(buffer)
+                buffer = bytearray()
+        fp.write(buffer)
+    return count
+
+
+class RecordStore(object):
+    """
+    read only store of fixed width records opened with mmap
+
+    records are accessed by index as lightweight views, which are instances of the
+    stored class that read their field data directly from the mapped file through
+    the field descriptors
+    """
+
+    def __init__(self, path, factory: Factory = None):
+        """
+        :param path: file path of records written with write_records
+        :param factory: (optional) factory to resolve the stored type, defaults to
+            the global factory
+        :raises ValueError: if the file is invalid, or the layout of the stored type
+            does not match the file
+        """
+        if factory is None:
+            factory = _global_factory
+        with open(path, 'rb') as fp:
+            self._data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._data[:len(MAGIC)] != MAGIC:
+                raise ValueError('Invalid record file {}'.format(path))
+            start = len(MAGIC) + _HEADER_SIZE.size
+            size = _HEADER_SIZE.unpack_from(self._data, len(MAGIC))[0]
+            header = json.loads(self._data[start:start + size].decode('utf-8'))
+            start += size
+            self._start = start + _padding(start)
+
+            self.object_type = factory._resolve(header['type'])
+            layout = [(name, code) for name, code in header['layout']]
+            sizes = {name: int(code[:-1]) for name, code in layout if code.endswith('s')}
+            if record_layout(self.object_type, sizes) != layout:
+                raise ValueError(
+                    'Record layout of {} does not match file {}'.format(
+                        self.object_type.__name__,
+                        path
+                    )
+                )
+            self._size = struct.calcsize('<' + ''.join(code for _, code in layout))
+            self._count = (len(self._data) - self._start) // self._size if self._size else 0
+            self._view_type = _view_type(self.object_type, layout)
+        except Exception:
+            self._data.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Record index out of range')
+        view = self._view_type.__new__(self._view_type)
+        view._collection = self
+        view._index = self._start + index * self._size  # note: views of records hold offsets
+        return view
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        close mapped file, views of this store can no longer be read
+        """
+        self._data.close()
+
+
+def _view_type(cls: Type[Serializable], layout: list) -> type:
+    """
+    get view class that reads field data of records with the given layout
+
+    :param cls: serializable class
+    :param layout: list of (field name, struct format) tuples
+    :return: view class
+    """
+    key = (cls, tuple(layout))
+    view_type = _views.get(key)
+    if view_type is None:
+        properties = {}
+        offset = 0
+        for name, code in layout:
+            properties[name] = _record_property(code, offset)
+            offset += struct.calcsize('<' + code)
+        view_type = define_view(cls, properties)
+        _views[key] = view_type
+    return view_type
+
+
+def _record_property(code: str, offset: int) -> property:
+    """
+    define read only property to access field data of a view in its mapped record
+
+    :param code: struct format of field
+    :param offset: offset of field within record
+    :return: property
+    """
+    unpack = struct.Struct('<' + code).unpack_from
+
+    if code.endswith('s'):
+        def get(view):
+            raw = unpack(view._collection._data, view._index + offset)[0]
+            return raw.rstrip(b'\0').decode('utf-8')
+    elif code == 'd':
+        def get(view):
+            value = unpack(view._collection._data, view._index + offset)[0]
+            return None if value != value else value
+    else:
+        def get(view):
+            return unpack(view._collection._data, view._index + offset)[0]
+
+    return property(get)
+
+
+def _converter(code: str):
+    """
+    get function to convert field value for record, if needed
+
+    :param code: struct format of field
+    :return: function, or None if values are packed as is
+    """
+    if code.endswith('s'):
+        return partial(_string, int(code[:-1]))
+    if code == 'd':
+        return _float
+    if code == '?':
+        return _boolean
+    return None
+
+
+def _string(size: int, value) -> bytes:
+    """
+    encode string field value for record
+
+    :param size: size of field in bytes
+    :param value: string or None
+    :raises ValueError: if the encoded string exceeds the size of the field
+    :return: UTF-8 encoded bytes
+    """
+    if value is None:
+        return b''
+    data = value.encode('utf-8')
+    if len(data) > size:
+        raise ValueError('String {!r} exceeds record field size {}'.format(value, size))
+    return data
+
+
+def _float(value) -> float:
+    """
+    convert float field value for record
+
+    :param value: number or None
+    :return: float, or nan for None
+    """
+    return float('nan') if value is None else value
+
+
+def _boolean(value) -> bool:
+    """
+    check boolean field value for record
+
+    :param value: boolean
+    :raises ValueError: if the value is not a boolean
+    :return: boolean
+    """
+    if type(value) is not bool:
+        raise ValueError('Invalid boolean value in record: {!r}'.format(value))
+    return value
+
+
+def _padding(size: int) -> int:
+    """
+    get number of bytes to pad header so that records start at 8 byte alignment
+
+    :param size: size of header
+    :return: number of padding bytes
+    """
+    return -size % 8
@@ -5,11 +5,34 @@ implements base class and metaclass for serializable objects
 """
 
 # lib
+import inspect
 from abc import ABCMeta
+from contextvars import ContextVar
+from typing import Iterable, List
+import copy
+import io
+import threading
 import marshmallow
 
 # src
-from .base import FieldABC, SerializableABC
+from .base import FieldABC, SerializableABC, is_immutable
+from .aio import iter_chunks, run_chunk
+
+# guard for creation of shared schema instances
+_schema_lock = threading.Lock()
+
+# storage of internal instance state, mangled names that field storage cannot take
+_LAZY_BODY = '_Serializable__lazy_body'
+_DIRTY = '_Serializable__dirty'
+_DUMPED = '_Serializable__dumped'
+_ITEM_TYPE = '_Serializable__item_type'
+_RESERVED = {_LAZY_BODY, _DIRTY, _DUMPED, _ITEM_TYPE}
+
+# serialization options of the current call, read by nested fields
+serialize_options = ContextVar(
+    'serialize_options',
+    default={'include_type': True, 'use_full_type': True}
+)
 
 
 class Meta(ABCMeta):
@@ -20,7 +43,15 @@ class Meta(ABCMeta):
     defining a new serializable class
     """
 
-    def __new__(mcs, name, bases, attributes, schema=None):
+    def __new__(
+            mcs,
+            name,
+            bases,
+            attributes,
+            schema=None,
+            slots=False,
+            track_changes=False
+    ):
         """
         define a new serializable object class, collect and register all field descriptors,
         construct marshmallow schema
@@ -29,8 +60,28 @@ class Meta(ABCMeta):
         :param bases: list of base classes to inherit from
         :param attributes: dictionary of class attributes
         :param schema: (optional) predefined marshmallow schema
+        :param slots: (optional) if true, store field data in slots instead of instance dict
+        :param track_changes: (optional) if true, record field writes and serialize
+            incrementally, this is inherited by subclasses
+        :raises ValueError: if a field would be stored under a reserved name
         :return: newly defined class
         """
+        for attr_name, attr in attributes.items():
+            if isinstance(attr, FieldABC) and '_' + attr_name in _RESERVED:
+                raise ValueError('Field name {} of {} is reserved'.format(attr_name, name))
+
+        tracked = track_changes or any(getattr(base, '_tracked', False) for base in bases)
+        if slots and '__slots__' not in attributes:
+            # define slot storage for each field not already stored in a parent slot
+            attributes = dict(attributes)
+            attributes['__slots__'] = tuple(
+                '_' + attr_name for attr_name, attr in attributes.items()
+                if isinstance(attr, FieldABC)
+                and not any(hasattr(base, '_' + attr_name) for base in bases)
+            )
+            if tracked and not any(hasattr(base, _DIRTY) for base in bases):
+                attributes['__slots__'] += (_DIRTY, _DUMPED)
+
         obj = ABCMeta.__new__(mcs, name, bases, attributes)
 
         # init and collect serializable fields of parents
@@ -47,7 +98,8 @@ class Meta(ABCMeta):
                 fields[attr_name] = attr
 
         # generate marshmallow schema
-        if schema is None:
+        custom = schema is not None
+        if not custom:
             marsh_fields = {
                 attr_name: attr.marshmallow()
                 for attr_name, attr in fields.items()
@@ -60,6 +112,24 @@ class Meta(ABCMeta):
         # set fields and schema
         setattr(obj, '_fields', fields)
         setattr(obj, '_schema', schema)
+        setattr(obj, '_schema_cache', {})
+        setattr(obj, '_deserializers', {})
+        setattr(obj, '_tracked', tracked)
+
+        # specialized serializer and deserializer are generated lazily on first use,
+        # user supplied schemas are always handled by marshmallow
+        if custom:
+            setattr(obj, '_serializer', obj._marshmallow_serialize)
+        elif tracked:
+            setattr(obj, '_serializer', obj._incremental_serialize)
+        else:
+            setattr(obj, '_serializer', None)
+        setattr(obj, '_deserializer', obj._marshmallow_deserialize if custom else None)
+        setattr(obj, '_deserialize_options', None)
+        setattr(obj, '_json_encoder', None)
+        setattr(obj, '_binary_dumper', None)
+        setattr(obj, '_row_dumper', None)
+        setattr(obj, '_row_loader', None)
         return obj
 
 
@@ -67,8 +137,19 @@ class Serializable(SerializableABC, metaclass=Meta, schema=None):
     """
     base class for serializable objects
     """
+    __slots__ = ('__lazy_body',)
     _fields = None
     _schema = None
+    _schema_cache = None
+    _deserializers = None
+    _tracked = False
+    _serializer = None
+    _deserializer = None
+    _json_encoder = None
+    _binary_dumper = None
+    _deserialize_options = None
+    _row_dumper = None
+    _row_loader = None
 
     @classmethod
     def from_kwargs(cls, **kwargs):
@@ -98,13 +179,382 @@ class Serializable(SerializableABC, metaclass=Meta, schema=None):
 
         return obj
 
-    def serialize(self, include_type: bool = True, use_full_type: bool = True) -> dict:
-        self._serialize_kwargs = {
+    @classmethod
+    def from_columns(cls, columns: dict) -> list:
+        """
+        constructor to create many instances from typed columns of field data
+
+        :param columns: dictionary of field name to NumPy array, array.array, or sequence
+        :return: list of new instances of serializable object
+        """
+        from .columns import from_columns  # note: deferred to avoid circular import
+        return from_columns(cls, columns)
+
+    @classmethod
+    def new_many(cls, count: int) -> list:
+        """
+        constructor to create many instances with all field defaults populated
+
+        :param count: number of instances
+        :return: list of new instances of serializable object
+        """
+        defaults = [
+            (attr, attr._default, attr._default_factory)
+            for attr in cls._fields.values()
+        ]
+        objs = [cls() for _ in range(count)]
+        for obj in objs:
+            for attr, default, factory in defaults:
+                attr.__set__(obj, default if factory is None else factory())
+        return objs
+
+    @classmethod
+    def _load_many(
+            cls,
+            bodies: list,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = True
+    ) -> list:
+        """
+        create and deserialize many instances of this class
+
+        :param bodies: serialized data for each instance
+        :param only: (optional) names of fields to load
+        :param exclude: (optional) names of fields to skip
+        :param validate: (optional) if false, trust data and skip validation
+        :return: list of new instances
+        """
+        objs = [cls() for _ in bodies]
+        default = only is None and exclude is None and validate
+        if cls.deserialize is Serializable.deserialize:
+            if default:
+                deserializer = cls._deserializer
+                if deserializer is None:
+                    deserializer = cls._compile_deserializer()
+            else:
+                deserializer = cls._get_deserializer(only, exclude, validate)
+            for obj, body in zip(objs, bodies):
+                deserializer(obj, body)
+        elif not default and cls._accepts_options():
+            for obj, body in zip(objs, bodies):
+                obj.deserialize(body, only=only, exclude=exclude, validate=validate)
+        else:
+            for obj, body in zip(objs, bodies):
+                obj.deserialize(body)
+        return objs
+
+    @classmethod
+    def _dump_many(cls, objs: list, include_type: bool, use_full_type: bool) -> list:
+        """
+        serialize many instances of this class
+
+        :param objs: instances of this class
+        :param include_type: if true, type information will be included in body
+        :param use_full_type: if true, the fully qualified path with be specified in body
+        :return: list of serialized objects as dict
+        """
+        if cls.serialize is not Serializable.serialize:
+            return [obj.serialize(include_type, use_full_type) for obj in objs]
+        serializer = cls._serializer
+        if serializer is None:
+            serializer = cls._compile_serializer()
+        return [serializer(obj, include_type, use_full_type) for obj in objs]
+
+    def materialize(self):
+        """
+        load and validate all remaining fields of a lazily created object
+
+        :return: this object
+        """
+        body = getattr(self, _LAZY_BODY, None)
+        if body is None:
+            return self
+
+        # validate complete body at once, then fill in any fields not yet accessed
+        loaded = type(self)()
+        loaded.deserialize(body)
+        for attr in self._fields.values():
+            try:
+                getattr(self, attr._attr_key)
+            except AttributeError:
+                attr.__set__(self, attr.__get__(loaded, type(self)))
+        self.__lazy_body = None
+        return self
+
+    def _load_field(self, attr, body: dict):
+        """
+        load single field from raw body of lazily created object
+
+        :param attr: field descriptor
+        :param body: raw serialized data
+        :raises ValidationError: if the field data is invalid
+        :return: deserialized value, or marshmallow.missing if not in body
+        """
+        name = attr._attr_key[1:]
+        mfield = self._get_schema().fields.get(name)
+        if mfield is None:
+            return marshmallow.missing
+        key = mfield.data_key if mfield.data_key is not None else name
+        try:
+            return mfield.deserialize(body.get(key, marshmallow.missing), key, body)
+        except marshmallow.ValidationError as e:
+            raise marshmallow.ValidationError({key: e.messages}) from e
+
+    def dirty_fields(self) -> set:
+        """
+        get names of fields changed since this object was last serialized
+
+        fields are changed when they are set, or when a nested object they hold has
+        changed fields. in place changes to lists and other mutable values are not
+        recorded
+
+        :raises TypeError: if change tracking is not enabled for this class
+        :return: set of field names
+        """
+        if not self._tracked:
+            raise TypeError(
+                'Change tracking is not enabled for {}'.format(type(self).__name__)
+            )
+        dirty = set(getattr(self, _DIRTY, ()))
+        for name, attr in self._fields.items():
+            if name in dirty:
+                continue
+            value = getattr(self, name)
+            if isinstance(value, list):
+                if any(_is_dirty(item) for item in value):
+                    dirty.add(name)
+            elif _is_dirty(value):
+                dirty.add(name)
+        return dirty
+
+    def _mark_dirty(self, name: str):
+        """
+        record write to field of tracked object
+
+        :param name: field name
+        """
+        try:
+            self.__dirty.add(name)
+        except AttributeError:
+            self.__dirty = {name}
+
+    def _incremental_serialize(self, include_type: bool = True, use_full_type: bool = True):
+        """
+        serialize tracked object, reusing the previous output for unchanged fields
+
+        the cached body is copied, so that changes to the output do not affect
+        later serialization
+
+        :param include_type: if true, type information will be included in body
+        :param use_full_type: if true, the fully qualified path with be specified in body
+        :return: serialized object as dict
+        """
+        return _copy_body(self._dump_cached(include_type, use_full_type))
+
+    def _dump_cached(self, include_type: bool, use_full_type: bool) -> dict:
+        """
+        get cached body of tracked object, re-encoding only changed fields
+
+        unchanged values are reused when they are immutable, or are tracked nested
+        objects which return the same cached body. the returned body shares these
+        subtrees with the cache and must not be modified
+
+        :param include_type: if true, type information will be included in body
+        :param use_full_type: if true, the fully qualified path with be specified in body
+        :return: cached serialized object as dict
+        """
+        from .nested import NestedFactoryField  # note: deferred to avoid circular import
+        options = (include_type, use_full_type)
+        dirty = getattr(self, _DIRTY, None)
+        dumped = getattr(self, _DUMPED, None)
+        cached = None if dumped is None else dumped.get(options)
+        schema = self._get_schema()
+
+        body = None
+        token = serialize_options.set({
             'include_type': include_type,
             'use_full_type': use_full_type
-        }
+        })
+        try:
+            for name, attr in self._fields.items():
+                key = attr._key
+                value = getattr(self, name)
+                mfield = schema.fields[name]
+                kind = type(mfield)
+                if kind is NestedFactoryField and _is_tracked(value):
+                    encoded = value._dump_cached(include_type, use_full_type)
+                elif kind is marshmallow.fields.List \
+                        and type(mfield.inner) is NestedFactoryField \
+                        and type(value) is list \
+                        and all(_is_tracked(item) for item in value):
+                    encoded = [item._dump_cached(include_type, use_full_type) for item in value]
+                    if cached is not None and dirty is not None and name not in dirty:
+                        previous = cached[key]
+                        if len(previous) == len(encoded) \
+                                and all(a is b for a, b in zip(previous, encoded)):
+                            continue
+                elif cached is not None and (dirty is None or name not in dirty) \
+                        and is_immutable(value):
+                    continue
+                else:
+                    encoded = mfield.serialize(name, self)
+                if cached is not None and cached[key] is encoded:
+                    continue
+                if body is None:
+                    body = {} if cached is None else dict(cached)
+                body[key] = encoded
+        finally:
+            serialize_options.reset(token)
+
+        if body is None:
+            body = cached
+        elif cached is None and include_type:
+            if use_full_type:
+                body['_type'] = self.__class__.__module__ + '.' + self.__class__.__name__
+            else:
+                body['_type'] = self.__class__.__name__
+
+        # changed fields are cleared, so output for other options can no longer be reused
+        if dirty or dumped is None:
+            self.__dumped = {options: body}
+        else:
+            dumped[options] = body
+        if dirty:
+            dirty.clear()
+        return body
+
+    def serialize(self, include_type: bool = True, use_full_type: bool = True) -> dict:
+        serializer = type(self)._serializer
+        if serializer is None:
+            serializer = type(self)._compile_serializer()
+        return serializer(self, include_type, use_full_type)
+
+    def to_json(self, include_type: bool = True, use_full_type: bool = True) -> bytes:
+        """
+        serialize model directly to JSON
+
+        :param include_type: if true, type information will be included in body
+        :param use_full_type: if true, the fully qualified path with be specified in body
+        :return: UTF-8 encoded JSON
+        """
+        return self._to_json_text(include_type, use_full_type).encode('utf-8')
+
+    def _to_json_text(self, include_type: bool = True, use_full_type: bool = True) -> str:
+        """
+        serialize model directly to JSON text with specialized encoder
+
+        :param include_type: if true, type information will be included in body
+        :param use_full_type: if true, the fully qualified path with be specified in body
+        :return: JSON text
+        """
+        encoder = type(self)._json_encoder
+        if encoder is None:
+            encoder = type(self)._compile_json_encoder()
+        return encoder(self, include_type, use_full_type)
+
+    @classmethod
+    def _compile_json_encoder(cls):
+        """
+        generate and store specialized JSON encoder for this class
+
+        :return: compiled encoder
+        """
+        from .codegen import compile_json_encoder  # note: deferred to avoid circular import
+        cls._json_encoder = compile_json_encoder(cls)
+        return cls._json_encoder
+
+    @classmethod
+    def _compile_binary_dumper(cls):
+        """
+        generate and store function to dump field values for binary encoding
+
+        :return: compiled dumper
+        """
+        from .codegen import compile_binary_dumper  # note: deferred to avoid circular import
+        cls._binary_dumper = compile_binary_dumper(cls)
+        return cls._binary_dumper
+
+    @classmethod
+    def _compile_row_dumper(cls):
+        """
+        generate and store function to dump field data as a compact row
+
+        :return: compiled dumper
+        """
+        from .codegen import compile_row_dumper  # note: deferred to avoid circular import
+        cls._row_dumper = compile_row_dumper(cls)
+        return cls._row_dumper
+
+    @classmethod
+    def _compile_row_loader(cls):
+        """
+        generate and store function to create an instance from a compact row
+
+        :return: compiled loader
+        """
+        from .codegen import compile_row_loader  # note: deferred to avoid circular import
+        cls._row_loader = compile_row_loader(cls)
+        return cls._row_loader
+
+    @classmethod
+    def _binary_keys(cls) -> list:
+        """
+        get serialized keys of fields in the order of binary encoded values
+
+        :return: list of keys
+        """
+        return [attr._key for attr in cls._fields.values()]
+
+    @classmethod
+    def _get_schema(cls, **kwargs) -> marshmallow.Schema:
+        """
+        get marshmallow schema instance shared by all instances of this class
+
+        :param kwargs: (optional) hashable options for schema construction
+        :return: cached schema instance for the given options
+        """
+        key = tuple(sorted(kwargs.items()))
+        schema = cls._schema_cache.get(key)
+        if schema is None:
+            with _schema_lock:
+                schema = cls._schema_cache.get(key)
+                if schema is None:
+                    schema = cls._schema(**kwargs)
+                    cls._schema_cache[key] = schema
+        return schema
+
+    @classmethod
+    def _compile_serializer(cls):
+        """
+        generate and store specialized serializer for this class
+
+        :return: compiled serializer
+        """
+        from .codegen import compile_serializer  # note: deferred to avoid circular import
+        cls._serializer = compile_serializer(cls)
+        return cls._serializer
 
-        body = self._schema().dump(self)
+    def _marshmallow_serialize(
+            self,
+            include_type: bool = True,
+            use_full_type: bool = True
+    ) -> dict:
+        """
+        serialize model to dictionary with marshmallow schema
+
+        :param include_type: if true, type information will be included in body
+        :param use_full_type: if true, the fully qualified path with be specified in body
+        :return: serialized object as dict
+        """
+        token = serialize_options.set({
+            'include_type': include_type,
+            'use_full_type': use_full_type
+        })
+        try:
+            body = self._get_schema().dump(self)
+        finally:
+            serialize_options.reset(token)
         if include_type:
             if use_full_type:
                 body['_type'] = self.__class__.__module__ + '.' + self.__class__.__name__
@@ -112,11 +562,447 @@ class Serializable(SerializableABC, metaclass=Meta, schema=None):
                 body['_type'] = self.__class__.__name__
         return body
 
-    def deserialize(self, body: dict):
-        data = self._schema().load(body, unknown=marshmallow.EXCLUDE)
+    def deserialize(
+            self,
+            body: dict,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = True
+    ):
+        """
+        deserialize model from dictionary
+
+        :param body: serialized data to load into object
+        :param only: (optional) names of fields to load, dotted paths select fields
+            of nested objects
+        :param exclude: (optional) names of fields to skip, dotted paths skip fields
+            of nested objects
+        :param validate: (optional) if false, trust data and assign values without
+            coercion or checks for required and null data
+        """
+        if only is None and exclude is None and validate:
+            deserializer = type(self)._deserializer
+            if deserializer is None:
+                deserializer = type(self)._compile_deserializer()
+        else:
+            deserializer = type(self)._get_deserializer(only, exclude, validate)
+        deserializer(self, body)
+
+    @classmethod
+    def _accepts_options(cls) -> bool:
+        """
+        check whether deserialize of this class accepts projection and validation options
+
+        :return: true if options can be passed to deserialize
+        """
+        accepts = cls._deserialize_options
+        if accepts is None:
+            parameters = inspect.signature(cls.deserialize).parameters.values()
+            names = {p.name for p in parameters}
+            accepts = any(p.kind is p.VAR_KEYWORD for p in parameters) \
+                or {'only', 'exclude', 'validate'} <= names
+            cls._deserialize_options = accepts
+        return accepts
+
+    def _deserialize(
+            self,
+            body: dict,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = True
+    ):
+        """
+        deserialize model from dictionary, passing options only if deserialize accepts them
+
+        user defined deserialize without options loads all fields with validation
+
+        :param body: serialized data to load into object
+        :param only: (optional) names of fields to load
+        :param exclude: (optional) names of fields to skip
+        :param validate: (optional) if false, trust data and skip validation
+        """
+        if (only is None and exclude is None and validate) or not type(self)._accepts_options():
+            self.deserialize(body)
+        else:
+            self.deserialize(body, only=only, exclude=exclude, validate=validate)
+
+    @classmethod
+    def _compile_deserializer(cls):
+        """
+        generate and store specialized deserializer for this class
+
+        :return: compiled deserializer
+        """
+        from .codegen import compile_deserializer  # note: deferred to avoid circular import
+        cls._deserializer = compile_deserializer(cls)
+        return cls._deserializer
+
+    @classmethod
+    def _get_deserializer(
+            cls,
+            only: Iterable[str] = None,
+            exclude: Iterable[str] = None,
+            validate: bool = True
+    ):
+        """
+        get deserializer that only loads the selected fields of this class
+
+        fields that are not selected are never read from the body. nested paths are
+        passed down to the nested fields, so unselected subtrees are skipped as well
+
+        :param only: (optional) names of fields to load
+        :param exclude: (optional) names of fields to skip
+        :param validate: (optional) if false, trust data and skip validation,
+            user supplied schemas are always validated
+        :raises ValueError: if a name does not refer to a field
+        :return: function(obj, body)
+        """
+        if only is not None:
+            only = tuple(sorted(set(only)))
+        if exclude is not None:
+            exclude = tuple(sorted(set(exclude)))
+        key = (only, exclude, validate)
+        deserializer = cls._deserializers.get(key)
+        if deserializer is not None:
+            return deserializer
+
+        if cls._deserializer is cls._marshmallow_deserialize:
+            # user supplied schemas are projected by marshmallow
+            schema = cls._get_schema(only=only, exclude=exclude or ())
+
+            def deserializer(obj, body):
+                obj._marshmallow_deserialize(body, schema=schema)
+        else:
+            # note: deferred to avoid circular import
+            from .codegen import compile_deserializer, compile_trusted_deserializer
+            schema = None
+            if only is not None or exclude is not None:
+                schema = cls._project_schema(only, exclude)
+            if validate:
+                deserializer = compile_deserializer(cls, schema=schema)
+            else:
+                deserializer = compile_trusted_deserializer(cls, schema=schema)
+
+        return cls._deserializers.setdefault(key, deserializer)
+
+    @classmethod
+    def _project_schema(cls, only: tuple = None, exclude: tuple = None) -> marshmallow.Schema:
+        """
+        construct marshmallow schema with the selected fields of this class
+
+        :param only: (optional) names of fields to load
+        :param exclude: (optional) names of fields to skip
+        :raises ValueError: if a name does not refer to a field
+        :return: schema instance
+        """
+        only_paths = _split_paths(only)
+        exclude_paths = _split_paths(exclude)
+        invalid = set(only_paths or ()).union(exclude_paths or ()).difference(cls._fields)
+        if invalid:
+            raise ValueError(
+                'Invalid fields for {}: {}'.format(cls.__name__, ', '.join(sorted(invalid)))
+            )
+
+        marsh_fields = {}
+        for name, mfield in cls._schema._declared_fields.items():
+            if only_paths is not None and name not in only_paths:
+                continue
+            sub_only = None if only_paths is None else only_paths[name]
+            sub_exclude = () if exclude_paths is None else exclude_paths.get(name, ())
+            if sub_exclude is None:
+                continue
+            if sub_only is not None or sub_exclude:
+                mfield = _project_field(mfield, sub_only, sub_exclude or None)
+                if mfield is None:
+                    raise ValueError(
+                        'Nested paths are not supported for field {} of {}'.format(
+                            name, cls.__name__
+                        )
+                    )
+            marsh_fields[name] = mfield
+
+        schema = marshmallow.Schema.from_dict(
+            marsh_fields,
+            name='_{}Schema'.format(cls.__name__)
+        )
+        return schema()
+
+    def _marshmallow_deserialize(self, body: dict, schema: marshmallow.Schema = None):
+        """
+        deserialize model from dictionary with marshmallow schema
+
+        :param body: serialized data to load into object
+        :param schema: (optional) schema instance to load with instead of the class schema
+        """
+        if schema is None:
+            schema = self._get_schema()
+        data = schema.load(body, unknown=marshmallow.EXCLUDE)
         for name, attr in self._fields.items():
             if attr._key not in body:
                 continue
             if name not in data:
                 continue
             setattr(self, name, data[name])
+
+
+def _is_tracked(value) -> bool:
+    """
+    check whether value is a nested object that can reuse its cached output
+
+    :param value: any value
+    :return: true if value is a tracked serializable object with default serialization
+    """
+    return isinstance(value, Serializable) \
+        and type(value)._serializer is Serializable._incremental_serialize \
+        and type(value).serialize is Serializable.serialize
+
+
+def _copy_body(value):
+    """
+    copy dictionaries and lists of serialized data, sharing other values
+
+    :param value: serialized data
+    :return: copy of serialized data
+    """
+    if type(value) is dict:
+        return {key: _copy_body(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_body(item) for item in value]
+    return value
+
+
+def _is_dirty(value) -> bool:
+    """
+    check whether value is a tracked nested object with changed fields
+
+    :param value: any value
+    :return: true if value has changed fields
+    """
+    return isinstance(value, Serializable) and value._tracked and bool(value.dirty_fields())
+
+
+def _split_paths(paths: tuple = None) -> dict:
+    """
+    group dotted field paths by their first name
+
+    :param paths: (optional) dotted field paths
+    :return: dictionary of name to remaining nested paths, or None if the whole
+        field is selected, or None if no paths are specified
+    """
+    if paths is None:
+        return None
+    split = {}
+    for path in paths:
+        name, _, rest = path.partition('.')
+        if not rest:
+            split[name] = None
+        elif name not in split:
+            split[name] = [rest]
+        elif split[name] is not None:
+            split[name].append(rest)
+    return {name: None if rest is None else tuple(rest) for name, rest in split.items()}
+
+
+def _project_field(mfield, only: tuple = None, exclude: tuple = None):
+    """
+    copy nested marshmallow field to load only the selected fields of nested objects
+
+    :param mfield: marshmallow field
+    :param only: (optional) names of nested fields to load
+    :param exclude: (optional) names of nested fields to skip
+    :return: projected marshmallow field, or None if the field does not hold nested objects
+    """
+    from .nested import NestedFactoryField  # note: deferred to avoid circular import
+    if isinstance(mfield, NestedFactoryField):
+        projected = copy.copy(mfield)
+        projected._only = only
+        projected._exclude = exclude
+        projected._trusted = None
+        return projected
+    if isinstance(mfield, marshmallow.fields.List) \
+            and isinstance(mfield.inner, NestedFactoryField):
+        projected = copy.copy(mfield)
+        projected.inner = _project_field(mfield.inner, only, exclude)
+        return projected
+    return None
+
+
+def serialize_many(
+        objs: Iterable[Serializable],
+        include_type: bool = True,
+        use_full_type: bool = True
+) -> List[dict]:
+    """
+    serialize a sequence of objects to dictionaries
+
+    objects are grouped by class so that each class is dumped together in one pass,
+    and collections are dumped directly from their arrays
+
+    :param objs: serializable objects
+    :param include_type: if true, type information will be included in each body
+    :param use_full_type: if true, the fully qualified path with be specified in each body
+    :return: list of serialized objects as dict in input order
+    """
+    from .collection import Collection  # note: deferred to avoid circular import
+    if isinstance(objs, Collection):
+        return objs.serialize(include_type, use_full_type)
+    objs = list(objs)
+
+    # group objects by class
+    groups = {}
+    for i, obj in enumerate(objs):
+        groups.setdefault(type(obj), []).append(i)
+
+    # dump each group
+    bodies = [None] * len(objs)
+    for cls, indices in groups.items():
+        group = cls._dump_many([objs[i] for i in indices], include_type, use_full_type)
+        for i, body in zip(indices, group):
+            bodies[i] = body
+    return bodies
+
+
+def dump_stream(
+        objs: Iterable[Serializable],
+        fp,
+        format: str = 'jsonl',
+        include_type: bool = True,
+        use_full_type: bool = True,
+        buffer_size: int = 65536
+) -> int:
+    """
+    incrementally serialize objects and write them to a stream as JSON
+
+    each object is serialized and encoded on its own, and encoded data is written
+    whenever the buffer exceeds the specified size, so memory use stays constant
+    for any number of objects
+
+    :param objs: iterable of serializable objects
+    :param fp: writable text or binary file object, objects that are not text files
+        and have no text mode are written UTF-8 encoded bytes
+    :param format: (optional) 'jsonl' for one object per line, or 'json-array'
+        for a single JSON array
+    :param include_type: if true, type information will be included in each body
+    :param use_full_type: if true, the fully qualified path with be specified in each body
+    :param buffer_size: (optional) number of characters to buffer before writing
+    :raises ValueError: if the format is not supported
+    :return: number of objects written
+    """
+    start, separator, end = _stream_delimiters(format)
+    # note: files are text only if they say so, any other writer receives UTF-8 bytes
+    mode = getattr(fp, 'mode', None)
+    binary = not isinstance(fp, io.TextIOBase) and not (isinstance(mode, str) and 'b' not in mode)
+
+    def write(pieces):
+        data = ''.join(pieces)
+        fp.write(data.encode('utf-8') if binary else data)
+
+    count = 0
+    pieces = [start]
+    size = len(start)
+    for obj in objs:
+        if count:
+            pieces.append(separator)
+        encoded = obj._to_json_text(include_type, use_full_type)
+        pieces.append(encoded)
+        size += len(encoded)
+        count += 1
+        if size >= buffer_size:
+            write(pieces)
+            pieces = []
+            size = 0
+    if count or format == 'json-array':
+        pieces.append(end)
+    write(pieces)
+    return count
+
+
+async def adump_stream(
+        objs,
+        writer,
+        format: str = 'jsonl',
+        include_type: bool = True,
+        use_full_type: bool = True,
+        chunk_size: int = 1000,
+        executor=None
+) -> int:
+    """
+    asynchronously serialize objects and write them to a stream as UTF-8 encoded JSON
+
+    objects are encoded in chunks, and control is returned to the event loop after
+    each chunk is encoded so that other tasks are not blocked during bulk writes
+
+    :param objs: iterable or async iterable of serializable objects
+    :param writer: asyncio stream writer, or any object with a write method that
+        accepts bytes and may return an awaitable, and an optional async drain method
+    :param format: (optional) 'jsonl' for one object per line, or 'json-array'
+        for a single JSON array
+    :param include_type: if true, type information will be included in each body
+    :param use_full_type: if true, the fully qualified path with be specified in each body
+    :param chunk_size: (optional) maximum number of objects to encode at once
+    :param executor: (optional) executor to encode chunks in
+    :raises ValueError: if the format is not supported
+    :return: number of objects written
+    """
+    start, separator, end = _stream_delimiters(format)
+
+    async def write(data: str):
+        result = writer.write(data.encode('utf-8'))
+        if inspect.isawaitable(result):
+            await result
+        drain = getattr(writer, 'drain', None)
+        if drain is not None:
+            await drain()
+
+    count = 0
+    pending = start
+    async for chunk in iter_chunks(objs, chunk_size):
+        encoded = await run_chunk(
+            executor,
+            _encode_chunk,
+            chunk,
+            separator,
+            include_type,
+            use_full_type
+        )
+        await write(pending + (separator if count else '') + encoded)
+        pending = ''
+        count += len(chunk)
+    if count or format == 'json-array':
+        pending += end
+    if pending:
+        await write(pending)
+    return count
+
+
+def _encode_chunk(
+        objs: list,
+        separator: str,
+        include_type: bool = True,
+        use_full_type: bool = True
+) -> str:
+    """
+    encode chunk of objects as JSON
+
+    :param objs: serializable objects
+    :param separator: separator between encoded objects
+    :param include_type: if true, type information will be included in each body
+    :param use_full_type: if true, the fully qualified path with be specified in each body
+    :return: JSON text
+    """
+    return separator.join(obj._to_json_text(include_type, use_full_type) for obj in objs)
+
+
+def _stream_delimiters(format: str) -> tuple:
+    """
+    get delimiters of stream format
+
+    :param format: 'jsonl' or 'json-array'
+    :raises ValueError: if the format is not supported
+    :return: tuple of start, separator, and end of stream
+    """
+    if format == 'jsonl':
+        return '', '\n', '\n'
+    if format == 'json-array':
+        return '[', ', ', ']'
+    raise ValueError('Invalid stream format: {}'.format(format))
@@ -12,13 +12,18 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type='text/markdown',
     url='https://github.com/devinaconley/py-object-factory',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=('benchmarks', 'benchmarks.*')),
     classifiers=(
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ),
+    python_requires='>=3.7',
     install_requires=[
         'marshmallow>=3,<4',
-    ]
+    ],
+    extras_require={
+        'fast': ['orjson'],
+        'columns': ['numpy'],
+    }
 )
@@ -0,0 +1,139 @@
+"""
+module for testing asyncio create and serialize
+"""
+
+# lib
+import io
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+# src
+import objectfactory
+from .testmodule.testclasses import MyBasicClass, MyComplexClass
+
+
+async def agen(items):
+    """
+    async iterable of items
+
+    :param items: items to yield
+    :return: async generator
+    """
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+class MyWriter(object):
+    """
+    writer with async drain for testing
+    """
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.writes = 0
+
+    def write(self, data: bytes):
+        self.buffer.write(data)
+        self.writes += 1
+
+    async def drain(self):
+        await asyncio.sleep(0)
+
+
+def make_bodies(count: int) -> list:
+    """
+    create serialized bodies
+
+    :param count: number of bodies
+    :return: list of bodies
+    """
+    return [
+        {'_type': 'MyBasicClass', 'str_prop': str(i), 'int_prop': i}
+        for i in range(count)
+    ]
+
+
+class TestAsync(object):
+    """
+    test case for asyncio create and serialize
+    """
+
+    def test_acreate(self):
+        """
+        test asynchronous creation from dictionaries and JSON
+
+        expect objects in input order for sync and async sources, and with an executor
+        """
+        bodies = make_bodies(25)
+        items = bodies[:10] + [json.dumps(b) for b in bodies[10:20]] \
+            + [json.dumps(b).encode('utf-8') for b in bodies[20:]]
+
+        async def collect(source, **kwargs):
+            return [obj async for obj in objectfactory.acreate(source, **kwargs)]
+
+        for source in (items, agen(items)):
+            objs = asyncio.run(collect(source, chunk_size=4))
+            assert [obj.int_prop for obj in objs] == list(range(25))
+            assert all(isinstance(obj, MyBasicClass) for obj in objs)
+
+        with ThreadPoolExecutor(2) as executor:
+            objs = asyncio.run(collect(items, executor=executor, validate=False))
+        assert [obj.str_prop for obj in objs] == [str(i) for i in range(25)]
+
+        with pytest.raises(TypeError):
+            asyncio.run(collect(items, object_type=MyComplexClass))
+        with pytest.raises(ValueError):
+            asyncio.run(collect(items, chunk_size=0))
+
+    def test_yields(self):
+        """
+        test control of event loop during creation
+
+        expect other tasks to run between chunks
+        """
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def run():
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            counts = []
+            async for _ in objectfactory.acreate(make_bodies(100), chunk_size=10):
+                counts.append(len(ticks))
+            task.cancel()
+            return counts
+
+        counts = asyncio.run(run())
+        assert len(set(counts)) >= 10
+
+    def test_adump_stream(self):
+        """
+        test asynchronous writing of objects
+
+        expect output identical to synchronous stream, written in chunks
+        """
+        objs = objectfactory.create_many(make_bodies(7))
+        for format in ('jsonl', 'json-array'):
+            expected = io.BytesIO()
+            objectfactory.dump_stream(objs, expected, format=format)
+
+            writer = MyWriter()
+            count = asyncio.run(objectfactory.adump_stream(
+                agen(objs), writer, format=format, chunk_size=3
+            ))
+            assert count == 7
+            assert writer.buffer.getvalue() == expected.getvalue()
+            assert writer.writes >= 3
+
+        writer = MyWriter()
+        with ThreadPoolExecutor(1) as executor:
+            asyncio.run(objectfactory.adump_stream([], writer, format='json-array',
+                                                   executor=executor))
+        assert writer.buffer.getvalue() == b'[]'
@@ -0,0 +1,66 @@
+"""
+module for testing benchmark runner
+"""
+
+# lib
+import pytest
+
+# src
+from benchmarks import runner
+from benchmarks.__main__ import main
+from benchmarks.scenarios import SCENARIOS
+
+
+class TestBenchmarks(object):
+    """
+    test case for benchmark runner
+    """
+
+    def test_scenarios(self):
+        """
+        test setup and operation of each scenario
+
+        expect every operation to run without error
+        """
+        for setup in SCENARIOS.values():
+            setup()()
+
+    def test_run(self):
+        """
+        test measurement of selected scenarios
+
+        expect throughput and allocations for each selected scenario
+        """
+        results = runner.run(['flat', 'nested.create'], min_time=0.001, repeat=1)
+
+        assert list(results) == ['flat.create', 'flat.serialize', 'flat.create_many',
+                                 'nested.create']
+        assert all(r['ops'] > 0 and r['blocks'] >= 0 for r in results.values())
+        with pytest.raises(ValueError):
+            runner.run(['unknown'])
+
+    def test_compare(self, tmp_path, capsys):
+        """
+        test comparison against a saved baseline
+
+        expect regressions beyond the tolerance to be reported with a failing status
+        """
+        baseline = {'a': {'ops': 100.0}, 'b': {'ops': 100.0}}
+        results = {'a': {'ops': 95.0}, 'b': {'ops': 50.0}, 'c': {'ops': 1.0}}
+        changes = runner.compare(results, baseline, tolerance=0.1)
+        assert [(name, regressed) for name, _, regressed in changes] == [
+            ('a', False),
+            ('b', True),
+        ]
+        assert changes[0][1] == pytest.approx(-0.05)
+
+        path = tmp_path / 'baseline.json'
+        args = ['flat.create', '--min-time', '0.001', '--repeat', '1']
+        assert main(args + ['--save', str(path)]) == 0
+        assert list(runner.load(path)) == ['flat.create']
+
+        results = runner.load(path)
+        results['flat.create']['ops'] *= 1000
+        runner.save(path, results)
+        assert main(args + ['--compare', str(path)]) == 1
+        assert 'regressed: flat.create' in capsys.readouterr().out
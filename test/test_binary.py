@@ -0,0 +1,137 @@
+"""
+module for testing compact binary encoding
+"""
+
+# lib
+import json
+import pytest
+
+# src
+import objectfactory
+from objectfactory import Factory, Serializable, Nested, List, Integer, String, Float, Boolean
+from objectfactory import register
+from .testmodule.testclasses import MyComplexClass, MyBasicClass
+
+
+@register
+class MyBinaryLeafClass(Serializable):
+    """
+    leaf class for testing binary encoding
+    """
+    int_prop = Integer()
+    str_prop = String(key='str')
+
+
+@register
+class MyBinaryClass(Serializable):
+    """
+    class for testing binary encoding
+    """
+    int_prop = Integer()
+    float_prop = Float()
+    bool_prop = Boolean()
+    str_prop = String()
+    nested = Nested(field_type=MyBinaryLeafClass)
+    nested_list = List(field_type=MyBinaryLeafClass)
+    int_list = List(field_type=Integer)
+
+
+def make_factory():
+    """
+    create factory with classes for testing binary encoding
+
+    :return: factory
+    """
+    factory = Factory('binary')
+    factory.register(MyBinaryLeafClass)
+    factory.register(MyBinaryClass)
+    return factory
+
+
+class TestBinary(object):
+    """
+    test case for compact binary encoding
+    """
+
+    def test_round_trip(self):
+        """
+        test binary encoding and decoding
+
+        expect decoded object to be equivalent to the original, and the encoded
+        data to be smaller than JSON
+        """
+        factory = make_factory()
+        obj = MyBinaryClass.from_kwargs(
+            int_prop=-5,
+            float_prop=1.5,
+            bool_prop=True,
+            str_prop='ü' * 40,
+            nested=MyBinaryLeafClass.from_kwargs(int_prop=1, str_prop='a'),
+            nested_list=[MyBinaryLeafClass.from_kwargs(int_prop=i) for i in range(20)],
+            int_list=[0, 200, -200, 70000, -70000, 2 ** 40, -2 ** 40, 2 ** 64 - 1]
+        )
+        data = factory.serialize_binary(obj)
+        result = factory.create_binary(data, object_type=MyBinaryClass)
+
+        assert isinstance(result, MyBinaryClass)
+        assert isinstance(result.nested_list[3], MyBinaryLeafClass)
+        assert result.serialize() == obj.serialize()
+        assert factory.create_binary(data, validate=False).serialize() == obj.serialize()
+        assert len(data) < len(json.dumps(obj.serialize()))
+
+    def test_manifest(self):
+        """
+        test alignment of type ids between factories
+
+        expect data to be decoded by a factory with a different registration order
+        after loading the manifest of the encoding factory
+        """
+        factory = make_factory()
+        other = Factory('other')
+        other.register(MyBinaryClass)
+        other.register(MyBinaryLeafClass)
+        obj = MyBinaryClass.from_kwargs(nested=MyBinaryLeafClass.from_kwargs(int_prop=1))
+        data = factory.serialize_binary(obj)
+
+        assert factory.manifest()[1].endswith('MyBinaryClass')
+        with pytest.raises(ValueError):
+            other.create_binary(data)
+
+        other.load_manifest(factory.manifest())
+        assert other.manifest() == factory.manifest()
+        assert other.create_binary(data).serialize() == obj.serialize()
+
+    def test_errors(self):
+        """
+        test encoding of unregistered types and decoding of invalid data
+
+        expect a ValueError
+        """
+        factory = make_factory()
+        data = factory.serialize_binary(MyBinaryClass.from_kwargs(int_prop=1, str_prop='a'))
+
+        with pytest.raises(ValueError):
+            Factory('empty').serialize_binary(MyBinaryClass())
+        with pytest.raises(ValueError):
+            factory.create_binary(data[:-1])
+        with pytest.raises(ValueError):
+            factory.create_binary(data + b'\x00')
+        with pytest.raises(ValueError):
+            Factory('empty').create_binary(data)
+        with pytest.raises(ValueError):
+            factory.serialize_binary(MyBinaryClass.from_kwargs(int_prop=2 ** 64))
+
+    def test_global(self):
+        """
+        test binary encoding with the global factory
+
+        expect object to be decoded properly
+        """
+        obj = MyComplexClass.from_kwargs(
+            nested=MyBasicClass.from_kwargs(str_prop='a', int_prop=1),
+            prop=b'raw'
+        )
+        result = objectfactory.create_binary(objectfactory.serialize_binary(obj))
+
+        assert result.nested.str_prop == 'a'
+        assert result.prop == b'raw'
@@ -0,0 +1,624 @@
+"""
+module for testing generated serialization functions
+"""
+
+# lib
+import datetime
+import enum
+import json
+import uuid
+import pytest
+import marshmallow
+
+# src
+from objectfactory import encoding
+from objectfactory import (
+    register, create, create_many, Factory, Serializable, Field, Nested, List, Integer, String,
+    Boolean, Float
+)
+from .testmodule.testclasses import MyBasicClass, MySubClass, MyComplexClass
+
+
+class MyEnum(enum.Enum):
+    """
+    enum for testing JSON encoding
+    """
+    A = 'a'
+
+
+class MyPrimitiveClass(Serializable):
+    """
+    class with each primitive field type
+    """
+    raw_prop = Field()
+    int_prop = Integer()
+    str_prop = String(key='string_property')
+    bool_prop = Boolean()
+    float_prop = Float()
+
+
+class MyOverrideClass(Serializable):
+    """
+    class with user defined deserialization that takes only the body
+    """
+    int_prop = Integer()
+
+    def deserialize(self, body: dict):
+        self.int_prop = int(body['int_prop']) * 2
+
+
+class MyOverrideParentClass(Serializable):
+    """
+    class with nested object of user defined deserialization
+    """
+    child = Nested(field_type=MyOverrideClass)
+    children = List(field_type=MyOverrideClass)
+
+
+class MyContainerClass(Serializable):
+    """
+    class with nested and list field types
+    """
+    nested = Nested()
+    nested_list = List()
+    int_list = List(field_type=Integer)
+    str_list = List(field_type=String)
+    marsh_list = List(field_type=marshmallow.fields.Date)
+
+
+class TestCompiledSerializer(object):
+    """
+    test group for generated serializer
+    """
+
+    def test_compiled(self):
+        """
+        test serializer generation
+
+        expect a specialized serializer to be generated on first use
+        """
+
+        class MyClass(Serializable):
+            int_prop = Integer()
+
+        assert MyClass._serializer is None
+        MyClass().serialize()
+        assert MyClass._serializer is not None
+        assert MyClass._serializer is not MyClass._marshmallow_serialize
+        assert Serializable._serializer is None
+
+    def test_custom_schema(self):
+        """
+        test serializer for custom schema
+
+        expect marshmallow to be used for class with user supplied schema
+        """
+
+        class CustomSchema(marshmallow.Schema):
+            date = marshmallow.fields.Date()
+
+        class MyClass(Serializable, schema=CustomSchema):
+            date = Field()
+
+        assert MyClass._serializer is MyClass._marshmallow_serialize
+
+    def test_primitive_identical(self):
+        """
+        test output of primitive fields
+
+        expect generated serializer output to be identical to marshmallow,
+        including coercion of loosely typed values
+        """
+        values = [
+            {'raw_prop': [1, 2], 'int_prop': 1, 'str_prop': 'a', 'bool_prop': True,
+             'float_prop': 1.5},
+            {'raw_prop': None, 'int_prop': None, 'str_prop': None, 'bool_prop': None,
+             'float_prop': None},
+            {'raw_prop': 'x', 'int_prop': 2.7, 'str_prop': 12, 'bool_prop': 'false',
+             'float_prop': 3},
+            {'raw_prop': {}, 'int_prop': True, 'str_prop': b'bytes', 'bool_prop': 'on',
+             'float_prop': '2.5'},
+        ]
+        for kwargs in values:
+            obj = MyPrimitiveClass.from_kwargs(**kwargs)
+            for include_type in (True, False):
+                for use_full_type in (True, False):
+                    assert obj.serialize(include_type, use_full_type) \
+                           == obj._marshmallow_serialize(include_type, use_full_type)
+
+        body = MyPrimitiveClass().serialize()
+        assert body == MyPrimitiveClass()._marshmallow_serialize()
+        assert 'string_property' in body
+
+    def test_container_identical(self):
+        """
+        test output of nested and list fields
+
+        expect generated serializer output to be identical to marshmallow,
+        with serialization options passed to nested objects
+        """
+        obj = MyContainerClass.from_kwargs(
+            nested=MyBasicClass.from_kwargs(str_prop='a', int_prop=1),
+            nested_list=[MySubClass.from_kwargs(str_prop_sub='b'), None],
+            int_list=[1, 2.5, None],
+            str_list=['x', 7],
+        )
+        obj.marsh_list = None
+        for include_type in (True, False):
+            for use_full_type in (True, False):
+                body = obj.serialize(include_type, use_full_type)
+                assert body == obj._marshmallow_serialize(include_type, use_full_type)
+                assert ('_type' in body['nested']) == include_type
+
+        body = MyContainerClass().serialize()
+        assert body == MyContainerClass()._marshmallow_serialize()
+        assert body['nested'] == {}
+        assert body['nested_list'] == []
+
+    def test_inherited(self):
+        """
+        test output of subclass with overridden field
+
+        expect generated serializer output to be identical to marshmallow
+        """
+        obj = MySubClass.from_kwargs(str_prop='a', int_prop=2, str_prop_sub='b')
+        assert obj.serialize() == obj._marshmallow_serialize()
+
+        obj = MyComplexClass.from_kwargs(prop=1, nested=obj)
+        assert obj.serialize() == obj._marshmallow_serialize()
+
+    def test_shadowed_field(self):
+        """
+        test output of field shadowed by plain class attribute
+
+        expect attribute lookup to be respected as with marshmallow
+        """
+
+        class MyClass(Serializable):
+            int_prop = Integer()
+
+        class MySub(MyClass):
+            int_prop = 5
+
+        assert MySub().serialize() == MySub()._marshmallow_serialize()
+        assert MySub().serialize()['int_prop'] == 5
+
+
+class TestCompiledDeserializer(object):
+    """
+    test group for generated deserializer
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        register(MyBasicClass)
+        register(MySubClass)
+
+    def test_compiled(self):
+        """
+        test deserializer generation
+
+        expect a specialized deserializer to be generated on first use
+        """
+
+        class MyClass(Serializable):
+            int_prop = Integer()
+
+        assert MyClass._deserializer is None
+        MyClass().deserialize({'int_prop': 1})
+        assert MyClass._deserializer is not None
+        assert MyClass._deserializer is not MyClass._marshmallow_deserialize
+
+    def test_primitive_identical(self):
+        """
+        test loading of primitive fields
+
+        expect generated deserializer to load and coerce data identically to marshmallow
+        """
+        bodies = [
+            {'raw_prop': [1, 2], 'int_prop': 1, 'string_property': 'a', 'bool_prop': True,
+             'float_prop': 1.5},
+            {'raw_prop': None, 'int_prop': None, 'string_property': None, 'bool_prop': None,
+             'float_prop': None},
+            {'raw_prop': 'x', 'int_prop': 2.7, 'string_property': b'bytes', 'bool_prop': 'off',
+             'float_prop': 3, 'unknown': 1},
+            {'int_prop': '12', 'bool_prop': 1, 'float_prop': '2.5'},
+            {},
+        ]
+        for body in bodies:
+            obj = MyPrimitiveClass()
+            obj.deserialize(body)
+            expected = MyPrimitiveClass()
+            expected._marshmallow_deserialize(body)
+            assert obj.__dict__ == expected.__dict__
+            assert type(obj.int_prop) == type(expected.int_prop)
+            assert type(obj.float_prop) == type(expected.float_prop)
+
+    def test_container_identical(self):
+        """
+        test loading of nested and list fields
+
+        expect generated deserializer to load data identically to marshmallow
+        """
+        body = {
+            'nested': {'_type': 'MyBasicClass', 'str_prop': 'a', 'int_prop': 1},
+            'nested_list': [{'_type': 'MySubClass', 'str_prop_sub': 'b'}],
+            'int_list': (1, 2.5, None),
+            'str_list': ['x', b'y'],
+            'marsh_list': ['2012-03-04'],
+        }
+        obj = MyContainerClass()
+        obj.deserialize(body)
+        expected = MyContainerClass()
+        expected._marshmallow_deserialize(body)
+
+        assert obj.serialize() == expected.serialize()
+        assert isinstance(obj.nested, MyBasicClass)
+        assert isinstance(obj.nested_list[0], MySubClass)
+        assert obj.int_list == [1, 2, None]
+        assert obj.str_list == ['x', 'y']
+
+    def test_partial(self):
+        """
+        test loading of partial body
+
+        expect fields not included in body to be left unchanged
+        """
+        obj = MyBasicClass.from_kwargs(str_prop='a', int_prop=1)
+        obj.deserialize({'int_prop': 2})
+
+        assert obj.str_prop == 'a'
+        assert obj.int_prop == 2
+
+    def test_invalid_identical(self):
+        """
+        test validation errors
+
+        expect the same validation errors as marshmallow, without any
+        partial update to the object
+        """
+        bodies = [
+            {'int_prop': 'not an int', 'float_prop': float('nan')},
+            {'bool_prop': 'maybe', 'string_property': 5},
+            {'int_prop': True, 'float_prop': 'inf'},
+            {'raw_prop': 'valid', 'bool_prop': []},
+        ]
+        for body in bodies:
+            obj = MyPrimitiveClass.from_kwargs(raw_prop='unchanged')
+            with pytest.raises(marshmallow.ValidationError) as error:
+                obj.deserialize(body)
+            with pytest.raises(marshmallow.ValidationError) as expected:
+                MyPrimitiveClass()._marshmallow_deserialize(body)
+            assert error.value.messages == expected.value.messages
+            assert obj.raw_prop == 'unchanged'
+
+        obj = MyContainerClass()
+        with pytest.raises(marshmallow.ValidationError) as error:
+            obj.deserialize({'int_list': [1, 'x', 3], 'str_list': 'abc'})
+        assert error.value.messages == {
+            'int_list': {1: ['Not a valid integer.']},
+            'str_list': ['Not a valid list.']
+        }
+
+    def test_required_allow_none(self):
+        """
+        test required and nullable fields
+
+        expect missing required data and disallowed null to raise validation errors
+        """
+
+        class MyClass(Serializable):
+            req_prop = Integer(required=True)
+            not_null_prop = String(allow_none=False)
+
+        obj = MyClass()
+        obj.deserialize({'req_prop': 1, 'not_null_prop': 'a'})
+        assert obj.req_prop == 1
+        assert obj.not_null_prop == 'a'
+
+        with pytest.raises(marshmallow.ValidationError) as error:
+            MyClass().deserialize({'not_null_prop': None})
+        assert error.value.messages == {
+            'req_prop': ['Missing data for required field.'],
+            'not_null_prop': ['Field may not be null.']
+        }
+
+
+class TestTrustedDeserializer(object):
+    """
+    test group for generated deserializer of trusted input
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        register(MyBasicClass)
+        register(MySubClass)
+
+    def test_identical(self):
+        """
+        test loading of valid data
+
+        expect trusted load of valid data to be identical to validated load
+        """
+        body = {
+            'raw_prop': [1, 2], 'int_prop': 1, 'string_property': 'a', 'bool_prop': True,
+            'float_prop': 1.5
+        }
+        obj = MyPrimitiveClass()
+        obj.deserialize(body, validate=False)
+        expected = MyPrimitiveClass()
+        expected.deserialize(body)
+        assert obj.__dict__ == expected.__dict__
+
+        body = {
+            'nested': {'_type': 'MyBasicClass', 'str_prop': 'a', 'int_prop': 1},
+            'nested_list': [{'_type': 'MySubClass', 'str_prop_sub': 'b'}],
+            'int_list': [1, 2, None],
+            'str_list': ['x', 'y'],
+            'marsh_list': ['2012-03-04'],
+        }
+        obj = MyContainerClass()
+        obj.deserialize(body, validate=False)
+        expected = MyContainerClass()
+        expected.deserialize(body)
+        assert obj.serialize() == expected.serialize()
+        assert isinstance(obj.nested_list[0], MySubClass)
+        assert obj.int_list is not body['int_list']
+
+    def test_no_validation(self):
+        """
+        test loading of invalid data
+
+        expect values to be assigned as is, without coercion or checks for
+        required and null data
+        """
+
+        class MyClass(Serializable):
+            int_prop = Integer(required=True)
+            str_prop = String(allow_none=False)
+            nested = Nested(field_type=MyBasicClass)
+
+        obj = MyClass()
+        obj.deserialize(
+            {'str_prop': None, 'nested': {'int_prop': 'x', 'unknown': 1}},
+            validate=False
+        )
+        assert obj.int_prop is None
+        assert obj.str_prop is None
+        assert isinstance(obj.nested, MyBasicClass)
+        assert obj.nested.int_prop == 'x'
+
+        obj.deserialize({'int_prop': '12'}, validate=False)
+        assert obj.int_prop == '12'
+
+    def test_nested_type(self):
+        """
+        test type checking of trusted nested data
+
+        expect nested types to still be resolved and checked
+        """
+
+        class MyClass(Serializable):
+            nested = Nested(field_type=MySubClass)
+            untyped = Nested()
+
+        with pytest.raises(ValueError):
+            MyClass().deserialize({'nested': {'_type': 'MyBasicClass'}}, validate=False)
+        with pytest.raises(ValueError):
+            MyClass().deserialize({'untyped': {'str_prop': 'a'}}, validate=False)
+
+    def test_factory_setting(self):
+        """
+        test trusted factory
+
+        expect factory setting to be used unless overridden for a single call
+        """
+        factory = Factory('trusted', validate=False)
+        factory.register(MyPrimitiveClass)
+        body = {'_type': 'MyPrimitiveClass', 'int_prop': 'not an int'}
+
+        assert factory.create(body).int_prop == 'not an int'
+        assert factory.create_many([body])[0].int_prop == 'not an int'
+        with pytest.raises(marshmallow.ValidationError):
+            factory.create(body, validate=True)
+
+
+    def test_override(self):
+        """
+        test trusted load of class that overrides deserialize without options
+
+        expect the override to be called with the body only, for single, factory wide,
+        and nested loads
+        """
+        body = {'_type': 'MyOverrideClass', 'int_prop': '2'}
+        parent = {'_type': 'MyOverrideParentClass', 'child': body, 'children': [body]}
+        factory = Factory('trusted', validate=False)
+        for cls in (MyOverrideClass, MyOverrideParentClass):
+            register(cls)
+            factory.register(cls)
+
+        assert create(body, validate=False).int_prop == 4
+        assert create_many([body], validate=False)[0].int_prop == 4
+        assert factory.create(body).int_prop == 4
+        obj = factory.create(parent)
+        assert obj.child.int_prop == 4
+        assert obj.children[0].int_prop == 4
+        obj = factory.create({'_type': 'MyOverrideParentClass', 'child': {'int_prop': 3}})
+        assert obj.child.int_prop == 6
+
+
+class TestCompiledJsonEncoder(object):
+    """
+    test group for generated JSON encoder
+    """
+
+    def test_primitive_identical(self):
+        """
+        test JSON of primitive fields
+
+        expect generated JSON to decode to the same body as serialize,
+        including coercion of loosely typed values
+        """
+        values = [
+            {'raw_prop': {'a': [1, None]}, 'int_prop': 1, 'str_prop': 'a"\\\né',
+             'bool_prop': True, 'float_prop': 1.5},
+            {'raw_prop': None, 'int_prop': None, 'str_prop': None, 'bool_prop': None,
+             'float_prop': None},
+            {'raw_prop': 'x', 'int_prop': 2.7, 'str_prop': 12, 'bool_prop': 'false',
+             'float_prop': 3},
+            {'raw_prop': [], 'int_prop': True, 'str_prop': b'bytes', 'bool_prop': 'on',
+             'float_prop': '2.5'},
+        ]
+        for kwargs in values:
+            obj = MyPrimitiveClass.from_kwargs(**kwargs)
+            for include_type in (True, False):
+                for use_full_type in (True, False):
+                    data = obj.to_json(include_type, use_full_type)
+                    assert isinstance(data, bytes)
+                    assert json.loads(data) == obj.serialize(include_type, use_full_type)
+
+        assert json.loads(MyPrimitiveClass().to_json()) == MyPrimitiveClass().serialize()
+
+    def test_container_identical(self):
+        """
+        test JSON of nested and list fields
+
+        expect generated JSON to decode to the same body as serialize
+        """
+        obj = MyContainerClass.from_kwargs(
+            nested=MyBasicClass.from_kwargs(str_prop='a', int_prop=1),
+            nested_list=[MySubClass.from_kwargs(str_prop_sub='b'), None],
+            int_list=[1, 2.5, None],
+            str_list=['x', 7],
+            marsh_list=[datetime.date(2012, 3, 4)]
+        )
+        for include_type in (True, False):
+            for use_full_type in (True, False):
+                assert json.loads(obj.to_json(include_type, use_full_type)) \
+                       == obj.serialize(include_type, use_full_type)
+
+        assert json.loads(MyContainerClass().to_json()) == MyContainerClass().serialize()
+
+    def test_empty(self):
+        """
+        test JSON of class without fields
+
+        expect a valid JSON object
+        """
+
+        class MyClass(Serializable):
+            pass
+
+        assert json.loads(MyClass().to_json()) == MyClass().serialize()
+        assert MyClass().to_json(include_type=False) == b'{}'
+
+    def test_custom_serialize(self):
+        """
+        test JSON of class with overridden serialization
+
+        expect JSON of the overridden output
+        """
+
+        class MyClass(Serializable):
+            int_prop = Integer()
+
+            def serialize(self, include_type=True, use_full_type=True):
+                return {'custom': self.int_prop}
+
+        obj = MyClass.from_kwargs(int_prop=3)
+        assert json.loads(obj.to_json()) == {'custom': 3}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """
+        test JSON without optional backend
+
+        expect the standard library to be used
+        """
+        monkeypatch.setattr(encoding, 'orjson', None)
+        obj = MyPrimitiveClass.from_kwargs(raw_prop={'a': 1}, float_prop=1.5)
+
+        assert json.loads(obj.to_json()) == obj.serialize()
+        assert encoding.loads(obj.to_json()) == obj.serialize()
+
+    @pytest.mark.skipif(encoding.orjson is None, reason='requires orjson')
+    def test_backends(self, monkeypatch):
+        """
+        test JSON of values handled differently by each backend
+
+        expect identical output from orjson and the standard library, with non-finite
+        floats as null
+        """
+        value = {
+            'nan': float('nan'),
+            'inf': [float('inf'), (-float('inf'), 1.5)],
+            'datetime': datetime.datetime(2020, 1, 2, 3, 4, 5, 6),
+            'aware': datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc),
+            'date': datetime.date(2020, 1, 2),
+            'uuid': uuid.UUID(int=1),
+            'enum': MyEnum.A,
+            'text': 'caf\u00e9',
+            'big': 2 ** 70,
+        }
+        obj = MyPrimitiveClass.from_kwargs(raw_prop=value, float_prop=float('nan'))
+
+        fast = encoding.dumps(value), obj.to_json()
+        monkeypatch.setattr(encoding, 'orjson', None)
+        assert (encoding.dumps(value), obj.to_json()) == fast
+        assert json.loads(fast[0]) == {
+            'nan': None,
+            'inf': [None, [None, 1.5]],
+            'datetime': '2020-01-02T03:04:05.000006',
+            'aware': '2020-01-02T00:00:00+00:00',
+            'date': '2020-01-02',
+            'uuid': '00000000-0000-0000-0000-000000000001',
+            'enum': 'a',
+            'text': 'caf\u00e9',
+            'big': 2 ** 70,
+        }
+        assert json.loads(fast[1])['float_prop'] is None
+        with pytest.raises(TypeError):
+            encoding.dumps({'a': object()})
+
+    def test_text_policy(self):
+        """
+        test JSON of non-ASCII text in string fields and raw fields
+
+        expect the same unescaped UTF-8 text from generated encoders and dumps
+        """
+        obj = MyPrimitiveClass.from_kwargs(raw_prop='caf\u00e9', str_prop='caf\u00e9')
+        data = obj.to_json(include_type=False)
+
+        assert data.count('"caf\u00e9"'.encode('utf-8')) == 2
+        assert encoding.dumps('caf\u00e9') == '"caf\u00e9"'
+
+    def test_decode(self, monkeypatch):
+        """
+        test decoding of large integers and NaN literals
+
+        expect identical values from orjson and the standard library
+        """
+        data = '[18446744073709551617, -18446744073709551617, 1e20, NaN, "a"]'
+        expected = json.loads(data)
+        for _ in range(2):
+            values = encoding.loads(data)
+            assert values[:3] == expected[:3] and values[4] == 'a'
+            assert type(values[0]) is int and type(values[2]) is float
+            assert values[3] != values[3]
+            assert encoding.loads(data.encode('utf-8'))[:3] == expected[:3]
+            monkeypatch.setattr(encoding, 'orjson', None)
+
+    def test_big_int(self):
+        """
+        test JSON round trip of integer field beyond 64 bits
+
+        expect the exact value to be restored
+        """
+        factory = Factory('big')
+        factory.register(MyPrimitiveClass)
+        obj = MyPrimitiveClass.from_kwargs(int_prop=2 ** 64 + 1)
+
+        assert factory.create_from_json(obj.to_json()).int_prop == 2 ** 64 + 1
@@ -0,0 +1,190 @@
+"""
+module for testing array backed collections
+"""
+
+# lib
+import json
+import math
+import pickle
+import pytest
+
+# src
+import objectfactory
+from objectfactory import Serializable, Collection, Integer, Float, Boolean, String, register
+
+
+@register
+class MyRecordClass(Serializable, slots=True):
+    """
+    class with primitive fields for testing collections
+    """
+    int_prop = Integer(key='int')
+    float_prop = Float()
+    bool_prop = Boolean()
+
+    def total(self) -> float:
+        """
+        sum of numeric fields
+
+        :return: sum
+        """
+        return self.int_prop + self.float_prop
+
+
+class TestCollection(object):
+    """
+    test case for array backed collections
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        register(MyRecordClass)
+
+    def make(self, count: int = 3):
+        """
+        create collection of records
+
+        :param count: number of records
+        :return: collection
+        """
+        return Collection[MyRecordClass](
+            MyRecordClass.from_kwargs(int_prop=i, float_prop=i / 2, bool_prop=i % 2 == 1)
+            for i in range(count)
+        )
+
+    def test_definition(self):
+        """
+        test definition of collection for a class
+
+        expect one collection class per item type, and an error for classes with
+        non primitive fields
+        """
+
+        class MyStringClass(Serializable):
+            str_prop = String()
+
+        assert Collection[MyRecordClass] is Collection[MyRecordClass]
+        assert self.make().columns['int_prop'].typecode == 'q'
+        with pytest.raises(TypeError):
+            Collection[MyStringClass]
+        with pytest.raises(TypeError):
+            Collection()
+
+    def test_views(self):
+        """
+        test access to records
+
+        expect views to be instances of the item type that read and write the arrays
+        """
+        records = self.make()
+        view = records[1]
+
+        assert len(records) == 3
+        assert isinstance(view, MyRecordClass)
+        assert (view.int_prop, view.float_prop, view.bool_prop) == (1, 0.5, True)
+        assert view.total() == 1.5
+        assert records[-1].int_prop == 2
+        assert [r.int_prop for r in records[:2]] == [0, 1]
+
+        view.int_prop = 10
+        view.float_prop = None
+        assert records.columns['int_prop'][1] == 10
+        assert records[1].float_prop is None
+        assert math.isnan(records.columns['float_prop'][1])
+        assert view.serialize()['int'] == 10
+
+        records[0] = MyRecordClass.from_kwargs(int_prop=5, float_prop=1.0, bool_prop=True)
+        assert records[0].serialize() == {
+            '_type': 'test.test_collection.MyRecordClass',
+            'int': 5,
+            'float_prop': 1.0,
+            'bool_prop': True,
+        }
+        with pytest.raises(IndexError):
+            records[3]
+
+    def test_extend(self):
+        """
+        test adding records
+
+        expect invalid records to be rejected without changing the collection
+        """
+        records = self.make()
+        records.append(MyRecordClass.from_kwargs(int_prop=7, float_prop=None, bool_prop=False))
+        assert len(records) == 4
+        assert records[3].float_prop is None
+
+        with pytest.raises(ValueError):
+            records.append(MyRecordClass.from_kwargs(float_prop=1.0, bool_prop=False))
+        with pytest.raises(TypeError):
+            records.append(objectfactory.Serializable())
+        assert [len(column) for column in records.columns.values()] == [4, 4, 4]
+
+    def test_serialize_many(self):
+        """
+        test serialization of collection
+
+        expect output identical to serialization of each view
+        """
+        records = self.make(5)
+
+        assert objectfactory.serialize_many(records) == [r.serialize() for r in records]
+        assert objectfactory.serialize_many(records, include_type=False)[4] == {
+            'int': 4, 'float_prop': 2.0, 'bool_prop': False
+        }
+
+    def test_create_many(self):
+        """
+        test creation of collection from serialized data and columns
+
+        expect records equivalent to the serialized data
+        """
+        bodies = self.make(10).serialize()
+        records = Collection[MyRecordClass].create_many(bodies, chunk_size=3)
+
+        assert len(records) == 10
+        assert records.serialize() == bodies
+
+        records = Collection[MyRecordClass].from_columns(records.columns)
+        assert records.serialize() == bodies
+
+    def test_null_float(self):
+        """
+        test serialization of null float stored as nan
+
+        expect null in output of serialize, JSON, and the collection
+        """
+        records = self.make()
+        records[1].float_prop = None
+
+        assert records[1].serialize()['float_prop'] is None
+        assert records.serialize()[1]['float_prop'] is None
+        assert json.loads(records[1].to_json())['float_prop'] is None
+
+    def test_pickle(self):
+        """
+        test pickling of views
+
+        expect views to be pickled as independent instances of the item type
+        """
+        records = self.make()
+        obj = pickle.loads(pickle.dumps(records[1]))
+
+        assert type(obj) is MyRecordClass
+        assert obj.serialize() == records[1].serialize()
+        obj.int_prop = 10
+        assert records[1].int_prop == 1
+
+    def test_binary(self):
+        """
+        test binary serialization of views
+
+        expect views to be encoded as the item type
+        """
+        records = self.make()
+        obj = objectfactory.create_binary(objectfactory.serialize_binary(records[1]))
+
+        assert type(obj) is MyRecordClass
+        assert obj.serialize() == records[1].serialize()
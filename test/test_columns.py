@@ -0,0 +1,202 @@
+"""
+module for testing conversion between objects and typed columns
+"""
+
+# lib
+import math
+from array import array
+import pytest
+
+# src
+import objectfactory
+from objectfactory import Serializable, Nested, Integer, Float, Boolean, String, columns
+
+
+class MyColumnClass(Serializable):
+    """
+    class for testing columnar export
+    """
+    int_prop = Integer()
+    float_prop = Float()
+    bool_prop = Boolean()
+    str_prop = String()
+    nested = Nested()
+
+
+class MyColumnSubClass(MyColumnClass):
+    """
+    sub class for testing columnar export
+    """
+    extra_prop = Integer()
+
+
+def values(column) -> list:
+    """
+    get python values of a column
+
+    :param column: array, NumPy array, or list
+    :return: list of values
+    """
+    return list(column.tolist() if hasattr(column, 'tolist') else column)
+
+
+class TestToColumns(object):
+    """
+    test case for columnar export
+    """
+
+    def test_export(self):
+        """
+        test export of all primitive fields
+
+        expect one typed column per primitive field, with values in object order
+        """
+        objs = [
+            MyColumnClass.from_kwargs(int_prop=i, float_prop=i / 2, bool_prop=i % 2 == 0,
+                                      str_prop=str(i))
+            for i in range(5)
+        ]
+        objs.append(MyColumnSubClass.from_kwargs(int_prop=-1, bool_prop=True, extra_prop=7))
+        result = objectfactory.to_columns(objs)
+
+        assert list(result) == ['int_prop', 'float_prop', 'bool_prop', 'str_prop']
+        assert values(result['int_prop']) == [0, 1, 2, 3, 4, -1]
+        assert values(result['float_prop'])[:5] == [0.0, 0.5, 1.0, 1.5, 2.0]
+        assert math.isnan(values(result['float_prop'])[5])
+        assert [bool(v) for v in values(result['bool_prop'])] == [True, False, True, False,
+                                                                 True, True]
+        assert values(result['str_prop']) == ['0', '1', '2', '3', '4', None]
+        if columns.numpy is None:
+            assert isinstance(result['int_prop'], array)
+            assert result['float_prop'].typecode == 'd'
+        else:
+            assert result['int_prop'].dtype == columns.numpy.int64
+            assert result['bool_prop'].dtype == columns.numpy.bool_
+
+    def test_fields(self):
+        """
+        test export of selected fields
+
+        expect only selected fields, and an error for unknown or non primitive fields
+        """
+        objs = [MyColumnSubClass.from_kwargs(int_prop=1, extra_prop=2)]
+
+        result = objectfactory.to_columns(objs, fields=['extra_prop', 'int_prop'])
+        assert list(result) == ['extra_prop', 'int_prop']
+        assert values(result['extra_prop']) == [2]
+
+        with pytest.raises(ValueError):
+            objectfactory.to_columns(objs, fields=['nested'])
+        with pytest.raises(ValueError):
+            objectfactory.to_columns(objs, fields=['unknown'])
+
+    def test_invalid(self):
+        """
+        test export of objects with invalid values or mixed types
+
+        expect an error
+        """
+        with pytest.raises(ValueError):
+            objectfactory.to_columns([MyColumnClass.from_kwargs(int_prop=None)])
+        with pytest.raises(ValueError):
+            objectfactory.to_columns([MyColumnClass.from_kwargs(int_prop=2 ** 70)])
+        with pytest.raises(ValueError):
+            objectfactory.to_columns([MyColumnClass.from_kwargs(float_prop='a')])
+        with pytest.raises(TypeError):
+            objectfactory.to_columns([MyColumnSubClass(), MyColumnClass()])
+        with pytest.raises(ValueError):
+            objectfactory.to_columns([])
+
+    def test_empty(self):
+        """
+        test export of empty collection with specified type
+
+        expect empty columns
+        """
+        result = objectfactory.to_columns([], object_type=MyColumnClass)
+
+        assert [len(column) for column in result.values()] == [0, 0, 0, 0]
+
+
+class TestFromColumns(object):
+    """
+    test case for creating objects from columns
+    """
+
+    def test_round_trip(self):
+        """
+        test creation from exported columns
+
+        expect objects equivalent to the exported objects
+        """
+        objs = [
+            MyColumnClass.from_kwargs(int_prop=i, float_prop=i / 4, bool_prop=i > 1,
+                                      str_prop='s' + str(i))
+            for i in range(4)
+        ]
+        result = MyColumnClass.from_columns(objectfactory.to_columns(objs))
+
+        assert [type(obj) for obj in result] == [MyColumnClass] * 4
+        assert [obj.serialize() for obj in result] == [obj.serialize() for obj in objs]
+        assert type(result[0].bool_prop) is bool
+        assert type(result[0].int_prop) is int
+
+    def test_columns(self):
+        """
+        test creation from arrays and sequences
+
+        expect integer arrays to be converted for float and boolean fields, and
+        fields without a column to keep their default
+        """
+        result = MyColumnClass.from_columns({
+            'int_prop': array('h', [1, 2]),
+            'float_prop': array('i', [3, 4]),
+            'bool_prop': [True, None],
+        })
+
+        assert [obj.int_prop for obj in result] == [1, 2]
+        assert [obj.float_prop for obj in result] == [3.0, 4.0]
+        assert type(result[0].float_prop) is float
+        assert [obj.bool_prop for obj in result] == [True, None]
+        assert [obj.str_prop for obj in result] == [None, None]
+        assert MyColumnClass.from_columns({}) == []
+
+    def test_invalid(self):
+        """
+        test creation from mismatched columns
+
+        expect an error
+        """
+        with pytest.raises(ValueError):
+            MyColumnClass.from_columns({'int_prop': array('d', [1.0])})
+        with pytest.raises(ValueError):
+            MyColumnClass.from_columns({'int_prop': [1, 'a']})
+        with pytest.raises(ValueError):
+            MyColumnClass.from_columns({'bool_prop': [1]})
+        with pytest.raises(ValueError):
+            MyColumnClass.from_columns({'int_prop': [1, 2], 'str_prop': ['a']})
+        with pytest.raises(ValueError):
+            MyColumnClass.from_columns({'nested': [None]})
+
+    @pytest.mark.skipif(columns.numpy is None, reason='requires numpy')
+    def test_numpy(self):
+        """
+        test creation from NumPy arrays
+
+        expect dtype of each array to be checked against its field
+        """
+        numpy = columns.numpy
+        result = MyColumnClass.from_columns({
+            'int_prop': numpy.arange(3, dtype='uint8'),
+            'float_prop': numpy.arange(3),
+            'bool_prop': numpy.array([True, False, True]),
+            'str_prop': numpy.array(['a', 'b', 'c']),
+        })
+
+        obj = result[2]
+        assert (obj.int_prop, obj.float_prop, obj.bool_prop, obj.str_prop) == (2, 2.0, True, 'c')
+        assert [type(obj.int_prop), type(obj.float_prop)] == [int, float]
+        with pytest.raises(ValueError):
+            MyColumnClass.from_columns({'int_prop': numpy.zeros(3)})
+        with pytest.raises(ValueError):
+            MyColumnClass.from_columns({'bool_prop': numpy.zeros((2, 2), dtype=bool)})
@@ -173,3 +173,36 @@ class TestCustomField(object):
         obj = MyTestClass()
         with pytest.raises(marshmallow.exceptions.ValidationError):
             obj.deserialize(body)
+
+
+class TestCustomSchemaCache(object):
+    """
+    test group for reuse of custom marshmallow schema
+    """
+
+    def test_schema_reused(self):
+        """
+        test custom schema instance reuse
+
+        expect custom schema to be instantiated once and shared across
+        serialization and deserialization calls
+        """
+        created = []
+
+        class CustomSchema(marshmallow.Schema):
+            date = marshmallow.fields.Date()
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        class MyTestClass(Serializable, schema=CustomSchema):
+            date = Field()
+
+        for _ in range(3):
+            obj = MyTestClass()
+            obj.deserialize({'date': '2012-03-04'})
+            body = obj.serialize()
+            assert body['date'] == '2012-03-04'
+
+        assert len(created) == 1
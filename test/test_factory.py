@@ -3,12 +3,42 @@ module for testing functionality of serializable factory
 """
 
 # lib
+import io
+import json
+import pickle
+import warnings
 import pytest
 
 # src
 import objectfactory
-from objectfactory.factory import _global_factory
-from .testmodule.testclasses import MyBasicClass, MyComplexClass
+from objectfactory import Serializable, Nested, List, Integer
+from objectfactory.factory import _global_factory, _pack_rows, _unpack_rows
+from .testmodule.testclasses import MyBasicClass, MySubClass, MyComplexClass
+
+
+class MyNestedListClass(Serializable):
+    """
+    class with list of nested objects for testing transfer of rows
+    """
+    items = List(field_type=MyBasicClass)
+
+
+class MySlotsNestedClass(Serializable, slots=True):
+    """
+    slots class with nested object for testing transfer of rows
+    """
+    int_prop = Integer()
+    nested = Nested()
+
+
+class MyCustomDeserializeClass(MyBasicClass):
+    """
+    class with user defined deserialization for testing transfer of rows
+    """
+
+    def deserialize(self, body: dict, **kwargs):
+        super().deserialize(body, **kwargs)
+        self.extra = 'custom'
 
 
 class TestFactory(object):
@@ -123,3 +153,231 @@ class TestFactory(object):
                 match=r'.*Object type MyBasicClass is not a MyComplexClass.*'
         ):
             _ = objectfactory.create(body, object_type=MyComplexClass)
+
+    def test_create_many(self):
+        """
+        validate create many method with mixed types
+
+        expect each object to be deserialized properly and returned in input order
+        """
+        bodies = [
+            {'_type': 'MyBasicClass', 'str_prop': 'a', 'int_prop': 0},
+            {'_type': 'test.testmodule.testclasses.MySubClass', 'str_prop_sub': 'b'},
+            {'_type': 'some.other.module.MyBasicClass', 'int_prop': 2},
+            {'_type': 'MySubClass', 'int_prop': 3},
+        ]
+        objs = objectfactory.create_many(bodies)
+
+        assert len(objs) == 4
+        assert type(objs[0]) == MyBasicClass
+        assert objs[0].str_prop == 'a'
+        assert objs[0].int_prop == 0
+        assert type(objs[1]) == MySubClass
+        assert objs[1].str_prop_sub == 'b'
+        assert type(objs[2]) == MyBasicClass
+        assert objs[2].int_prop == 2
+        assert type(objs[3]) == MySubClass
+        assert objs[3].int_prop == 3
+
+    def test_create_many_typed_invalid(self):
+        """
+        validate create many method throws when type mismatch
+
+        expect TypeError to be raised indicating a type mismatch
+        """
+        bodies = [
+            {'_type': 'MySubClass', 'int_prop': 1},
+            {'_type': 'MyBasicClass', 'int_prop': 2},
+        ]
+        objs = objectfactory.create_many(bodies, object_type=MyBasicClass)
+        assert len(objs) == 2
+
+        with pytest.raises(
+                TypeError,
+                match=r'.*Object type MyBasicClass is not a MySubClass.*'
+        ):
+            _ = objectfactory.create_many(bodies, object_type=MySubClass)
+
+    def test_create_many_unregistered(self):
+        """
+        validate create many method throws when unregistered
+
+        expect ValueError to be raised indicating that the type is not registered
+        """
+        bodies = [
+            {'_type': 'MyBasicClass', 'int_prop': 1},
+            {'_type': 'MyClassThatDoesNotExist', 'int_prop': 2},
+        ]
+        with pytest.raises(ValueError, match=r'.*type MyClassThatDoesNotExist not found.*'):
+            _ = objectfactory.create_many(bodies)
+
+    def test_create_from_json(self):
+        """
+        validate create from JSON method with text and bytes
+
+        expect object to be round tripped through JSON
+        """
+        obj = MySubClass.from_kwargs(str_prop='somestring', int_prop=42, str_prop_sub='sub')
+        data = obj.to_json()
+
+        for value in (data, data.decode()):
+            created = objectfactory.create_from_json(value, object_type=MyBasicClass)
+            assert isinstance(created, MySubClass)
+            assert created.serialize() == obj.serialize()
+
+        with pytest.raises(TypeError):
+            objectfactory.create_from_json(data, object_type=MyComplexClass)
+
+    def test_iter_create(self):
+        """
+        validate iter create method with text and binary streams
+
+        expect each line to be lazily deserialized, independent of chunk boundaries
+        """
+        lines = [
+            json.dumps({'_type': 'MyBasicClass', 'str_prop': 'line {}'.format(i), 'int_prop': i})
+            for i in range(10)
+        ]
+        text = '\n'.join(lines[:5]) + '\n\n' + '\n'.join(lines[5:]) + '\n'
+
+        for stream in (io.StringIO(text), io.BytesIO(text.encode())):
+            objs = objectfactory.iter_create(stream, object_type=MyBasicClass, chunk_size=7)
+            assert next(objs).int_prop == 0
+            objs = [next(objs)] + list(objs)
+
+            assert len(objs) == 9
+            for i, obj in enumerate(objs, start=1):
+                assert isinstance(obj, MyBasicClass)
+                assert obj.str_prop == 'line {}'.format(i)
+                assert obj.int_prop == i
+
+    def test_iter_create_long_line(self):
+        """
+        validate iter create method with lines much longer than the chunk size
+
+        expect long lines split across many chunks to be joined, with line numbers
+        """
+        long_line = json.dumps({'_type': 'MyBasicClass', 'str_prop': 'x' * 100000})
+        text = long_line + '\n{"_type": "MyBasicClass", "int_prop": 1}\n' + long_line
+
+        for stream in (io.StringIO(text), io.BytesIO(text.encode())):
+            objs = list(objectfactory.iter_create(stream, chunk_size=16))
+            assert [len(obj.str_prop or '') for obj in objs] == [100000, 0, 100000]
+            assert objs[1].int_prop == 1
+
+    def test_iter_create_line_numbers(self):
+        """
+        validate iter create method error reporting
+
+        expect error to be raised with line number when enabled
+        """
+        text = '{"_type": "MyBasicClass"}\n\n{"_type": "MyClassThatDoesNotExist"}'
+
+        with pytest.raises(ValueError, match=r'.*type MyClassThatDoesNotExist not found.*'):
+            _ = list(objectfactory.iter_create(io.StringIO(text)))
+
+        with pytest.raises(ValueError, match=r'.*line 3.*MyClassThatDoesNotExist.*') as error:
+            _ = list(objectfactory.iter_create(io.StringIO(text), line_numbers=True))
+        assert error.value.line_number == 3
+
+        text = '{"_type": "MyBasicClass"}\n{"_type": "MyComplexClass"}'
+        with pytest.raises(TypeError, match=r'Error on line 2: .*MyComplexClass.*'):
+            _ = list(objectfactory.iter_create(
+                io.StringIO(text),
+                object_type=MyBasicClass,
+                line_numbers=True
+            ))
+
+    def test_create_many_parallel(self):
+        """
+        validate create many method with worker processes
+
+        expect objects to be created in worker processes and returned in input order
+        """
+        bodies = [
+            {'_type': 'MySubClass' if i % 3 else 'MyBasicClass', 'int_prop': i}
+            for i in range(50)
+        ]
+        objs = objectfactory.create_many(bodies, object_type=MyBasicClass, processes=2)
+
+        assert len(objs) == 50
+        for i, obj in enumerate(objs):
+            assert type(obj) == (MySubClass if i % 3 else MyBasicClass)
+            assert obj.int_prop == i
+
+    def test_parallel_rows(self):
+        """
+        validate transfer of created objects as compact rows
+
+        expect objects rebuilt from pickled rows to be equivalent, including nested
+        objects, slot storage, and classes with user defined deserialization
+        """
+        objs = [
+            MyComplexClass.from_kwargs(
+                nested=MyBasicClass.from_kwargs(str_prop='a', int_prop=1),
+                prop=(1, 2)
+            ),
+            MySlotsNestedClass.from_kwargs(int_prop=2, nested=MySubClass.from_kwargs(int_prop=3)),
+            MyCustomDeserializeClass.from_dict({'str_prop': 'b'}),
+            MyNestedListClass.from_kwargs(items=[MyBasicClass(), MySubClass()]),
+        ]
+        types, rows = pickle.loads(pickle.dumps(_pack_rows(objs)))
+        result = _unpack_rows(types, rows)
+
+        assert [type(row) for row in rows] == [tuple, tuple, MyCustomDeserializeClass, tuple]
+        assert [type(obj) for obj in result] == [type(obj) for obj in objs]
+        assert [obj.serialize() for obj in result] == [obj.serialize() for obj in objs]
+        assert result[0].prop == (1, 2)
+        assert result[2].extra == 'custom'
+
+    def test_create_many_parallel_invalid(self):
+        """
+        validate create many method with worker processes throws on type mismatch
+
+        expect TypeError to be raised from worker process
+        """
+        bodies = [{'_type': 'MyBasicClass', 'int_prop': i} for i in range(10)]
+        with pytest.raises(TypeError):
+            _ = objectfactory.create_many(bodies, object_type=MySubClass, processes=2)
+
+    def test_resolve_fallback_memoized(self):
+        """
+        validate resolution of type with unregistered module path
+
+        expect type to be resolved by short name and memoized
+        """
+        factory = objectfactory.Factory('test')
+        factory.register(MyBasicClass)
+
+        assert factory._resolve('some.other.module.MyBasicClass') is MyBasicClass
+        assert factory._aliases == {'some.other.module.MyBasicClass': MyBasicClass}
+        assert factory._resolve('some.other.module.MyBasicClass') is MyBasicClass
+
+        # expect stale fallback to be ignored once registry changes
+        factory.registry.clear()
+        factory.register(MySubClass)
+        with pytest.raises(ValueError):
+            factory._resolve('some.other.module.MyBasicClass')
+
+    def test_register_ambiguous(self):
+        """
+        validate registration of ambiguous short name
+
+        expect warning when short name is registered for classes in different modules,
+        and no warning when the same class is registered again
+        """
+        factory = objectfactory.Factory('test')
+        factory.register(MyBasicClass)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            factory.register(MyBasicClass)
+
+        class MyBasicClass2(objectfactory.Serializable):
+            pass
+
+        MyBasicClass2.__name__ = 'MyBasicClass'
+        with pytest.warns(UserWarning, match=r'.*Ambiguous short type name MyBasicClass.*'):
+            factory.register(MyBasicClass2)
+
+        assert factory._resolve('MyBasicClass') is MyBasicClass2
+        assert factory._resolve('test.testmodule.testclasses.MyBasicClass') is MyBasicClass
@@ -7,7 +7,7 @@ import pytest
 import marshmallow
 
 # src
-from objectfactory import Serializable, Field
+from objectfactory import Serializable, Field, List, String
 
 
 class TestFieldOptionals(object):
@@ -172,3 +172,96 @@ class TestFieldOptionals(object):
         obj = MyTestClass()
         with pytest.raises(marshmallow.exceptions.ValidationError):
             obj.deserialize(body)
+
+
+class TestFieldDefaults(object):
+    """
+    test case for creation of field default values
+    """
+
+    def test_immutable_shared(self):
+        """
+        test immutable default
+
+        expect immutable default values to be used without copying
+        """
+        default = ('a', (1, 2.0), None)
+
+        class MyTestClass(Serializable):
+            tuple_prop = Field(default=default)
+            str_prop = Field(default='default_val')
+
+        assert MyTestClass._fields['tuple_prop']._default_factory is None
+        assert MyTestClass._fields['str_prop']._default_factory is None
+        assert MyTestClass().tuple_prop is default
+
+    def test_mutable_copied(self):
+        """
+        test mutable default
+
+        expect mutable default values to be copied for each instance
+        """
+
+        class MyTestClass(Serializable):
+            dict_prop = Field(default={'a': [1]})
+            tuple_prop = Field(default=([1],))
+
+        obj_a = MyTestClass()
+        obj_b = MyTestClass()
+        obj_a.dict_prop['a'].append(2)
+        obj_a.tuple_prop[0].append(2)
+
+        assert obj_b.dict_prop == {'a': [1]}
+        assert obj_b.tuple_prop == ([1],)
+
+    def test_default_factory(self):
+        """
+        test default factory
+
+        expect default factory to be called once for each instance on first access
+        """
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return {'count': len(calls)}
+
+        class MyTestClass(Serializable):
+            dict_prop = Field(default_factory=factory)
+            list_prop = List(field_type=String, default_factory=lambda: ['x'])
+
+        obj = MyTestClass()
+        assert obj.dict_prop == {'count': 1}
+        assert obj.dict_prop == {'count': 1}
+        assert MyTestClass().dict_prop == {'count': 2}
+        assert obj.list_prop == ['x']
+        assert obj.serialize()['list_prop'] == ['x']
+
+    def test_default_factory_invalid(self):
+        """
+        test default factory with default value
+
+        expect ValueError to be raised when both are specified
+        """
+        with pytest.raises(ValueError):
+            Field(default=1, default_factory=int)
+
+    def test_new_many(self):
+        """
+        test bulk creation of instances with defaults
+
+        expect every field to be populated with an independent default value
+        """
+
+        class MyTestClass(Serializable):
+            str_prop = Field(default='default_val')
+            list_prop = List()
+            dict_prop = Field(default_factory=dict)
+
+        objs = MyTestClass.new_many(3)
+
+        assert len(objs) == 3
+        for obj in objs:
+            assert obj.__dict__ == {'_str_prop': 'default_val', '_list_prop': [], '_dict_prop': {}}
+        objs[0].list_prop.append(1)
+        assert objs[1].list_prop == []
@@ -0,0 +1,372 @@
+"""
+module for testing lazy object creation
+"""
+
+# lib
+import copy
+import pickle
+import pytest
+import marshmallow
+
+# src
+import objectfactory
+from objectfactory import (
+    Serializable, Nested, List, Integer, String, Float, LazyList, register
+)
+from objectfactory.serializable import _LAZY_BODY
+
+
+@register
+class MyLazyNestedClass(Serializable):
+    """
+    nested class for testing lazy creation
+    """
+    str_prop = String()
+
+
+@register
+class MyLazyClass(Serializable):
+    """
+    class for testing lazy creation
+    """
+    int_prop = Integer()
+    str_prop = String(default='default')
+    nested = Nested(field_type=MyLazyNestedClass)
+    float_list = List(field_type=Float)
+
+
+@register
+class MyLazySlotsClass(Serializable, slots=True):
+    """
+    slots class for testing lazy creation
+    """
+    int_prop = Integer(required=True)
+    str_prop = String()
+
+
+@register
+class MyLazyListClass(Serializable):
+    """
+    class with lazy list fields for testing lazy creation
+    """
+    items = List(field_type=MyLazyNestedClass, lazy=True)
+    uncached = List(field_type=MyLazyNestedClass, lazy=True, lazy_cache=False)
+
+
+@register
+class MyLazyComplexListClass(Serializable):
+    """
+    class with lazy list of complex objects for testing lazy creation
+    """
+    items = List(field_type=MyLazyClass, lazy=True)
+
+
+@register
+class MyEagerComplexListClass(Serializable):
+    """
+    class with eager list of complex objects for comparison with lazy creation
+    """
+    items = List(field_type=MyLazyClass)
+
+
+class TestLazy(object):
+    """
+    test case for lazily created objects
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        for cls in (MyLazyNestedClass, MyLazyClass, MyLazySlotsClass, MyLazyListClass):
+            register(cls)
+
+    def test_create_lazy(self):
+        """
+        test lazy creation
+
+        expect instance of registered class with fields only loaded on first access
+        """
+        body = {
+            '_type': 'MyLazyClass',
+            'int_prop': '12',
+            'nested': {'str_prop': 'x'},
+            'float_list': [1, 2.5],
+        }
+        obj = objectfactory.create(body, lazy=True)
+
+        assert isinstance(obj, MyLazyClass)
+        assert obj.__dict__ == {}
+
+        assert obj.int_prop == 12
+        assert obj.__dict__ == {'_int_prop': 12}
+
+        assert isinstance(obj.nested, MyLazyNestedClass)
+        assert obj.nested.str_prop == 'x'
+        assert obj.str_prop == 'default'
+        assert obj.float_list == [1.0, 2.5]
+
+    def test_create_lazy_invalid(self):
+        """
+        test lazy creation with invalid data
+
+        expect validation error to be raised on access of the invalid field only
+        """
+        body = {'_type': 'MyLazyClass', 'int_prop': 'not an int', 'str_prop': 'a'}
+        obj = objectfactory.create(body, lazy=True)
+
+        assert obj.str_prop == 'a'
+        with pytest.raises(marshmallow.ValidationError) as error:
+            _ = obj.int_prop
+        assert error.value.messages == {'int_prop': ['Not a valid integer.']}
+
+    def test_set_before_access(self):
+        """
+        test assignment to lazily created object
+
+        expect assigned value to take precedence over raw body
+        """
+        obj = objectfactory.create({'_type': 'MyLazyClass', 'int_prop': 1}, lazy=True)
+        obj.int_prop = 2
+
+        assert obj.int_prop == 2
+        assert obj.materialize().int_prop == 2
+
+    def test_serialize(self):
+        """
+        test serialization of lazily created object
+
+        expect output identical to eagerly created object
+        """
+        body = {
+            '_type': 'MyLazyClass',
+            'int_prop': 3.0,
+            'nested': {'str_prop': 'x'},
+            'float_list': [1],
+        }
+        lazy = objectfactory.create(body, lazy=True)
+        eager = objectfactory.create(body)
+
+        assert lazy.serialize() == eager.serialize()
+
+    def test_materialize(self):
+        """
+        test materialization of lazily created object
+
+        expect all fields to be loaded, and full validation of the raw body
+        """
+        obj = objectfactory.create({'_type': 'MyLazySlotsClass', 'int_prop': 5}, lazy=True)
+        assert obj.materialize() is obj
+        assert getattr(obj, _LAZY_BODY) is None
+        assert obj.int_prop == 5
+        assert obj.str_prop is None
+
+        obj = objectfactory.create({'_type': 'MyLazySlotsClass', 'str_prop': 'a'}, lazy=True)
+        assert obj.str_prop == 'a'
+        with pytest.raises(marshmallow.ValidationError) as error:
+            obj.materialize()
+        assert error.value.messages == {'int_prop': ['Missing data for required field.']}
+
+    def test_internal_names(self):
+        """
+        test fields with names similar to internal state of lazily created objects
+
+        expect fields to be stored separately from the raw body, and fields stored
+        under a reserved name to be rejected
+        """
+
+        class MyInternalNameClass(Serializable, slots=True):
+            lazy_body = String()
+            int_prop = Integer()
+
+        register(MyInternalNameClass)
+        obj = objectfactory.create(
+            {'_type': 'MyInternalNameClass', 'lazy_body': 'a', 'int_prop': 1},
+            lazy=True
+        )
+        assert obj.lazy_body == 'a'
+        assert obj.int_prop == 1
+        assert obj.materialize().serialize(include_type=False) == {'lazy_body': 'a', 'int_prop': 1}
+
+        with pytest.raises(ValueError):
+            type('MyReservedClass', (Serializable,), {_LAZY_BODY[1:]: String()})
+
+
+class TestLazyList(object):
+    """
+    test case for lazily loaded list fields
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        for cls in (
+                MyLazyNestedClass,
+                MyLazyClass,
+                MyLazyListClass,
+                MyLazyComplexListClass,
+                MyEagerComplexListClass
+        ):
+            register(cls)
+
+    def test_access(self):
+        """
+        test element access
+
+        expect elements to be created only when accessed, and to be kept when cached
+        """
+        obj = MyLazyListClass()
+        obj.deserialize({
+            'items': [{'str_prop': str(i)} for i in range(1000)],
+            'uncached': [{'str_prop': 'a'}]
+        })
+
+        assert isinstance(obj.items, LazyList)
+        assert len(obj.items) == 1000
+        assert repr(obj.items) == 'LazyList(1000 items, 0 loaded)'
+
+        item = obj.items[-1]
+        assert isinstance(item, MyLazyNestedClass)
+        assert item.str_prop == '999'
+        assert obj.items[999] is item
+        assert [e.str_prop for e in obj.items[2:5]] == ['2', '3', '4']
+        assert repr(obj.items) == 'LazyList(1000 items, 4 loaded)'
+        with pytest.raises(IndexError):
+            obj.items[1000]
+
+        assert obj.uncached[0].str_prop == 'a'
+        assert obj.uncached[0] is not obj.uncached[0]
+
+    def test_invalid(self):
+        """
+        test validation of lazy list
+
+        expect non-list data to be rejected immediately, and invalid elements
+        to be rejected on access
+        """
+        with pytest.raises(marshmallow.ValidationError):
+            MyLazyListClass().deserialize({'items': 'abc'})
+
+        obj = MyLazyListClass()
+        obj.deserialize({'items': [{'str_prop': 1}]})
+        with pytest.raises(marshmallow.ValidationError):
+            obj.items[0]
+
+    def test_modify(self):
+        """
+        test modification of lazy list
+
+        expect lazy list to behave as a standard list
+        """
+        obj = MyLazyListClass()
+        obj.deserialize({'items': [{'str_prop': 'a'}, {'str_prop': 'b'}]})
+
+        obj.items.append(MyLazyNestedClass.from_kwargs(str_prop='c'))
+        obj.items.insert(0, MyLazyNestedClass.from_kwargs(str_prop='z'))
+        del obj.items[1]
+        obj.items[0] = MyLazyNestedClass.from_kwargs(str_prop='y')
+
+        assert [e.str_prop for e in obj.items] == ['y', 'b', 'c']
+        assert obj.items == list(obj.items)
+
+    def test_serialize(self):
+        """
+        test serialization of lazy list
+
+        expect untouched elements to be serialized without being kept, and output
+        identical to marshmallow
+        """
+        obj = MyLazyListClass()
+        obj.deserialize({
+            'items': [
+                {'str_prop': 'a'},
+                {'_type': 'MyLazyNestedClass', 'str_prop': 'b'},
+                {'str_prop': 'c'}
+            ]
+        })
+        obj.items[2].str_prop = 'd'
+
+        for include_type in (True, False):
+            for use_full_type in (True, False):
+                body = obj.serialize(include_type, use_full_type)
+                assert body == obj._marshmallow_serialize(include_type, use_full_type)
+
+        body = obj.serialize()
+        assert body['items'] == [
+            {'_type': 'test.test_lazy.MyLazyNestedClass', 'str_prop': 'a'},
+            {'_type': 'test.test_lazy.MyLazyNestedClass', 'str_prop': 'b'},
+            {'_type': 'test.test_lazy.MyLazyNestedClass', 'str_prop': 'd'}
+        ]
+        assert obj.serialize(include_type=False)['items'][1] == {'str_prop': 'b'}
+        assert repr(obj.items) == 'LazyList(3 items, 1 loaded)'
+
+    def test_serialize_untouched(self):
+        """
+        test serialization of untouched elements with unknown keys, unconverted values,
+        and nested type information
+
+        expect output identical to an eagerly loaded list for all options
+        """
+        items = [
+            {
+                'int_prop': '5',
+                'junk': 'x',
+                'nested': {'_type': 'MyLazyNestedClass', 'str_prop': 'a'},
+                'float_list': ['1.5']
+            },
+            {'_type': 'MyLazyClass', 'int_prop': 6}
+        ]
+        lazy = MyLazyComplexListClass.from_dict({'items': items})
+        eager = MyEagerComplexListClass.from_dict({'items': items})
+
+        for include_type in (True, False):
+            for use_full_type in (True, False):
+                assert lazy.serialize(include_type, use_full_type)['items'] == \
+                    eager.serialize(include_type, use_full_type)['items']
+        assert lazy.serialize(include_type=False)['items'][0] == {
+            'int_prop': 5,
+            'str_prop': 'default',
+            'nested': {'str_prop': 'a'},
+            'float_list': [1.5]
+        }
+        assert repr(lazy.items) == 'LazyList(2 items, 0 loaded)'
+
+    def test_pickle(self):
+        """
+        test pickling and copying of lazy list
+
+        expect untouched elements to stay unloaded and be created from raw data
+        """
+        obj = MyLazyListClass.from_dict({'items': [{'str_prop': 'a'}, {'str_prop': 'b'}]})
+        obj.items[1].str_prop = 'c'
+
+        for other in (pickle.loads(pickle.dumps(obj)), copy.deepcopy(obj)):
+            assert repr(other.items) == 'LazyList(2 items, 1 loaded)'
+            assert [e.str_prop for e in other.items] == ['a', 'c']
+            assert other.serialize() == obj.serialize()
+
+    def test_parallel(self):
+        """
+        test creation of lazy lists in worker processes
+
+        expect lazy lists equivalent to those created in this process
+        """
+        bodies = [
+            {'_type': 'MyLazyListClass', 'items': [{'str_prop': str(i)}]} for i in range(4)
+        ]
+        objs = objectfactory.create_many(bodies, processes=2)
+
+        assert [obj.items[0].str_prop for obj in objs] == ['0', '1', '2', '3']
+        assert [obj.serialize() for obj in objs] == \
+            [obj.serialize() for obj in objectfactory.create_many(bodies)]
+
+    def test_invalid_field_type(self):
+        """
+        test lazy list of primitives
+
+        expect lazy list to require a serializable field type
+        """
+        with pytest.raises(ValueError):
+            class MyClass(Serializable):
+                int_list = List(field_type=Integer, lazy=True)
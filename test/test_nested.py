@@ -3,12 +3,13 @@ module for testing serializable Nested field
 """
 
 # lib
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import marshmallow
 
 # src
 import objectfactory
-from objectfactory import Serializable, Nested, String, register
+from objectfactory import Serializable, Nested, List, String, register
 from objectfactory.nested import NestedFactoryField
 
 
@@ -214,3 +215,83 @@ class TestNested(object):
         assert isinstance(obj, MyTestClass)
         assert isinstance(obj.nested, MyNestedClass)
         assert obj.nested.str_prop == 'some string'
+
+
+class TestNestedThreaded(object):
+    """
+    test case for concurrent serialization of shared nested objects
+    """
+
+    def test_no_instance_state(self):
+        """
+        test serialization does not mutate object
+
+        expect serialization options to not be stored on the instance
+        """
+
+        class MyNestedClass(Serializable):
+            str_prop = String()
+
+        class CustomSchema(marshmallow.Schema):
+            nested = NestedFactoryField()
+
+        class MyTestClass(Serializable, schema=CustomSchema):
+            nested = Nested()
+
+        obj = MyTestClass.from_kwargs(nested=MyNestedClass.from_kwargs(str_prop='x'))
+        before = dict(obj.__dict__)
+        body = obj.serialize(use_full_type=False)
+
+        assert body['nested'] == {'_type': 'MyNestedClass', 'str_prop': 'x'}
+        assert obj.__dict__ == before
+
+    def test_stress(self):
+        """
+        test concurrent serialization with different options
+
+        expect each thread to see only its own serialization options, for both
+        generated and custom marshmallow schemas, while sharing the same objects
+        """
+
+        class MyNestedClass(Serializable):
+            str_prop = String()
+
+        class CustomSchema(marshmallow.Schema):
+            nested = NestedFactoryField()
+            nested_list = marshmallow.fields.List(NestedFactoryField())
+
+        class MyCustomClass(Serializable, schema=CustomSchema):
+            nested = Nested()
+            nested_list = List()
+
+        class MyTestClass(Serializable):
+            nested = Nested()
+            nested_list = List()
+
+        shared = [
+            cls.from_kwargs(
+                nested=MyNestedClass.from_kwargs(str_prop='a'),
+                nested_list=[MyNestedClass.from_kwargs(str_prop=str(i)) for i in range(20)]
+            )
+            for cls in (MyCustomClass, MyTestClass)
+        ]
+        options = [(True, True), (True, False), (False, False)]
+        expected = {
+            (obj_idx, opts): obj.serialize(*opts)
+            for obj_idx, obj in enumerate(shared) for opts in options
+        }
+        iterations = 200
+
+        def work(worker):
+            opts = options[worker % len(options)]
+            count = 0
+            for _ in range(iterations):
+                for obj_idx, obj in enumerate(shared):
+                    assert obj.serialize(*opts) == expected[(obj_idx, opts)]
+                    count += 1
+            return count
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            counts = list(executor.map(work, range(24)))
+
+        assert sum(counts) == 24 * iterations * len(shared)
@@ -0,0 +1,261 @@
+"""
+module for testing field projection on load
+"""
+
+# lib
+import pytest
+import marshmallow
+
+# src
+import objectfactory
+from objectfactory import Serializable, Nested, List, Integer, String, Field, register
+
+
+@register
+class MyProjectedLeafClass(Serializable):
+    """
+    leaf class for testing projection
+    """
+    int_prop = Integer()
+    str_prop = String(required=True)
+
+
+@register
+class MyProjectedNestedClass(Serializable):
+    """
+    nested class for testing projection
+    """
+    int_prop = Integer()
+    leaf = Nested(field_type=MyProjectedLeafClass)
+
+
+@register
+class MyProjectedClass(Serializable):
+    """
+    class for testing projection
+    """
+    int_prop = Integer()
+    str_prop = String(default='default')
+    req_prop = Integer(required=True)
+    nested = Nested(field_type=MyProjectedNestedClass)
+    nested_list = List(field_type=MyProjectedNestedClass)
+
+
+@register
+class MyProjectedOverrideClass(Serializable):
+    """
+    class with user defined deserialization that takes only the body
+    """
+    int_prop = Integer()
+    str_prop = String()
+
+    def deserialize(self, body: dict):
+        self.int_prop = body.get('int_prop')
+        self.str_prop = body.get('str_prop')
+
+
+@register
+class MyProjectedOverrideParentClass(Serializable):
+    """
+    class with nested object of user defined deserialization for testing projection
+    """
+    int_prop = Integer()
+    child = Nested(field_type=MyProjectedOverrideClass)
+    children = List(field_type=MyProjectedOverrideClass)
+
+
+BODY = {
+    '_type': 'MyProjectedClass',
+    'int_prop': 1,
+    'str_prop': 'a',
+    'req_prop': 2,
+    'nested': {
+        '_type': 'MyProjectedNestedClass',
+        'int_prop': 3,
+        'leaf': {'int_prop': 4, 'str_prop': 'b'}
+    },
+    'nested_list': [
+        {'int_prop': 5, 'leaf': {'int_prop': 6, 'str_prop': 'c'}},
+        {'int_prop': 7, 'leaf': {'int_prop': 8, 'str_prop': 'd'}}
+    ]
+}
+
+
+class TestProjection(object):
+    """
+    test case for loading selected fields only
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        for cls in (
+                MyProjectedLeafClass,
+                MyProjectedNestedClass,
+                MyProjectedClass,
+                MyProjectedOverrideClass,
+                MyProjectedOverrideParentClass
+        ):
+            register(cls)
+
+    def test_only(self):
+        """
+        test loading of selected fields
+
+        expect only the selected fields to be loaded, and all other fields
+        to be left unset
+        """
+        obj = objectfactory.create(BODY, only=['int_prop', 'nested'])
+
+        assert obj.int_prop == 1
+        assert obj.str_prop == 'default'
+        assert obj.req_prop is None
+        assert obj.nested.int_prop == 3
+        assert obj.nested.leaf.str_prop == 'b'
+        assert obj.nested_list == []
+
+    def test_exclude(self):
+        """
+        test loading without excluded fields
+
+        expect all fields except the excluded fields to be loaded
+        """
+        obj = objectfactory.create(BODY, exclude=['str_prop', 'nested_list'])
+
+        assert obj.int_prop == 1
+        assert obj.str_prop == 'default'
+        assert obj.req_prop == 2
+        assert obj.nested.leaf.int_prop == 4
+        assert obj.nested_list == []
+
+    def test_nested_paths(self):
+        """
+        test loading of dotted nested paths
+
+        expect projection to be applied at each level of nested and list fields
+        """
+        obj = objectfactory.create(
+            BODY,
+            only=['nested.leaf.int_prop', 'nested_list.int_prop', 'nested_list.leaf'],
+            exclude=['nested_list.leaf.str_prop']
+        )
+
+        assert obj.int_prop is None
+        assert obj.nested.int_prop is None
+        assert obj.nested.leaf.int_prop == 4
+        assert obj.nested.leaf.str_prop is None
+        assert [e.int_prop for e in obj.nested_list] == [5, 7]
+        assert [e.leaf.int_prop for e in obj.nested_list] == [6, 8]
+        assert [e.leaf.str_prop for e in obj.nested_list] == [None, None]
+
+    def test_skipped_not_validated(self):
+        """
+        test validation of skipped fields
+
+        expect invalid or missing data in skipped fields to be ignored, and
+        invalid data in selected fields to be reported as before
+        """
+        body = {
+            'int_prop': 'invalid',
+            'nested': {'leaf': {'str_prop': 5}},
+            'nested_list': 'invalid'
+        }
+        obj = MyProjectedClass()
+        obj.deserialize(body, only=['nested.leaf.int_prop'])
+        assert obj.nested.leaf.int_prop is None
+
+        with pytest.raises(marshmallow.ValidationError) as error:
+            MyProjectedClass().deserialize(body, exclude=['nested', 'nested_list'])
+        assert error.value.messages == {
+            'int_prop': ['Not a valid integer.'],
+            'req_prop': ['Missing data for required field.']
+        }
+
+        with pytest.raises(marshmallow.ValidationError) as error:
+            MyProjectedClass().deserialize(body, only=['nested.leaf'])
+        assert error.value.messages == {'nested': {'leaf': {'str_prop': ['Not a valid string.']}}}
+
+    def test_invalid_paths(self):
+        """
+        test projection with invalid paths
+
+        expect unknown fields and nested paths into primitive fields to be rejected
+        """
+        with pytest.raises(ValueError):
+            objectfactory.create(BODY, only=['unknown'])
+        with pytest.raises(ValueError):
+            objectfactory.create(BODY, exclude=['int_prop.value'])
+        with pytest.raises(ValueError):
+            objectfactory.create(BODY, only=['int_prop'], lazy=True)
+
+    def test_cached(self):
+        """
+        test reuse of projected deserializer
+
+        expect one deserializer to be generated for each distinct projection
+        """
+        MyProjectedClass().deserialize(BODY, only=['int_prop', 'str_prop'])
+        deserializer = MyProjectedClass._get_deserializer(only=('str_prop', 'int_prop'))
+        MyProjectedClass().deserialize(BODY, only=['str_prop', 'int_prop'])
+
+        assert MyProjectedClass._get_deserializer(only=['int_prop', 'str_prop']) is deserializer
+        assert MyProjectedClass._get_deserializer(exclude=['int_prop']) is not deserializer
+
+    def test_create_many(self):
+        """
+        test projection when creating many objects
+
+        expect projection to be applied to every object
+        """
+        objs = objectfactory.create_many([BODY, BODY], only=['str_prop'])
+
+        assert [obj.str_prop for obj in objs] == ['a', 'a']
+        assert [obj.int_prop for obj in objs] == [None, None]
+
+    def test_override(self):
+        """
+        test projection of nested class that overrides deserialize without options
+
+        expect overridden class to be loaded unprojected, and projection of other
+        fields to be applied
+        """
+        child = {'int_prop': 1, 'str_prop': 'a'}
+        body = {
+            '_type': 'MyProjectedOverrideParentClass',
+            'int_prop': 2,
+            'child': dict(child, _type='MyProjectedOverrideClass'),
+            'children': [child]
+        }
+        obj = objectfactory.create(body, only=['child.int_prop', 'children.str_prop'])
+
+        assert obj.int_prop is None
+        assert (obj.child.int_prop, obj.child.str_prop) == (1, 'a')
+        assert [(e.int_prop, e.str_prop) for e in obj.children] == [(1, 'a')]
+
+        obj = objectfactory.create(
+            dict(child, _type='MyProjectedOverrideClass'),
+            exclude=['str_prop']
+        )
+        assert obj.str_prop == 'a'
+
+    def test_custom_schema(self):
+        """
+        test projection for class with custom schema
+
+        expect selected fields to be loaded with custom schema
+        """
+
+        class CustomSchema(marshmallow.Schema):
+            int_prop = marshmallow.fields.Integer()
+            str_prop = marshmallow.fields.String()
+
+        class MyClass(Serializable, schema=CustomSchema):
+            int_prop = Field()
+            str_prop = Field()
+
+        obj = MyClass()
+        obj.deserialize({'int_prop': 1, 'str_prop': 'a'}, exclude=['str_prop'])
+
+        assert obj.int_prop == 1
+        assert obj.str_prop is None
@@ -0,0 +1,127 @@
+"""
+module for testing memory mapped record store
+"""
+
+# lib
+import pytest
+
+# src
+import objectfactory
+from objectfactory import Serializable, RecordStore, write_records, register
+from objectfactory import Integer, Float, Boolean, String, List, Factory
+
+
+@register
+class MyStoredClass(Serializable):
+    """
+    class with fixed width fields for testing record store
+    """
+    int_prop = Integer()
+    float_prop = Float()
+    bool_prop = Boolean(key='bool')
+    str_prop = String()
+
+
+def make(count: int = 3) -> list:
+    """
+    create objects to store
+
+    :param count: number of objects
+    :return: list of objects
+    """
+    return [
+        MyStoredClass.from_kwargs(
+            int_prop=i - 1,
+            float_prop=i * 1.5,
+            bool_prop=i % 2 == 0,
+            str_prop='é' * i
+        )
+        for i in range(count)
+    ]
+
+
+class TestRecords(object):
+    """
+    test case for memory mapped record store
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        register(MyStoredClass)
+
+    def test_round_trip(self, tmp_path):
+        """
+        test writing and reading records
+
+        expect records to be read by index as views equivalent to the written objects
+        """
+        path = tmp_path / 'records.bin'
+        objs = make(5)
+        assert write_records(path, objs, MyStoredClass, string_sizes={'str_prop': 8}) == 5
+
+        with RecordStore(path) as store:
+            assert len(store) == 5
+            assert store.object_type is MyStoredClass
+            assert isinstance(store[2], MyStoredClass)
+            assert store[2].str_prop == 'éé'
+            assert store[-1].int_prop == 3
+            assert [r.bool_prop for r in store[:3]] == [True, False, True]
+            assert objectfactory.serialize_many(store) == objectfactory.serialize_many(objs)
+            with pytest.raises(IndexError):
+                store[5]
+            with pytest.raises(AttributeError):
+                store[0].int_prop = 1
+
+    def test_nulls(self, tmp_path):
+        """
+        test writing null values
+
+        expect null floats to be read back as null and null strings as empty, and an
+        error for other null values
+        """
+        path = tmp_path / 'records.bin'
+        obj = MyStoredClass.from_kwargs(int_prop=1, bool_prop=False)
+        write_records(path, [obj], MyStoredClass, string_sizes={'str_prop': 4})
+
+        with RecordStore(path) as store:
+            assert store[0].float_prop is None
+            assert store[0].serialize()['float_prop'] is None
+            assert store[0].str_prop == ''
+
+        for kwargs in ({'bool_prop': False}, {'int_prop': 1}, {'int_prop': 'a'}):
+            with pytest.raises(ValueError):
+                write_records(path, [MyStoredClass.from_kwargs(**kwargs)], MyStoredClass,
+                              string_sizes={'str_prop': 4})
+
+    def test_layout(self, tmp_path):
+        """
+        test layout of classes and files
+
+        expect an error for fields without fixed width, strings exceeding their
+        size, and files with an unknown type
+        """
+
+        class MyListClass(Serializable):
+            int_list = List(field_type=Integer)
+
+        path = tmp_path / 'records.bin'
+        with pytest.raises(ValueError):
+            write_records(path, [], MyListClass)
+        with pytest.raises(ValueError):
+            write_records(path, make(), MyStoredClass)
+        with pytest.raises(ValueError):
+            write_records(path, make(3), MyStoredClass, string_sizes={'str_prop': 3})
+        with pytest.raises(TypeError):
+            write_records(path, [MyListClass()], MyStoredClass, string_sizes={'str_prop': 3})
+
+        write_records(path, [], MyStoredClass, string_sizes={'str_prop': 3})
+        with RecordStore(path) as store:
+            assert len(store) == 0
+        with pytest.raises(ValueError):
+            RecordStore(path, factory=Factory('empty'))
+
+        path.write_bytes(b'invalid data')
+        with pytest.raises(ValueError):
+            RecordStore(path)
@@ -3,10 +3,15 @@ module for testing functionality of serializable objects
 """
 
 # lib
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import tempfile
+import pytest
 import marshmallow
 
 # src
-from objectfactory import Serializable, Field
+from objectfactory import Serializable, Field, serialize_many, dump_stream
 from .testmodule.testclasses import MyBasicClass, MySubClass
 
 
@@ -232,3 +237,171 @@ class TestSubClass(object):
         assert obj.str_prop == 'parent_class_string'
         assert obj.int_prop == 99
         assert obj.str_prop_sub == 'sub_class_string'
+
+
+class TestSchemaCache(object):
+    """
+    test group for shared marshmallow schema instances
+    """
+
+    def test_shared(self):
+        """
+        test schema instance reuse
+
+        expect the same schema instance to be returned for each option set and
+        to be kept separate for each class
+        """
+
+        class MyClass(Serializable):
+            some_field = Field()
+            another_field = Field()
+
+        schema = MyClass._get_schema()
+        assert isinstance(schema, MyClass._schema)
+        assert MyClass._get_schema() is schema
+        assert MyClass._get_schema(only=('some_field',)) is not schema
+        assert MyClass._get_schema(only=('some_field',)) \
+               is MyClass._get_schema(only=('some_field',))
+        assert MyBasicClass._get_schema() is not schema
+        assert MySubClass._get_schema() is not MyBasicClass._get_schema()
+
+    def test_threaded(self):
+        """
+        test concurrent schema creation
+
+        expect a single schema instance to be created when requested from many threads
+        """
+
+        class MyClass(Serializable):
+            some_field = Field()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            schemas = list(executor.map(lambda _: MyClass._get_schema(), range(64)))
+
+        assert all(s is schemas[0] for s in schemas)
+        assert len(MyClass._schema_cache) == 1
+
+
+class TestSerializeMany(object):
+    """
+    test group for serialization of many objects
+    """
+
+    def test_serialize_many(self):
+        """
+        test serialization of mixed objects
+
+        expect each object to be serialized in input order, same as serializing
+        each object individually
+        """
+        objs = [
+            MyBasicClass.from_kwargs(str_prop='a', int_prop=0),
+            MySubClass.from_kwargs(str_prop_sub='b', int_prop=1),
+            MyBasicClass.from_kwargs(str_prop='c', int_prop=2),
+        ]
+        bodies = serialize_many(objs)
+
+        assert len(bodies) == 3
+        assert bodies == [obj.serialize() for obj in objs]
+        assert bodies[0]['_type'] == 'test.testmodule.testclasses.MyBasicClass'
+        assert bodies[1]['_type'] == 'test.testmodule.testclasses.MySubClass'
+        assert bodies[2]['str_prop'] == 'c'
+
+    def test_serialize_many_options(self):
+        """
+        test serialization of many objects with type options
+
+        expect type information to follow the specified options
+        """
+        objs = [MyBasicClass(), MySubClass()]
+
+        bodies = serialize_many(objs, use_full_type=False)
+        assert [b['_type'] for b in bodies] == ['MyBasicClass', 'MySubClass']
+
+        bodies = serialize_many(objs, include_type=False)
+        assert all('_type' not in b for b in bodies)
+
+    def test_serialize_many_override(self):
+        """
+        test serialization of many objects with overridden serialize method
+
+        expect the overridden method to be used
+        """
+
+        class MyClass(Serializable):
+            some_field = Field()
+
+            def serialize(self, include_type=True, use_full_type=True):
+                body = super().serialize(include_type, use_full_type)
+                body['extra'] = True
+                return body
+
+        bodies = serialize_many([MyClass.from_kwargs(some_field=1)])
+        assert bodies[0]['some_field'] == 1
+        assert bodies[0]['extra'] is True
+
+
+class TestDumpStream(object):
+    """
+    test group for streaming serialization
+    """
+
+    def test_jsonl(self):
+        """
+        test streaming to JSON lines
+
+        expect one serialized object per line, independent of buffer size
+        """
+        objs = [MyBasicClass.from_kwargs(str_prop='s{}'.format(i), int_prop=i) for i in range(5)]
+
+        for buffer_size in (1, 65536):
+            fp = io.StringIO()
+            count = dump_stream(iter(objs), fp, buffer_size=buffer_size)
+
+            assert count == 5
+            lines = fp.getvalue().split('\n')
+            assert lines[-1] == ''
+            assert [json.loads(line) for line in lines[:-1]] == [o.serialize() for o in objs]
+
+    def test_json_array(self):
+        """
+        test streaming to JSON array in binary stream
+
+        expect a single valid JSON array of serialized objects
+        """
+        objs = [MyBasicClass.from_kwargs(int_prop=i) for i in range(3)] + [MySubClass()]
+
+        fp = io.BytesIO()
+        count = dump_stream(objs, fp, format='json-array', use_full_type=False, buffer_size=10)
+
+        assert count == 4
+        assert json.loads(fp.getvalue()) == [o.serialize(use_full_type=False) for o in objs]
+
+        fp = io.StringIO()
+        assert dump_stream([], fp, format='json-array') == 0
+        assert json.loads(fp.getvalue()) == []
+
+    def test_files(self):
+        """
+        test streaming to files opened in binary and text mode
+
+        expect the same JSON lines written to either file
+        """
+        objs = [MyBasicClass.from_kwargs(str_prop='caf\u00e9', int_prop=i) for i in range(3)]
+
+        for mode in ('wb', 'w'):
+            with tempfile.NamedTemporaryFile(mode, encoding=None if 'b' in mode else 'utf-8') as fp:
+                assert dump_stream(objs, fp) == 3
+                fp.flush()
+                with open(fp.name, encoding='utf-8') as written:
+                    lines = written.read().splitlines()
+            assert [json.loads(line) for line in lines] == [o.serialize() for o in objs]
+
+    def test_invalid_format(self):
+        """
+        test streaming with unsupported format
+
+        expect ValueError to be raised
+        """
+        with pytest.raises(ValueError):
+            dump_stream([], io.StringIO(), format='xml')
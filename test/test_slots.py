@@ -0,0 +1,139 @@
+"""
+module for testing slot storage of serializable objects
+"""
+
+# lib
+import sys
+import pickle
+import pytest
+import marshmallow
+
+# src
+from objectfactory import Serializable, Field, Integer, Float, String, List
+from .testmodule.testclasses import MyBasicClass
+
+
+class MyPoint(Serializable, slots=True):
+    """
+    point class with slot storage
+    """
+    x = Float()
+    y = Float()
+    label = String(default='origin')
+    tags = List(field_type=String)
+
+
+class MyPoint3D(MyPoint, slots=True):
+    """
+    sub class with slot storage
+    """
+    y = Float(default=1.0)
+    z = Float()
+
+
+class TestSlots(object):
+    """
+    test group for serializable classes with slot storage
+    """
+
+    def test_definition(self):
+        """
+        test definition of class with slot storage
+
+        expect slots to be defined for each field and no instance dictionary
+        """
+        assert MyPoint.__slots__ == ('_x', '_y', '_label', '_tags')
+        assert MyPoint3D.__slots__ == ('_z',)
+
+        obj = MyPoint3D()
+        assert not hasattr(obj, '__dict__')
+        with pytest.raises(AttributeError):
+            obj.not_a_field = 1
+
+        assert sys.getsizeof(MyPoint()) < sys.getsizeof(MyBasicClass()) \
+               + sys.getsizeof(MyBasicClass().__dict__)
+
+    def test_access(self):
+        """
+        test field access with slot storage
+
+        expect defaults and assigned values to be independent between instances
+        """
+        a = MyPoint.from_kwargs(x=1.0)
+        b = MyPoint()
+
+        assert a.x == 1.0
+        assert b.x is None
+        assert a.label == 'origin'
+        a.tags.append('first')
+        assert a.tags == ['first']
+        assert b.tags == []
+        assert MyPoint3D().y == 1.0
+
+    def test_serialize(self):
+        """
+        test serialization with slot storage
+
+        expect output identical to marshmallow
+        """
+        obj = MyPoint3D.from_kwargs(x=1.0, z=3, tags=['a'])
+        body = obj.serialize()
+
+        assert body == obj._marshmallow_serialize()
+        assert body == {
+            '_type': 'test.test_slots.MyPoint3D',
+            'x': 1.0,
+            'y': 1.0,
+            'z': 3.0,
+            'label': 'origin',
+            'tags': ['a'],
+        }
+
+    def test_deserialize(self):
+        """
+        test deserialization with slot storage
+
+        expect data to be loaded into slots, with validation errors as before
+        """
+        obj = MyPoint3D()
+        obj.deserialize({'x': 1.5, 'y': '2', 'z': 3, 'tags': ['a', 'b']})
+
+        assert obj.x == 1.5
+        assert obj.y == 2.0
+        assert obj.z == 3.0
+        assert obj.tags == ['a', 'b']
+        assert obj.label == 'origin'
+
+        with pytest.raises(marshmallow.ValidationError):
+            obj.deserialize({'x': 'not a float'})
+        assert obj.x == 1.5
+
+    def test_mixed(self):
+        """
+        test slot storage mixed with instance dictionary
+
+        expect fields of a dictionary based parent and slot based child to both work
+        """
+
+        class MyParent(Serializable):
+            a = Integer()
+
+        class MyChild(MyParent, slots=True):
+            b = Integer()
+            c = Field()
+
+        obj = MyChild.from_dict({'a': 1, 'b': 2, 'c': 'x'})
+
+        assert obj.__dict__ == {'_a': 1}
+        assert obj.serialize(include_type=False) == {'a': 1, 'b': 2, 'c': 'x'}
+
+    def test_pickle(self):
+        """
+        test pickling with slot storage
+
+        expect object to be restored with all field data
+        """
+        obj = MyPoint3D.from_kwargs(x=1.0, z=2.0)
+        restored = pickle.loads(pickle.dumps(obj))
+
+        assert restored.serialize() == obj.serialize()
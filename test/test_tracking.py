@@ -0,0 +1,199 @@
+"""
+module for testing change tracking and incremental serialization
+"""
+
+# lib
+import pytest
+
+# src
+from objectfactory import Serializable, Nested, List, Integer, String, register
+
+
+@register
+class MyTrackedLeafClass(Serializable, track_changes=True):
+    """
+    leaf class for testing change tracking
+    """
+    int_prop = Integer()
+    str_prop = String()
+
+
+@register
+class MyTrackedClass(Serializable, track_changes=True):
+    """
+    class for testing change tracking
+    """
+    int_prop = Integer()
+    nested = Nested(field_type=MyTrackedLeafClass)
+    nested_list = List(field_type=MyTrackedLeafClass)
+    int_list = List(field_type=Integer)
+
+
+@register
+class MyTrackedSlotsClass(MyTrackedClass, slots=True):
+    """
+    slots class for testing change tracking
+    """
+    str_prop = String()
+
+
+def make(cls=MyTrackedClass):
+    """
+    create tracked object with nested objects
+
+    :param cls: tracked class
+    :return: new tracked object
+    """
+    return cls.from_kwargs(
+        int_prop=1,
+        nested=MyTrackedLeafClass.from_kwargs(int_prop=2, str_prop='a'),
+        nested_list=[MyTrackedLeafClass.from_kwargs(int_prop=i) for i in range(3)],
+        int_list=[1, 2]
+    )
+
+
+class TestTracking(object):
+    """
+    test case for change tracking
+    """
+
+    def setup_method(self, _):
+        """
+        prepare for each test
+        """
+        for cls in (MyTrackedLeafClass, MyTrackedClass, MyTrackedSlotsClass):
+            register(cls)
+
+    def test_dirty_fields(self):
+        """
+        test recording of changed fields
+
+        expect set and deserialized fields to be dirty until serialized, including
+        fields holding changed nested objects
+        """
+        obj = make()
+        assert obj.dirty_fields() == {'int_prop', 'nested', 'nested_list', 'int_list'}
+
+        obj.serialize()
+        assert obj.dirty_fields() == set()
+
+        obj.nested.str_prop = 'b'
+        obj.nested_list[1].int_prop = 5
+        assert obj.dirty_fields() == {'nested', 'nested_list'}
+        assert obj.nested.dirty_fields() == {'str_prop'}
+
+        obj.serialize()
+        obj.deserialize({'int_prop': 3})
+        assert obj.dirty_fields() == {'int_prop'}
+
+    def test_untracked(self):
+        """
+        test dirty fields of class without change tracking
+
+        expect an error
+        """
+
+        class MyClass(Serializable):
+            int_prop = Integer()
+
+        obj = MyClass()
+        obj.int_prop = 1
+        with pytest.raises(TypeError):
+            obj.dirty_fields()
+        assert not MyClass._tracked
+        assert MyTrackedSlotsClass._tracked
+
+    def test_identical(self):
+        """
+        test incremental serialization
+
+        expect output to be identical to full serialization after each change,
+        including in place changes to lists
+        """
+        for cls in (MyTrackedClass, MyTrackedSlotsClass):
+            obj = make(cls)
+            changes = [
+                lambda: None,
+                lambda: setattr(obj, 'int_prop', 7),
+                lambda: setattr(obj.nested, 'str_prop', 'b'),
+                lambda: setattr(obj.nested_list[2], 'int_prop', 9),
+                lambda: obj.nested_list.append(MyTrackedLeafClass()),
+                lambda: obj.int_list.append(3),
+                lambda: setattr(obj, 'nested', None),
+            ]
+            for change in changes:
+                change()
+                for include_type in (True, False):
+                    for use_full_type in (True, False):
+                        assert obj.serialize(include_type, use_full_type) \
+                               == obj._marshmallow_serialize(include_type, use_full_type)
+
+    def test_reuse(self):
+        """
+        test reuse of unchanged subtrees
+
+        expect output of unchanged nested objects to be reused, and changed
+        nested objects to be encoded again
+        """
+        obj = make()
+        first = obj._dump_cached(True, True)
+        assert obj._dump_cached(True, True)['nested_list'] is first['nested_list']
+        assert obj.nested._dump_cached(True, True) is first['nested']
+
+        obj.nested_list[1].int_prop = 5
+        second = obj._dump_cached(True, True)
+        assert second is not first
+        assert second['nested'] is first['nested']
+        assert second['nested_list'][0] is first['nested_list'][0]
+        assert second['nested_list'][1] is not first['nested_list'][1]
+        assert second['nested_list'][1]['int_prop'] == 5
+
+    def test_copy(self):
+        """
+        test modification of serialized output
+
+        expect changes to the returned body not to affect later output
+        """
+        obj = make()
+        body = obj.serialize()
+        body['int_prop'] = 100
+        del body['nested']
+
+        assert obj.serialize()['int_prop'] == 1
+        assert 'nested' in obj.serialize()
+
+    def test_copy_nested(self):
+        """
+        test modification of nested serialized output
+
+        expect changes to nested bodies and lists of the returned body not to affect
+        later output
+        """
+        obj = make()
+        expected = obj.serialize()
+        body = obj.serialize()
+        body['nested']['int_prop'] = 100
+        body['nested_list'][0]['str_prop'] = 'b'
+        body['nested_list'].append(None)
+        body['int_list'].append(3)
+
+        assert obj.serialize() == expected
+        assert obj.nested.serialize() == expected['nested']
+
+    def test_internal_names(self):
+        """
+        test fields with names similar to internal state of tracked objects
+
+        expect fields to be stored separately from recorded changes and cached output
+        """
+
+        class MyInternalNameClass(Serializable, slots=True, track_changes=True):
+            dirty = Integer()
+            dumped = String()
+
+        obj = MyInternalNameClass.from_kwargs(dirty=1, dumped='a')
+        assert obj.serialize(include_type=False) == {'dirty': 1, 'dumped': 'a'}
+        obj.dirty = 2
+        assert obj.dirty_fields() == {'dirty'}
+        assert obj.serialize(include_type=False) == {'dirty': 2, 'dumped': 'a'}
+        assert obj.dirty_fields() == set()